@@ -3,78 +3,361 @@ AI Classifier Module using OpenAI API
 Classifies climate tech sectors and generates summaries
 """
 import os
+import re
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
 from typing import Dict, List, Optional
 import json
-from openai import OpenAI
+import httpx
+from openai import OpenAI, AsyncOpenAI
 import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from config import OPENAI_API_KEY, NLP_CONFIG, CLIMATE_TECH_CATEGORIES
+from config import OPENAI_API_KEY, NLP_CONFIG, CLIMATE_TECH_CATEGORIES, LLM_CACHE_PATH
+
+# HTTP/2 multiplexing needs the optional h2 package (pip install httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Token-accurate truncation; falls back to a character budget when unavailable
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+# Banner phrases marking short scraped lines as site chrome rather than article text
+_BOILERPLATE_RE = re.compile(
+    r'\b(?:accept|use|uses|using) (?:all )?cookies\b'
+    r'|\bcookie (?:policy|settings|preferences|consent)\b'
+    r'|\b(?:subscribe|sign up)(?: now)?(?: to| for)? (?:our |the )?newsletters?\b'
+    r'|\bsubscribe now\b'
+    r'|\ball rights reserved\b'
+    r'|©',
+    re.IGNORECASE
+)
+_BOILERPLATE_MAX_LINE = 200
+
+# Results returned when an API call fails
+SECTOR_FALLBACK = {
+    "sector": "Other",
+    "confidence": 0.0,
+    "reasoning": "Classification failed"
+}
+
+SUMMARY_FALLBACK = {
+    "summary": "Summary generation failed",
+    "key_points": [],
+    "technology_focus": "Unknown",
+    "impact_area": "Unknown"
+}
+
+VALIDATION_FALLBACK = {
+    "is_funding_event": False,
+    "is_climate_tech": False,
+    "confidence": 0.0,
+    "reasoning": "Validation failed"
+}
+
+# System prompts hold every static instruction so that each request shares a
+# byte-identical prefix that OpenAI's prompt cache can reuse. Only the article
+# text (and company name) goes in the user message. Cache hits also require the
+# model to stay the same, so keep NLP_CONFIG pinned between runs.
+_CATEGORIES_STR = ", ".join(CLIMATE_TECH_CATEGORIES)
+
+SECTOR_SYSTEM_PROMPT = f"""You are an expert in climate technology classification.
+
+Based on the text about a climate tech company or funding event provided by the user, classify it into one of these climate tech sectors: {_CATEGORIES_STR}
+
+Return a JSON object with:
+- "sector": the most appropriate sector from the list
+- "confidence": confidence score between 0 and 1
+- "reasoning": brief explanation (max 50 words)
+
+If the text doesn't clearly fit any category, use "Other" with lower confidence."""
+
+# Structured output schema that restricts "sector" to the known categories
+SECTOR_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "sector_classification",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "sector": {"type": "string", "enum": list(CLIMATE_TECH_CATEGORIES)},
+                "confidence": {"type": "number"},
+                "reasoning": {"type": "string"}
+            },
+            "required": ["sector", "confidence", "reasoning"],
+            "additionalProperties": False
+        }
+    }
+}
+
+SUMMARY_SYSTEM_PROMPT = """You are an expert in climate technology and venture funding.
+
+Generate a concise summary of the climate tech funding event described by the user.
+
+Return a JSON object with:
+- "summary": 2-3 sentence summary of the funding event
+- "key_points": list of 3-5 key points
+- "technology_focus": brief description of the technology/solution
+- "impact_area": environmental impact area (e.g., "carbon reduction", "renewable energy", etc.)"""
+
+STRUCTURED_DATA_SYSTEM_PROMPT = """You are an expert at extracting structured data from news articles.
+
+Extract structured information from the climate tech funding announcement provided by the user.
+
+Return a JSON object with:
+- "company_name": name of the funded company
+- "company_description": brief description of what the company does
+- "funding_amount": amount raised (as string, e.g., "$10M")
+- "funding_stage": funding round stage
+- "lead_investor": name of lead investor if mentioned
+- "other_investors": list of other investors
+- "use_of_funds": what the funding will be used for
+- "location": company location if mentioned
+- "announcement_date": date if mentioned (ISO format)
+
+For any field not found in the text, use null."""
+
+# Kept terse on purpose: validation gates every scraped article, so it runs on
+# the cheaper filter model with a tiny output budget
+VALIDATION_SYSTEM_PROMPT = """You are an expert in identifying climate tech funding news.
+
+Determine if the text provided by the user is about a climate tech funding event.
+
+Return only a JSON object with:
+- "is_funding_event": boolean indicating if this is a funding event
+- "is_climate_tech": boolean indicating if this is related to climate technology
+- "confidence": confidence score between 0 and 1"""
+
+ANALYSIS_SYSTEM_PROMPT = f"""You are an expert in climate technology, venture funding and extracting structured data from news articles.
+
+Analyze the climate tech news article provided by the user in a single pass.
+
+Return a JSON object with exactly these keys:
+- "validation": object with
+    - "is_funding_event": boolean indicating if this is a funding event
+    - "is_climate_tech": boolean indicating if this is related to climate technology
+    - "confidence": confidence score between 0 and 1
+    - "reasoning": brief explanation
+- "sector": object with
+    - "sector": the most appropriate sector from: {_CATEGORIES_STR}
+    - "confidence": confidence score between 0 and 1
+    - "reasoning": brief explanation (max 50 words)
+- "structured_data": object with
+    - "company_name": name of the funded company
+    - "company_description": brief description of what the company does
+    - "funding_amount": amount raised (as string, e.g., "$10M")
+    - "funding_stage": funding round stage
+    - "lead_investor": name of lead investor if mentioned
+    - "other_investors": list of other investors
+    - "use_of_funds": what the funding will be used for
+    - "location": company location if mentioned
+    - "announcement_date": date if mentioned (ISO format)
+- "summary": object with
+    - "summary": 2-3 sentence summary of the funding event
+    - "key_points": list of 3-5 key points
+    - "technology_focus": brief description of the technology/solution
+    - "impact_area": environmental impact area (e.g., "carbon reduction", "renewable energy", etc.)
+
+If the text doesn't clearly fit any sector, use "Other" with lower confidence.
+For any structured_data field not found in the text, use null."""
+
+class ResponseCache:
+    """SQLite-backed cache of parsed LLM responses keyed by a hash of the full request"""
+    
+    # Expired rows are deleted on open and then every this many writes
+    _PURGE_EVERY = 500
+    
+    def __init__(self, db_path: Path = LLM_CACHE_PATH, ttl_seconds: int = 7 * 86400):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+        
+        with self.get_connection() as conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    response TEXT NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+            ''')
+            self._purge_expired(conn)
+    
+    @contextmanager
+    def get_connection(self):
+        """Context manager for cache connections"""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            yield conn
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            raise e
+        finally:
+            conn.close()
+    
+    @staticmethod
+    def make_key(request: Dict[str, any]) -> str:
+        """Hash the request (model, temperature, prompts, ...) into a cache key"""
+        payload = json.dumps(request, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def get(self, key: str) -> Optional[Dict[str, any]]:
+        """Return the cached response for key, or None on a miss"""
+        with self.get_connection() as conn:
+            row = conn.execute(
+                'SELECT response FROM llm_cache WHERE key = ? AND expires_at > ?',
+                (key, time.time())
+            ).fetchone()
+        
+        if row is None:
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        return json.loads(row[0])
+    
+    def set(self, key: str, response: Dict[str, any]) -> None:
+        """Store a response for key"""
+        with self.get_connection() as conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO llm_cache (key, response, expires_at) VALUES (?, ?, ?)',
+                (key, json.dumps(response), time.time() + self.ttl_seconds)
+            )
+            self._writes += 1
+            if self._writes % self._PURGE_EVERY == 0:
+                self._purge_expired(conn)
+    
+    @staticmethod
+    def _purge_expired(conn: sqlite3.Connection) -> None:
+        """Delete rows past their TTL so the cache file stays bounded"""
+        conn.execute('DELETE FROM llm_cache WHERE expires_at <= ?', (time.time(),))
+    
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters for this process"""
+        return {"hits": self.hits, "misses": self.misses}
+
+@dataclass
+class _AsyncSession:
+    """Async client and semaphore for one event loop, with the number of users holding it open"""
+    client: AsyncOpenAI
+    semaphore: asyncio.Semaphore
+    refs: int = 0
 
 class AIClassifier:
     def __init__(self):
         if not OPENAI_API_KEY:
             raise ValueError("OPENAI_API_KEY not found in environment variables")
         
-        self.client = OpenAI(api_key=OPENAI_API_KEY)
-        self.model = NLP_CONFIG.get('model', 'gpt-4o-mini')
+        # One keep-alive connection pool shared by every request from this classifier
+        self._http_client = httpx.Client(**self._http_client_options())
+        self.client = OpenAI(
+            api_key=OPENAI_API_KEY,
+            max_retries=NLP_CONFIG.get('max_retries', 5),
+            http_client=self._http_client
+        )
+        self.model = NLP_CONFIG.get('extract_model', 'gpt-4o-mini')
+        self.filter_model = NLP_CONFIG.get('filter_model', 'gpt-4o-mini')
+        self.filter_max_tokens = NLP_CONFIG.get('filter_max_tokens', 40)
         self.temperature = NLP_CONFIG.get('temperature', 0.3)
         self.max_tokens = NLP_CONFIG.get('max_tokens', 1000)
-    
-    def classify_sector(self, text: str, company_name: Optional[str] = None) -> Dict[str, any]:
-        """Classify the climate tech sector of a company/article"""
-        
-        categories_str = ", ".join(CLIMATE_TECH_CATEGORIES)
-        
-        prompt = f"""
-        Based on the following text about a climate tech company or funding event, 
-        classify it into one of these climate tech sectors: {categories_str}
+        self.max_input_tokens = NLP_CONFIG.get('max_input_tokens', 500)
+        self.filter_max_input_tokens = NLP_CONFIG.get('filter_max_input_tokens', 250)
+        self.max_concurrency = NLP_CONFIG.get('max_concurrency', 20)
+        self.seed = NLP_CONFIG.get('seed', 42)
         
-        Text: {text[:2000]}  # Limit text length
+        # Only near-deterministic requests are worth caching
+        self.cache_max_temperature = NLP_CONFIG.get('cache_max_temperature', 0.3)
+        self.cache = ResponseCache(ttl_seconds=NLP_CONFIG.get('cache_ttl', 7 * 86400))
         
-        {f"Company name: {company_name}" if company_name else ""}
+        self._encoding = None
+        if tiktoken:
+            try:
+                self._encoding = tiktoken.encoding_for_model(self.model)
+            except Exception as e:
+                print(f"Could not load tokenizer, truncating by characters: {e}")
         
-        Return a JSON object with:
-        - "sector": the most appropriate sector from the list
-        - "confidence": confidence score between 0 and 1
-        - "reasoning": brief explanation (max 50 words)
-        
-        If the text doesn't clearly fit any category, use "Other" with lower confidence.
-        """
-        
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert in climate technology classification."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-                response_format={"type": "json_object"}
+        # Async clients are bound to an event loop; the pipeline is shared across threads,
+        # each running its own loop, so sessions are kept per loop behind a lock
+        self._async_sessions: Dict[asyncio.AbstractEventLoop, _AsyncSession] = {}
+        self._async_lock = threading.Lock()
+    
+    @staticmethod
+    def _http_client_options() -> Dict[str, any]:
+        return {
+            "http2": HTTP2_AVAILABLE,
+            "timeout": httpx.Timeout(NLP_CONFIG.get('request_timeout', 30.0), connect=5.0),
+            "limits": httpx.Limits(
+                max_connections=NLP_CONFIG.get('max_connections', 100),
+                max_keepalive_connections=NLP_CONFIG.get('max_keepalive_connections', 50)
             )
-            
-            result = json.loads(response.choices[0].message.content)
-            
-            # Validate sector
-            if result.get('sector') not in CLIMATE_TECH_CATEGORIES:
-                result['sector'] = 'Other'
-                result['confidence'] = 0.5
-            
-            return result
-            
-        except Exception as e:
-            print(f"Error in sector classification: {e}")
-            return {
-                "sector": "Other",
-                "confidence": 0.0,
-                "reasoning": "Classification failed"
-            }
+        }
     
-    def generate_summary(self, text: str, entities: Optional[Dict] = None) -> Dict[str, str]:
-        """Generate a structured summary of the funding event"""
+    def close(self) -> None:
+        """Release the HTTP connection pool"""
+        self.client.close()
+    
+    async def aclose(self) -> None:
+        """Release the async HTTP connection pool of the running event loop"""
+        with self._async_lock:
+            session = self._async_sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None:
+            await session.client.close()
+    
+    @asynccontextmanager
+    async def _async_session(self):
+        """Hold the running loop's async client open; the last holder to leave closes it"""
+        loop = asyncio.get_running_loop()
+        with self._async_lock:
+            session = self._async_sessions.get(loop)
+            if session is None:
+                session = self._async_sessions[loop] = _AsyncSession(
+                    client=AsyncOpenAI(
+                        api_key=OPENAI_API_KEY,
+                        max_retries=NLP_CONFIG.get('max_retries', 5),
+                        http_client=httpx.AsyncClient(**self._http_client_options())
+                    ),
+                    semaphore=asyncio.Semaphore(self.max_concurrency)
+                )
+            session.refs += 1
         
+        try:
+            yield session
+        finally:
+            with self._async_lock:
+                session.refs -= 1
+                idle = session.refs == 0 and self._async_sessions.get(loop) is session
+                if idle:
+                    del self._async_sessions[loop]
+            if idle:
+                await session.client.close()
+    
+    # Request builders (shared by the sync and async code paths)
+    def _sector_request(self, text: str, company_name: Optional[str] = None) -> Dict[str, any]:
+        # Deterministic output constrained to the fixed sector vocabulary
+        return self._request(
+            SECTOR_SYSTEM_PROMPT,
+            self._article_message(self._prep(text), company_name),
+            temperature=0.0,
+            seed=self.seed,
+            response_format=SECTOR_RESPONSE_FORMAT
+        )
+    
+    def _summary_request(self, text: str, entities: Optional[Dict] = None) -> Dict[str, any]:
         entities_context = ""
         if entities:
             if entities.get('companies'):
@@ -87,120 +370,291 @@ class AIClassifier:
                 investor_names = [inv['name'] for inv in entities['investors']]
                 entities_context += f"Investors: {', '.join(investor_names)}\n"
         
-        prompt = f"""
-        Generate a concise summary of this climate tech funding event.
+        return self._request(SUMMARY_SYSTEM_PROMPT, f"{entities_context}Article text: {self._prep(text)}")
+    
+    def _structured_data_request(self, text: str) -> Dict[str, any]:
+        return self._request(
+            STRUCTURED_DATA_SYSTEM_PROMPT,
+            self._article_message(self._prep(text)),
+            temperature=0.1  # Lower temperature for more consistent extraction
+        )
+    
+    def _validation_request(self, text: str) -> Dict[str, any]:
+        return self._request(
+            VALIDATION_SYSTEM_PROMPT,
+            self._article_message(self._prep(text, self.filter_max_input_tokens)),
+            model=self.filter_model,
+            temperature=0.0,
+            max_tokens=self.filter_max_tokens
+        )
+    
+    def _analysis_request(self, text: str, company_name: Optional[str] = None) -> Dict[str, any]:
+        return self._request(
+            ANALYSIS_SYSTEM_PROMPT,
+            self._article_message(self._prep(text), company_name),
+            max_tokens=1500
+        )
+    
+    @staticmethod
+    def _strip_boilerplate(text: str) -> str:
+        """Collapse whitespace and drop short cookie/newsletter/copyright lines"""
+        lines = (' '.join(line.split()) for line in text.splitlines())
+        kept = [
+            line for line in lines
+            if line and not (len(line) <= _BOILERPLATE_MAX_LINE and _BOILERPLATE_RE.search(line))
+        ]
+        return '\n'.join(kept) or ' '.join(text.split())
+    
+    def _prep(self, text: str, max_tokens: Optional[int] = None) -> str:
+        """Strip boilerplate and truncate to a token budget before sending text to the model"""
+        max_tokens = max_tokens or self.max_input_tokens
+        text = self._strip_boilerplate(text)
+        
+        if self._encoding is None:
+            return text[:max_tokens * 4]  # ~4 characters per token for English
         
-        {entities_context}
+        tokens = self._encoding.encode(text, disallowed_special=())
+        if len(tokens) <= max_tokens:
+            return text
+        return self._encoding.decode(tokens[:max_tokens])
+    
+    @staticmethod
+    def _article_message(text: str, company_name: Optional[str] = None) -> str:
+        """Build the dynamic user message; everything static lives in the system prompt"""
+        if company_name:
+            return f"Company name: {company_name}\n\nText: {text}"
+        return f"Text: {text}"
+    
+    def _request(self, system_prompt: str, user_content: str, model: Optional[str] = None,
+                 temperature: Optional[float] = None, max_tokens: Optional[int] = None,
+                 seed: Optional[int] = None, response_format: Optional[Dict] = None) -> Dict[str, any]:
+        """Build chat completion kwargs with the static system prompt as a cacheable prefix"""
+        request = {
+            "model": model or self.model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_content}
+            ],
+            "temperature": self.temperature if temperature is None else temperature,
+            "max_tokens": self.max_tokens if max_tokens is None else max_tokens,
+            "response_format": response_format or {"type": "json_object"}
+        }
+        if seed is not None:
+            request["seed"] = seed
+        return request
+    
+    @classmethod
+    def _split_analysis(cls, result: Dict[str, any]) -> Dict[str, Dict]:
+        """Split a fused analysis response into the shapes the single-step methods return"""
+        return {
+            "validation": result.get('validation') or dict(VALIDATION_FALLBACK),
+            "sector": cls._check_sector(result.get('sector') or dict(SECTOR_FALLBACK)),
+            "structured_data": result.get('structured_data') or {},
+            "summary": result.get('summary') or dict(SUMMARY_FALLBACK, key_points=[])
+        }
+    
+    @staticmethod
+    def _check_sector(result: Dict[str, any]) -> Dict[str, any]:
+        # Validate sector
+        if result.get('sector') not in CLIMATE_TECH_CATEGORIES:
+            result['sector'] = 'Other'
+            result['confidence'] = 0.5
+        else:
+            result['sector'] = sys.intern(result['sector'])
+        return result
+    
+    def _cache_key(self, request: Dict[str, any]) -> Optional[str]:
+        if request['temperature'] > self.cache_max_temperature:
+            return None
+        return self.cache.make_key(request)
+    
+    def _complete(self, request: Dict[str, any]) -> Dict[str, any]:
+        """Run a chat completion request and parse its JSON payload"""
+        key = self._cache_key(request)
+        if key:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
         
-        Article text: {text[:2000]}
+        response = self.client.chat.completions.create(**request)
+        result = json.loads(response.choices[0].message.content)
         
-        Return a JSON object with:
-        - "summary": 2-3 sentence summary of the funding event
-        - "key_points": list of 3-5 key points
-        - "technology_focus": brief description of the technology/solution
-        - "impact_area": environmental impact area (e.g., "carbon reduction", "renewable energy", etc.)
-        """
+        if key:
+            self.cache.set(key, result)
+        return result
+    
+    async def _acomplete(self, request: Dict[str, any]) -> Dict[str, any]:
+        """Async counterpart of _complete, bounded by the concurrency semaphore"""
+        key = self._cache_key(request)
+        if key:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        
+        async with self._async_session() as session, session.semaphore:
+            response = await session.client.chat.completions.create(**request)
+        result = json.loads(response.choices[0].message.content)
         
+        if key:
+            self.cache.set(key, result)
+        return result
+    
+    def classify_sector(self, text: str, company_name: Optional[str] = None) -> Dict[str, any]:
+        """Classify the climate tech sector of a company/article"""
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert in climate technology and venture funding."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-                response_format={"type": "json_object"}
-            )
-            
-            return json.loads(response.choices[0].message.content)
-            
+            return self._check_sector(self._complete(self._sector_request(text, company_name)))
+        except Exception as e:
+            print(f"Error in sector classification: {e}")
+            return dict(SECTOR_FALLBACK)
+    
+    def generate_summary(self, text: str, entities: Optional[Dict] = None) -> Dict[str, str]:
+        """Generate a structured summary of the funding event"""
+        try:
+            return self._complete(self._summary_request(text, entities))
         except Exception as e:
             print(f"Error generating summary: {e}")
-            return {
-                "summary": "Summary generation failed",
-                "key_points": [],
-                "technology_focus": "Unknown",
-                "impact_area": "Unknown"
-            }
+            return dict(SUMMARY_FALLBACK, key_points=[])
     
     def extract_structured_data(self, text: str) -> Dict[str, any]:
         """Extract structured funding data using AI"""
-        
-        prompt = f"""
-        Extract structured information from this climate tech funding announcement.
-        
-        Text: {text[:2000]}
-        
-        Return a JSON object with:
-        - "company_name": name of the funded company
-        - "company_description": brief description of what the company does
-        - "funding_amount": amount raised (as string, e.g., "$10M")
-        - "funding_stage": funding round stage
-        - "lead_investor": name of lead investor if mentioned
-        - "other_investors": list of other investors
-        - "use_of_funds": what the funding will be used for
-        - "location": company location if mentioned
-        - "announcement_date": date if mentioned (ISO format)
-        
-        For any field not found in the text, use null.
-        """
-        
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert at extracting structured data from news articles."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.1,  # Lower temperature for more consistent extraction
-                max_tokens=self.max_tokens,
-                response_format={"type": "json_object"}
-            )
-            
-            return json.loads(response.choices[0].message.content)
-            
+            return self._complete(self._structured_data_request(text))
         except Exception as e:
             print(f"Error extracting structured data: {e}")
             return {}
     
     def validate_funding_event(self, text: str) -> Dict[str, any]:
         """Validate if the text is about a climate tech funding event"""
+        try:
+            return self._complete(self._validation_request(text))
+        except Exception as e:
+            print(f"Error validating funding event: {e}")
+            return dict(VALIDATION_FALLBACK)
+    
+    def analyze_article(self, text: str, company_name: Optional[str] = None) -> Dict[str, Dict]:
+        """Validate, classify, extract and summarize an article with a single API call"""
+        try:
+            return self._split_analysis(self._complete(self._analysis_request(text, company_name)))
+        except Exception as e:
+            print(f"Error analyzing article: {e}")
+            return self._split_analysis({})
+    
+    # Batch API (offline bulk runs at reduced cost, results within 24h)
+    def submit_batch(self, articles: List[Dict]) -> str:
+        """Submit articles ({'id', 'text'} dicts) for fused analysis via the Batch API and return the batch ID"""
+        lines = []
+        for article in articles:
+            lines.append(json.dumps({
+                "custom_id": f"{article['id']}:analyze_article",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._analysis_request(article['text'])
+            }))
         
-        prompt = f"""
-        Determine if this text is about a climate tech funding event.
-        
-        Text: {text[:1000]}
+        batch_file = self.client.files.create(
+            file=("analysis_batch.jsonl", "\n".join(lines).encode('utf-8')),
+            purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        return batch.id
+    
+    def fetch_batch_results(self, batch_id: str) -> Optional[Dict[int, Dict]]:
+        """Return analyses keyed by article ID, or None if the batch hasn't finished yet"""
+        batch = self.client.batches.retrieve(batch_id)
+        if batch.status in ("failed", "expired", "cancelled"):
+            raise RuntimeError(f"Batch {batch_id} ended with status {batch.status}")
+        if batch.status != "completed":
+            return None
         
-        Return a JSON object with:
-        - "is_funding_event": boolean indicating if this is a funding event
-        - "is_climate_tech": boolean indicating if this is related to climate technology
-        - "confidence": confidence score between 0 and 1
-        - "reasoning": brief explanation
-        """
+        results = {}
+        if not batch.output_file_id:
+            return results
         
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert in identifying climate tech funding news."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.2,
-                max_tokens=500,
-                response_format={"type": "json_object"}
-            )
+        output = self.client.files.content(batch.output_file_id).text
+        for line in output.splitlines():
+            if not line.strip():
+                continue
             
-            return json.loads(response.choices[0].message.content)
+            item = json.loads(line)
+            article_id, _ = item['custom_id'].split(':', 1)
+            try:
+                body = item['response']['body']
+                result = json.loads(body['choices'][0]['message']['content'])
+            except (KeyError, IndexError, TypeError, ValueError) as e:
+                print(f"Error reading batch result for article {article_id}: {e}")
+                continue
             
+            results[int(article_id)] = self._split_analysis(result)
+        
+        return results
+    
+    # Async API
+    async def aclassify_sector(self, text: str, company_name: Optional[str] = None) -> Dict[str, any]:
+        """Async version of classify_sector"""
+        try:
+            return self._check_sector(await self._acomplete(self._sector_request(text, company_name)))
+        except Exception as e:
+            print(f"Error in sector classification: {e}")
+            return dict(SECTOR_FALLBACK)
+    
+    async def agenerate_summary(self, text: str, entities: Optional[Dict] = None) -> Dict[str, str]:
+        """Async version of generate_summary"""
+        try:
+            return await self._acomplete(self._summary_request(text, entities))
+        except Exception as e:
+            print(f"Error generating summary: {e}")
+            return dict(SUMMARY_FALLBACK, key_points=[])
+    
+    async def aextract_structured_data(self, text: str) -> Dict[str, any]:
+        """Async version of extract_structured_data"""
+        try:
+            return await self._acomplete(self._structured_data_request(text))
+        except Exception as e:
+            print(f"Error extracting structured data: {e}")
+            return {}
+    
+    async def avalidate_funding_event(self, text: str) -> Dict[str, any]:
+        """Async version of validate_funding_event"""
+        try:
+            return await self._acomplete(self._validation_request(text))
         except Exception as e:
             print(f"Error validating funding event: {e}")
-            return {
-                "is_funding_event": False,
-                "is_climate_tech": False,
-                "confidence": 0.0,
-                "reasoning": "Validation failed"
-            }
+            return dict(VALIDATION_FALLBACK)
+    
+    async def aanalyze_article(self, text: str, company_name: Optional[str] = None) -> Dict[str, Dict]:
+        """Async version of analyze_article"""
+        try:
+            return self._split_analysis(await self._acomplete(self._analysis_request(text, company_name)))
+        except Exception as e:
+            print(f"Error analyzing article: {e}")
+            return self._split_analysis({})
+    
+    async def process_article(self, text: str, company_name: Optional[str] = None,
+                              entities: Optional[Dict] = None) -> Dict[str, Dict]:
+        """Run all four AI steps for one article concurrently"""
+        async with self._async_session():
+            validation, sector, structured_data, summary = await asyncio.gather(
+                self.avalidate_funding_event(text),
+                self.aclassify_sector(text, company_name),
+                self.aextract_structured_data(text),
+                self.agenerate_summary(text, entities)
+            )
+        return {
+            "validation": validation,
+            "sector": sector,
+            "structured_data": structured_data,
+            "summary": summary
+        }
+    
+    async def process_batch(self, texts: List[str]) -> List[Dict[str, Dict]]:
+        """Analyze many articles concurrently, bounded by max_concurrency in-flight requests"""
+        # One client for the whole batch, closed when the batch (and any concurrent one) is done
+        async with self._async_session():
+            return await asyncio.gather(*(self.aanalyze_article(text) for text in texts))
 
 def main():
     """Test the AI classifier"""
@@ -241,6 +695,19 @@ def main():
     print("\n4. Generating summary:")
     summary = classifier.generate_summary(test_text)
     print(json.dumps(summary, indent=2))
+    
+    # Test fused single-call analysis
+    print("\n5. Analyzing article in one call:")
+    analysis = classifier.analyze_article(test_text, "Climeworks")
+    print(json.dumps(analysis, indent=2))
+    
+    # Test concurrent batch processing
+    print("\n6. Processing a batch concurrently:")
+    batch = asyncio.run(classifier.process_batch([test_text, test_text]))
+    print(f"Processed {len(batch)} articles")
+    print(f"Response cache: {classifier.cache.stats()}")
+    
+    classifier.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -3,10 +3,12 @@ Data Cleaning and Standardization Module
 Handles deduplication, normalization, and data quality improvements
 """
 import re
+import sqlite3
 import unicodedata
-from typing import Dict, List, Optional, Tuple, Set
+import pandas as pd
+import xxhash
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Set
 from datetime import datetime
-import hashlib
 import sys
 from pathlib import Path
 
@@ -14,6 +16,38 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from src.db_operations import DatabaseOperations
 
+# Precompiled patterns used on every cleaned record
+_WHITESPACE_RE = re.compile(r'\s+')
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s\.\-\&\(\)]')
+_NON_WORD_RE = re.compile(r'[^\w\s]')
+# Deletes ASCII characters that are neither word characters nor whitespace,
+# matching _NON_WORD_RE for ASCII text at C speed
+_ASCII_PUNCT_TABLE = str.maketrans('', '', ''.join(
+    ch for ch in map(chr, range(128)) if not (ch.isalnum() or ch.isspace() or ch == '_')
+))
+# Same as _SPECIAL_CHARS_RE for ASCII text
+_ASCII_SPECIAL_CHARS_TABLE = str.maketrans('', '', ''.join(
+    ch for ch in map(chr, range(128))
+    if not (ch.isalnum() or ch.isspace() or ch in '_.-&()')
+))
+_SERIES_RE = re.compile(r'series\s*([a-f])')
+# Pattern for numbers like "10.5M", "2.3 million", "500K"
+_AMOUNT_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(million|billion|m|b|mn|bn|k|thousand)?')
+_CURRENCY_SYMBOLS = {'$': 'USD', '€': 'EUR', '£': 'GBP', '¥': 'JPY'}
+_CURRENCY_SYMBOLS_RE = re.compile('[$€£¥]')
+_AMOUNT_MULTIPLIERS = {
+    'million': 1_000_000, 'm': 1_000_000, 'mn': 1_000_000,
+    'billion': 1_000_000_000, 'b': 1_000_000_000, 'bn': 1_000_000_000,
+    'thousand': 1_000, 'k': 1_000,
+    '': 1
+}
+_DATE_PATTERNS = [
+    re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})'),  # YYYY-MM-DD
+    re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})'),  # MM/DD/YYYY
+    re.compile(r'(\d{1,2})-(\d{1,2})-(\d{4})'),  # MM-DD-YYYY
+    re.compile(r'(\d{4})/(\d{1,2})/(\d{1,2})'),  # YYYY/MM/DD
+]
+
 class DataCleaner:
     def __init__(self):
         self.db = DatabaseOperations()
@@ -25,6 +59,14 @@ class DataCleaner:
             'Limited', 'L.P.', 'LP', 'LLP'
         ]
         
+        # Common prefixes to strip; trailing spaces keep matches to whole words
+        self._prefixes = ('startup ', 'company ', 'the ')
+        
+        # Dot-less lowercase suffix -> standardized suffix (first listed form wins)
+        self._suffix_map = {}
+        for suffix in self.company_suffixes:
+            self._suffix_map.setdefault(suffix.lower().replace('.', ''), sys.intern(suffix))
+        
         # Common investor name variations
         self.investor_aliases = {
             'Sequoia Capital': ['Sequoia', 'Sequoia Cap'],
@@ -52,6 +94,25 @@ class DataCleaner:
             'Debt': ['debt', 'debt financing', 'debt round'],
             'Grant': ['grant', 'government grant', 'research grant']
         }
+        
+        # Precomputed lookups so standardization is a dict hit instead of a table scan.
+        # Canonical names are interned so repeated results share one string object
+        # and compare by identity.
+        self._investor_alias_map = {
+            alias.lower(): sys.intern(standard_name)
+            for standard_name, aliases in self.investor_aliases.items()
+            for alias in aliases
+        }
+        self._investor_contains_aliases = [
+            (alias.lower(), sys.intern(standard_name))
+            for standard_name, aliases in self.investor_aliases.items()
+            for alias in aliases
+        ]
+        self._stage_alias_map = {
+            alias: sys.intern(standard_stage)
+            for standard_stage, aliases in self.stage_aliases.items()
+            for alias in aliases
+        }
     
     def normalize_text(self, text: str) -> str:
         """Normalize text by removing extra spaces, special characters"""
@@ -62,10 +123,12 @@ class DataCleaner:
         text = unicodedata.normalize('NFKD', text)
         
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text.strip())
+        text = ' '.join(text.split())
         
         # Remove special characters but keep basic punctuation
-        text = re.sub(r'[^\w\s\.\-\&\(\)]', '', text)
+        text = text.translate(_ASCII_SPECIAL_CHARS_TABLE)
+        if not text.isascii():
+            text = _SPECIAL_CHARS_RE.sub('', text)
         
         return text
     
@@ -77,22 +140,20 @@ class DataCleaner:
         # Normalize text
         cleaned_name = self.normalize_text(name)
         
-        # Remove common prefixes
-        prefixes_to_remove = ['startup', 'company', 'the ']
-        for prefix in prefixes_to_remove:
-            if cleaned_name.lower().startswith(prefix):
+        # Remove a common prefix (whole words only, so "Startupbootcamp" is kept)
+        cleaned_lower = cleaned_name.lower()
+        for prefix in self._prefixes:
+            if cleaned_lower.startswith(prefix):
                 cleaned_name = cleaned_name[len(prefix):].strip()
+                break
         
         # Standardize suffixes
         words = cleaned_name.split()
         if words:
-            last_word = words[-1]
-            # Check if last word is a common suffix
-            for suffix in self.company_suffixes:
-                if last_word.lower() == suffix.lower().replace('.', ''):
-                    # Replace with standardized version
-                    words[-1] = suffix
-                    break
+            # Check if last word is a common suffix and replace with standardized version
+            suffix = self._suffix_map.get(words[-1].lower())
+            if suffix:
+                words[-1] = suffix
         
         cleaned_name = ' '.join(words)
         
@@ -101,7 +162,7 @@ class DataCleaner:
         if not any(c.islower() for c in cleaned_name):  # All caps
             cleaned_name = cleaned_name.title()
         
-        return cleaned_name
+        return sys.intern(cleaned_name)
     
     def standardize_investor_name(self, name: str) -> str:
         """Standardize investor name using known aliases"""
@@ -109,17 +170,19 @@ class DataCleaner:
             return ""
         
         cleaned_name = self.normalize_text(name)
+        cleaned_lower = cleaned_name.lower()
         
         # Check for known aliases
-        for standard_name, aliases in self.investor_aliases.items():
-            if cleaned_name.lower() in [alias.lower() for alias in aliases]:
+        standard_name = self._investor_alias_map.get(cleaned_lower)
+        if standard_name:
+            return standard_name
+        
+        # Also check if the cleaned name contains an alias
+        for alias, standard_name in self._investor_contains_aliases:
+            if alias in cleaned_lower:
                 return standard_name
-            # Also check if the cleaned name contains the alias
-            for alias in aliases:
-                if alias.lower() in cleaned_name.lower():
-                    return standard_name
         
-        return cleaned_name
+        return sys.intern(cleaned_name)
     
     def standardize_funding_stage(self, stage: str) -> Optional[str]:
         """Standardize funding stage"""
@@ -129,18 +192,18 @@ class DataCleaner:
         stage_lower = stage.lower().strip()
         
         # Direct lookup
-        for standard_stage, aliases in self.stage_aliases.items():
-            if stage_lower in aliases:
-                return standard_stage
+        standard_stage = self._stage_alias_map.get(stage_lower)
+        if standard_stage:
+            return standard_stage
         
         # Pattern matching for series rounds
-        series_match = re.match(r'series\s*([a-f])', stage_lower)
+        series_match = _SERIES_RE.match(stage_lower)
         if series_match:
             letter = series_match.group(1).upper()
-            return f'Series {letter}'
+            return sys.intern(f'Series {letter}')
         
         # Return original if no match found
-        return stage.title()
+        return sys.intern(stage.title())
     
     def standardize_amount(self, amount_text: str) -> Tuple[Optional[float], str, str]:
         """Parse and standardize funding amount"""
@@ -152,16 +215,13 @@ class DataCleaner:
         
         # Extract currency
         currency = "USD"  # Default
-        currency_symbols = {'$': 'USD', '€': 'EUR', '£': 'GBP', '¥': 'JPY'}
-        for symbol, curr in currency_symbols.items():
+        for symbol, curr in _CURRENCY_SYMBOLS.items():
             if symbol in cleaned:
                 currency = curr
                 cleaned = cleaned.replace(symbol, '').strip()
         
         # Extract number and multiplier
-        # Pattern for numbers like "10.5M", "2.3 million", "500K"
-        pattern = r'(\d+(?:\.\d+)?)\s*(million|billion|m|b|mn|bn|k|thousand)?'
-        match = re.search(pattern, cleaned)
+        match = _AMOUNT_RE.search(cleaned)
         
         if not match:
             return None, amount_text, currency
@@ -170,30 +230,46 @@ class DataCleaner:
         multiplier = match.group(2) or ""
         
         # Apply multiplier
-        if multiplier in ['million', 'm', 'mn']:
-            amount = number * 1_000_000
-        elif multiplier in ['billion', 'b', 'bn']:
-            amount = number * 1_000_000_000
-        elif multiplier in ['thousand', 'k']:
-            amount = number * 1_000
-        else:
-            amount = number
+        amount = number * _AMOUNT_MULTIPLIERS[multiplier]
         
         return amount, amount_text, currency
     
+    def standardize_amounts_batch(self, amount_texts: pd.Series) -> Tuple[pd.Series, pd.Series, pd.Series]:
+        """Vectorized standardize_amount over a column; returns (amount, amount_text, currency) series"""
+        texts = amount_texts.fillna('').astype(str)
+        cleaned = texts.str.lower().str.strip()
+        
+        # Later symbols win, as in the scalar version
+        currency = pd.Series('USD', index=texts.index, dtype=object)
+        for symbol, curr in _CURRENCY_SYMBOLS.items():
+            currency = currency.mask(cleaned.str.contains(symbol, regex=False), curr)
+        cleaned = cleaned.str.replace(_CURRENCY_SYMBOLS_RE, '', regex=True)
+        
+        # Extract number and multiplier in one regex pass over the column
+        parts = cleaned.str.extract(_AMOUNT_RE)
+        amount = parts[0].astype(float) * parts[1].fillna('').map(_AMOUNT_MULTIPLIERS)
+        amount = amount.astype(object).where(amount.notna(), None)
+        
+        return amount, texts, currency
+    
+    def _normalize_for_hash(self, content: str) -> bytes:
+        """Lowercase, collapse whitespace and strip punctuation ahead of hashing"""
+        normalized = ' '.join(content.lower().split())
+        normalized = normalized.translate(_ASCII_PUNCT_TABLE)
+        if not normalized.isascii():
+            # Table only covers ASCII; catch remaining unicode punctuation
+            normalized = _NON_WORD_RE.sub('', normalized)
+        return normalized.encode('utf-8')
+    
     def generate_content_hash(self, content: str) -> str:
         """Generate hash for duplicate detection"""
-        # Normalize content for hashing
-        normalized = re.sub(r'\s+', ' ', content.lower().strip())
-        normalized = re.sub(r'[^\w\s]', '', normalized)
-        
-        return hashlib.md5(normalized.encode('utf-8')).hexdigest()
+        # Non-cryptographic: only used for duplicate detection, so prefer speed
+        return xxhash.xxh3_128_hexdigest(self._normalize_for_hash(content))
     
-    def detect_duplicates(self, articles: List[Dict]) -> List[Dict]:
-        """Detect and remove duplicate articles"""
-        seen_hashes = set()
-        seen_urls = set()
-        unique_articles = []
+    def iter_unique(self, articles: Iterable[Dict]) -> Iterator[Dict]:
+        """Lazily yield articles that aren't URL or content duplicates of earlier ones"""
+        seen_hashes: Set[int] = set()  # 64-bit digests compare in a single machine word
+        seen_urls: Set[str] = set()
         
         for article in articles:
             # Check URL duplicates
@@ -202,7 +278,7 @@ class DataCleaner:
             
             # Check content duplicates
             content = f"{article.get('title', '')} {article.get('content', '')}"
-            content_hash = self.generate_content_hash(content)
+            content_hash = xxhash.xxh3_64_intdigest(self._normalize_for_hash(content))
             
             if content_hash in seen_hashes:
                 continue
@@ -210,9 +286,11 @@ class DataCleaner:
             # Article is unique
             seen_urls.add(article.get('url'))
             seen_hashes.add(content_hash)
-            unique_articles.append(article)
-        
-        return unique_articles
+            yield article
+    
+    def detect_duplicates(self, articles: List[Dict]) -> List[Dict]:
+        """Detect and remove duplicate articles"""
+        return list(self.iter_unique(articles))
     
     def clean_funding_event_data(self, raw_data: Dict) -> Dict:
         """Clean and standardize funding event data"""
@@ -262,21 +340,28 @@ class DataCleaner:
         
         return cleaned_data
     
+    def clean_funding_events_batch(self, raw_events: List[Dict]) -> List[Dict]:
+        """Clean many funding events, standardizing their dates in one batch"""
+        dates = self.standardize_dates_batch(raw_data.get('date') for raw_data in raw_events)
+        
+        cleaned_events = []
+        for raw_data, date in zip(raw_events, dates):
+            cleaned_data = self.clean_funding_event_data(
+                {key: value for key, value in raw_data.items() if key != 'date'}
+            )
+            if 'date' in raw_data:
+                cleaned_data['date'] = date
+            cleaned_events.append(cleaned_data)
+        
+        return cleaned_events
+    
     def standardize_date(self, date_str: str) -> Optional[str]:
         """Standardize date format to YYYY-MM-DD"""
         if not date_str:
             return None
         
-        # Common date patterns
-        patterns = [
-            r'(\d{4})-(\d{1,2})-(\d{1,2})',  # YYYY-MM-DD
-            r'(\d{1,2})/(\d{1,2})/(\d{4})',  # MM/DD/YYYY
-            r'(\d{1,2})-(\d{1,2})-(\d{4})',  # MM-DD-YYYY
-            r'(\d{4})/(\d{1,2})/(\d{1,2})',  # YYYY/MM/DD
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, date_str)
+        for pattern in _DATE_PATTERNS:
+            match = pattern.search(date_str)
             if match:
                 groups = match.groups()
                 
@@ -298,6 +383,31 @@ class DataCleaner:
         
         return None
     
+    def standardize_dates_batch(self, dates: Iterable[Optional[str]]) -> List[Optional[str]]:
+        """Standardize many dates at once; ISO dates are parsed in a single vectorized pass"""
+        series = pd.Series(list(dates), dtype=object)
+        parsed = pd.to_datetime(series, format='%Y-%m-%d', errors='coerce')
+        
+        standardized = parsed.dt.strftime('%Y-%m-%d').tolist()
+        
+        # Anything that isn't a plain ISO date goes through the scalar parser
+        for i in parsed.index[parsed.isna()]:
+            standardized[i] = self.standardize_date(series[i])
+        
+        return standardized
+    
+    def _ensure_dedup_schema(self, cursor: sqlite3.Cursor) -> None:
+        """Add the canonical_name columns and the indexes the merge statements rely on"""
+        for table in ('companies', 'investors'):
+            cursor.execute(f'PRAGMA table_info({table})')
+            if not any(column['name'] == 'canonical_name' for column in cursor):
+                cursor.execute(f'ALTER TABLE {table} ADD COLUMN canonical_name TEXT')
+            cursor.execute(f'CREATE INDEX IF NOT EXISTS idx_{table}_canonical_name ON {table}(canonical_name)')
+        
+        # Foreign key lookups, so re-pointing and deleting duplicates doesn't scan whole tables
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_fe_company ON funding_events(company_id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_fi_investor ON funding_investors(investor_id)')
+    
     def deduplicate_database_entries(self) -> Dict[str, int]:
         """Remove duplicate entries from database"""
         stats = {
@@ -307,82 +417,77 @@ class DataCleaner:
         }
         
         try:
-            # Deduplicate companies
+            # Everything runs inside one transaction; canonicalization happens in SQLite via UDFs
             with self.db.get_connection() as conn:
+                conn.create_function('canon_company', 1, self.standardize_company_name, deterministic=True)
+                conn.create_function('canon_investor', 1, self.standardize_investor_name, deterministic=True)
                 cursor = conn.cursor()
+                # Take the write lock up front; schema changes and merges commit together
+                cursor.execute('BEGIN IMMEDIATE')
+                self._ensure_dedup_schema(cursor)
                 
-                # Find potential company duplicates
+                # Deduplicate companies: same canonical name, sector and location
+                cursor.execute('UPDATE companies SET canonical_name = canon_company(name)')
                 cursor.execute('''
-                    SELECT id, name, sector, location 
-                    FROM companies 
-                    ORDER BY name
+                    CREATE TEMP TABLE company_merges AS
+                    SELECT c.id AS duplicate_id, g.primary_id
+                    FROM companies c
+                    JOIN (
+                        SELECT MIN(id) AS primary_id, canonical_name,
+                               COALESCE(sector, '') AS sector_key,
+                               COALESCE(location, '') AS location_key
+                        FROM companies
+                        GROUP BY canonical_name, sector_key, location_key
+                    ) g ON c.canonical_name = g.canonical_name
+                       AND COALESCE(c.sector, '') = g.sector_key
+                       AND COALESCE(c.location, '') = g.location_key
+                    WHERE c.id != g.primary_id
                 ''')
                 
-                companies = cursor.fetchall()
-                company_groups = {}
-                
-                for company in companies:
-                    standardized_name = self.standardize_company_name(company['name'])
-                    key = f"{standardized_name}_{company['sector'] or ''}_{company['location'] or ''}"
-                    
-                    if key not in company_groups:
-                        company_groups[key] = []
-                    company_groups[key].append(dict(company))
+                # Update funding events to point to primary company
+                cursor.execute('''
+                    UPDATE funding_events
+                    SET company_id = (
+                        SELECT primary_id FROM company_merges
+                        WHERE duplicate_id = funding_events.company_id
+                    )
+                    WHERE company_id IN (SELECT duplicate_id FROM company_merges)
+                ''')
                 
-                # Merge duplicates
-                for group in company_groups.values():
-                    if len(group) > 1:
-                        # Keep the first one, merge others
-                        primary_company = group[0]
-                        duplicate_ids = [comp['id'] for comp in group[1:]]
-                        
-                        # Update funding events to point to primary company
-                        cursor.execute('''
-                            UPDATE funding_events 
-                            SET company_id = ? 
-                            WHERE company_id IN ({})
-                        '''.format(','.join('?' * len(duplicate_ids))), 
-                        [primary_company['id']] + duplicate_ids)
-                        
-                        # Delete duplicate companies
-                        cursor.execute('''
-                            DELETE FROM companies 
-                            WHERE id IN ({})
-                        '''.format(','.join('?' * len(duplicate_ids))), duplicate_ids)
-                        
-                        stats['companies_merged'] += len(duplicate_ids)
+                # Delete duplicate companies
+                cursor.execute('DELETE FROM companies WHERE id IN (SELECT duplicate_id FROM company_merges)')
+                stats['companies_merged'] = cursor.rowcount
+                cursor.execute('DROP TABLE company_merges')
                 
                 # Similar process for investors
-                cursor.execute('SELECT id, name FROM investors ORDER BY name')
-                investors = cursor.fetchall()
-                investor_groups = {}
+                cursor.execute('UPDATE investors SET canonical_name = canon_investor(name)')
+                cursor.execute('''
+                    CREATE TEMP TABLE investor_merges AS
+                    SELECT i.id AS duplicate_id, g.primary_id
+                    FROM investors i
+                    JOIN (
+                        SELECT MIN(id) AS primary_id, canonical_name
+                        FROM investors
+                        GROUP BY canonical_name
+                    ) g ON i.canonical_name = g.canonical_name
+                    WHERE i.id != g.primary_id
+                ''')
                 
-                for investor in investors:
-                    standardized_name = self.standardize_investor_name(investor['name'])
-                    if standardized_name not in investor_groups:
-                        investor_groups[standardized_name] = []
-                    investor_groups[standardized_name].append(dict(investor))
+                # Update funding_investors table; skip links the primary investor already has
+                cursor.execute('''
+                    UPDATE OR IGNORE funding_investors
+                    SET investor_id = (
+                        SELECT primary_id FROM investor_merges
+                        WHERE duplicate_id = funding_investors.investor_id
+                    )
+                    WHERE investor_id IN (SELECT duplicate_id FROM investor_merges)
+                ''')
+                cursor.execute('DELETE FROM funding_investors WHERE investor_id IN (SELECT duplicate_id FROM investor_merges)')
                 
-                for group in investor_groups.values():
-                    if len(group) > 1:
-                        primary_investor = group[0]
-                        duplicate_ids = [inv['id'] for inv in group[1:]]
-                        
-                        # Update funding_investors table
-                        cursor.execute('''
-                            UPDATE funding_investors 
-                            SET investor_id = ? 
-                            WHERE investor_id IN ({})
-                        '''.format(','.join('?' * len(duplicate_ids))), 
-                        [primary_investor['id']] + duplicate_ids)
-                        
-                        # Delete duplicate investors
-                        cursor.execute('''
-                            DELETE FROM investors 
-                            WHERE id IN ({})
-                        '''.format(','.join('?' * len(duplicate_ids))), duplicate_ids)
-                        
-                        stats['investors_merged'] += len(duplicate_ids)
+                # Delete duplicate investors
+                cursor.execute('DELETE FROM investors WHERE id IN (SELECT duplicate_id FROM investor_merges)')
+                stats['investors_merged'] = cursor.rowcount
+                cursor.execute('DROP TABLE investor_merges')
         
         except Exception as e:
             print(f"Error during deduplication: {e}")
@@ -7,6 +7,7 @@ import json
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Any, Set
 from dataclasses import dataclass
+from functools import cached_property
 import sys
 from pathlib import Path
 
@@ -17,20 +18,54 @@ from src.db_operations import DatabaseOperations
 @dataclass
 class ValidationResult:
     """Result of a validation check"""
+    __slots__ = ('is_valid', 'errors', 'warnings', 'score')  # Many are created per event; skip per-instance __dict__
+    
     is_valid: bool
     errors: List[str]
     warnings: List[str]
     score: float  # 0.0 to 1.0
 
+# Shared result for the common clean, full-score case. Its empty tuples extend() and len()
+# like lists but can't be appended to by accident; treat it as read-only
+_OK_RESULT = ValidationResult(True, (), (), 1.0)
+
+def _result(errors: List[str], warnings: List[str], score: float) -> ValidationResult:
+    """Build a helper's ValidationResult, reusing _OK_RESULT when nothing was flagged"""
+    if not errors and not warnings and score == 1.0:
+        return _OK_RESULT
+    return ValidationResult(len(errors) == 0, errors, warnings, score)
+
+def _parse_date(date_str: str) -> datetime:
+    """Parse a YYYY-MM-DD date, trying the much faster fromisoformat before strptime"""
+    if len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-':
+        try:
+            return datetime.fromisoformat(date_str)
+        except ValueError:
+            pass  # e.g. space-padded fields, which strptime still accepts
+    return datetime.strptime(date_str, '%Y-%m-%d')
+
+def _amount_mismatch(text_amount: float, amount_numeric: float, tolerance: float) -> bool:
+    """Check whether the amount parsed from text deviates from the numeric amount by more than the tolerance"""
+    return abs(text_amount - amount_numeric) / amount_numeric > tolerance
+
 class DataValidator:
     def __init__(self, db: Optional[DatabaseOperations] = None):
-        self.db = db or DatabaseOperations()
+        if db is not None:
+            self.db = db
         
         # Validation rules and patterns
         self.company_name_pattern = re.compile(r'^[A-Za-z0-9\s\-\.\&\(\)]+$')
         self.email_pattern = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
-        self.url_pattern = re.compile(r'https?://(?:[-\w.])+(?:[:\d]+)?(?:/(?:[\w/_.])*(?:\?(?:[\w&=%.])*)?(?:#(?:\w*))?)?')
-        self.amount_pattern = re.compile(r'^\$?\d+(?:,\d{3})*(?:\.\d+)?\s*[KMB]?$', re.IGNORECASE)
+        # Only ever used with match(): everything after the host is optional, so checking
+        # scheme + first host character accepts exactly the same URLs without backtracking
+        self.url_pattern = re.compile(r'https?://[-\w.]')
+        self.amount_pattern = re.compile(r'^\$?(\d+(?:,\d{3})*(?:\.\d+)?)\s*([KMB])?$', re.IGNORECASE | re.ASCII)
+        self._amount_number_re = re.compile(r'(\d+(?:\.\d+)?)\s*([KMB]|MILLION|BILLION|THOUSAND)?', re.IGNORECASE | re.ASCII)
+        self._amount_multipliers = {
+            'K': 1_000, 'THOUSAND': 1_000,
+            'M': 1_000_000, 'MILLION': 1_000_000,
+            'B': 1_000_000_000, 'BILLION': 1_000_000_000
+        }
         
         # Valid values
         self.valid_currencies = {'USD', 'EUR', 'GBP', 'JPY', 'CAD', 'AUD', 'CNY', 'INR', 'SGD'}
@@ -45,16 +80,54 @@ class DataValidator:
             'Smart Grid', 'Water Tech', 'Waste Management', 'Green Building',
             'Climate Analytics', 'Other'
         }
+        self.valid_investor_types = {
+            'VC', 'Venture Capital', 'Private Equity', 'Corporate VC',
+            'Angel', 'Government', 'Grant', 'Family Office',
+            'Accelerator', 'Incubator', 'Strategic', 'Other'
+        }
+        
+        # Trusted sources (subdomains included) for the URL credibility bonus
+        self.trusted_domains = {
+            'techcrunch.com', 'venturebeat.com', 'crunchbase.com', 'reuters.com',
+            'bloomberg.com', 'forbes.com', 'wsj.com', 'ft.com', 'businesswire.com',
+            'prnewswire.com', 'sec.gov', 'globenewswire.com'
+        }
+        self.trusted_tlds = {'edu', 'gov'}
+        self.blog_platform_flags = ('blogspot', 'wordpress', 'medium')
+        
+        # Lowercased (lowered, original) pairs for the partial-match fallbacks, built once
+        self._valid_stages_lower = tuple((stage.lower(), stage) for stage in self.valid_stages)
+        self._valid_sectors_lower = tuple((sector.lower(), sector) for sector in self.valid_sectors)
+        
+        # Canonical (lowercased) forms so scraped values match regardless of case/whitespace
+        self._valid_currencies_norm = frozenset(currency.lower() for currency in self.valid_currencies)
+        self._valid_stages_norm = frozenset(stage.lower() for stage in self.valid_stages)
+        self._valid_sectors_norm = frozenset(sector.lower() for sector in self.valid_sectors)
         
         # Data quality thresholds
         self.min_company_name_length = 2
         self.max_company_name_length = 100
         self.min_amount = 1000  # $1K minimum
         self.max_amount = 10_000_000_000  # $10B maximum
+        self.amount_tolerance = 0.1  # Allowed relative variance between amount text and numeric amount
         self.max_future_days = 30  # Allow up to 30 days in future for announcements
     
+    @cached_property
+    def db(self) -> DatabaseOperations:
+        """Database handle, created on first use so field-only validation never needs one"""
+        return DatabaseOperations()
+    
     def validate_funding_event(self, event_data: Dict) -> ValidationResult:
         """Validate a complete funding event record"""
+        return self._validate_event(event_data)
+    
+    def validate_funding_events_batch(self, events: List[Dict]) -> List[ValidationResult]:
+        """Validate many funding events, checking their dates in one vectorized pass"""
+        date_results = self.validate_dates_batch([event.get('announcement_date') for event in events])
+        return [self._validate_event(event, date_result) for event, date_result in zip(events, date_results)]
+    
+    def _validate_event(self, event_data: Dict, date_result: Optional[ValidationResult] = None) -> ValidationResult:
+        """Validate one event, optionally reusing an already validated date; helpers append straight into shared lists"""
         errors = []
         warnings = []
         score_components = []
@@ -69,50 +142,35 @@ class DataValidator:
                 score_components.append(1.0)
         
         # Company name validation
-        company_result = self.validate_company_name(event_data.get('company_name', ''))
-        errors.extend(company_result.errors)
-        warnings.extend(company_result.warnings)
-        score_components.append(company_result.score)
+        score_components.append(self._check_company_name(event_data.get('company_name', ''), errors, warnings))
         
         # Amount validation
-        amount_result = self.validate_funding_amount(
+        score_components.append(self._check_funding_amount(
             event_data.get('amount_text', ''),
             event_data.get('amount'),
-            event_data.get('currency', 'USD')
-        )
-        errors.extend(amount_result.errors)
-        warnings.extend(amount_result.warnings)
-        score_components.append(amount_result.score)
+            event_data.get('currency', 'USD'),
+            errors, warnings
+        ))
         
         # Stage validation
-        stage_result = self.validate_funding_stage(event_data.get('funding_stage'))
-        errors.extend(stage_result.errors)
-        warnings.extend(stage_result.warnings)
-        score_components.append(stage_result.score)
+        score_components.append(self._check_funding_stage(event_data.get('funding_stage'), errors, warnings))
         
         # Sector validation
-        sector_result = self.validate_sector(event_data.get('company_sector'))
-        errors.extend(sector_result.errors)
-        warnings.extend(sector_result.warnings)
-        score_components.append(sector_result.score)
+        score_components.append(self._check_sector(event_data.get('company_sector'), errors, warnings))
         
         # Date validation
-        date_result = self.validate_date(event_data.get('announcement_date'))
-        errors.extend(date_result.errors)
-        warnings.extend(date_result.warnings)
-        score_components.append(date_result.score)
+        if date_result is None:
+            score_components.append(self._check_date(event_data.get('announcement_date'), None, errors, warnings))
+        else:
+            errors.extend(date_result.errors)
+            warnings.extend(date_result.warnings)
+            score_components.append(date_result.score)
         
         # URL validation
-        url_result = self.validate_url(event_data.get('source_url'))
-        errors.extend(url_result.errors)
-        warnings.extend(url_result.warnings)
-        score_components.append(url_result.score)
+        score_components.append(self._check_url(event_data.get('source_url'), errors, warnings))
         
         # Investors validation
-        investors_result = self.validate_investors(event_data.get('investors', []))
-        errors.extend(investors_result.errors)
-        warnings.extend(investors_result.warnings)
-        score_components.append(investors_result.score)
+        score_components.append(self._check_investors(event_data.get('investors', []), errors, warnings))
         
         # Calculate overall score
         overall_score = sum(score_components) / len(score_components) if score_components else 0.0
@@ -128,11 +186,16 @@ class DataValidator:
         """Validate company name"""
         errors = []
         warnings = []
+        score = self._check_company_name(company_name, errors, warnings)
+        return _result(errors, warnings, score)
+    
+    def _check_company_name(self, company_name: str, errors: List[str], warnings: List[str]) -> float:
+        """Validate company name, appending to errors/warnings; returns the score"""
         score = 1.0
         
         if not company_name:
             errors.append("Company name is required")
-            return ValidationResult(False, errors, warnings, 0.0)
+            return 0.0
         
         # Length validation
         if len(company_name) < self.min_company_name_length:
@@ -158,26 +221,30 @@ class DataValidator:
             warnings.append("Company name is all uppercase - may need formatting")
             score -= 0.1
         
-        return ValidationResult(
-            is_valid=len(errors) == 0,
-            errors=errors,
-            warnings=warnings,
-            score=max(0.0, score)
-        )
+        return max(0.0, score)
     
     def validate_funding_amount(self, amount_text: str, amount_numeric: Optional[float], currency: str) -> ValidationResult:
         """Validate funding amount information"""
         errors = []
         warnings = []
+        score = self._check_funding_amount(amount_text, amount_numeric, currency, errors, warnings)
+        return _result(errors, warnings, score)
+    
+    def _check_funding_amount(self, amount_text: str, amount_numeric: Optional[float], currency: str,
+                              errors: List[str], warnings: List[str]) -> float:
+        """Validate funding amount information, appending to errors/warnings; returns the score"""
         score = 1.0
         
-        # Amount text validation
+        # Amount text validation (a well-formed match also yields the number and multiplier)
+        format_match = None
         if not amount_text:
             warnings.append("Amount text not provided")
             score -= 0.2
-        elif not self.amount_pattern.match(amount_text.replace(' ', '')):
-            warnings.append("Amount text format appears unusual")
-            score -= 0.1
+        else:
+            format_match = self.amount_pattern.match(amount_text.replace(' ', ''))
+            if not format_match:
+                warnings.append("Amount text format appears unusual")
+                score -= 0.1
         
         # Numeric amount validation
         if amount_numeric is not None:
@@ -198,55 +265,50 @@ class DataValidator:
             score -= 0.3
         
         # Currency validation
-        if currency and currency not in self.valid_currencies:
+        if currency and currency.lower().strip() not in self._valid_currencies_norm:
             warnings.append(f"Unusual currency code: {currency}")
             score -= 0.1
         
         # Consistency check between text and numeric
         if amount_text and amount_numeric:
-            # Extract number from text for comparison
-            text_numbers = re.findall(r'\d+(?:\.\d+)?', amount_text.replace(',', ''))
-            if text_numbers:
-                text_number = float(text_numbers[0])
+            # Reuse the format match when there is one; only free-form text needs another scan
+            match = format_match or self._amount_number_re.search(amount_text.replace(',', ''))
+            if match:
+                text_number = float(match.group(1).replace(',', ''))
                 
                 # Apply multiplier if present
-                if 'M' in amount_text.upper() or 'MILLION' in amount_text.upper():
-                    text_number *= 1_000_000
-                elif 'B' in amount_text.upper() or 'BILLION' in amount_text.upper():
-                    text_number *= 1_000_000_000
-                elif 'K' in amount_text.upper() or 'THOUSAND' in amount_text.upper():
-                    text_number *= 1_000
+                if match.group(2):
+                    text_number *= self._amount_multipliers[match.group(2).upper()]
                 
                 # Check consistency (allow 10% variance)
-                if abs(text_number - amount_numeric) / amount_numeric > 0.1:
+                if _amount_mismatch(text_number, amount_numeric, self.amount_tolerance):
                     warnings.append("Amount text and numeric value may be inconsistent")
                     score -= 0.2
         
-        return ValidationResult(
-            is_valid=len(errors) == 0,
-            errors=errors,
-            warnings=warnings,
-            score=max(0.0, score)
-        )
+        return max(0.0, score)
     
     def validate_funding_stage(self, stage: Optional[str]) -> ValidationResult:
         """Validate funding stage"""
         errors = []
         warnings = []
+        score = self._check_funding_stage(stage, errors, warnings)
+        return _result(errors, warnings, score)
+    
+    def _check_funding_stage(self, stage: Optional[str], errors: List[str], warnings: List[str]) -> float:
+        """Validate funding stage, appending to errors/warnings; returns the score"""
         score = 1.0
         
         if not stage:
             warnings.append("Funding stage not provided")
-            return ValidationResult(True, errors, warnings, 0.7)
+            return 0.7
         
-        # Check against valid stages
-        if stage not in self.valid_stages:
+        # Check against valid stages, ignoring case and surrounding whitespace
+        stage_lower = stage.lower().strip()
+        if stage_lower not in self._valid_stages_norm:
             # Check for common variations
-            stage_lower = stage.lower().strip()
-            
             found_match = False
-            for valid_stage in self.valid_stages:
-                if stage_lower in valid_stage.lower() or valid_stage.lower() in stage_lower:
+            for valid_lower, valid_stage in self._valid_stages_lower:
+                if stage_lower in valid_lower or valid_lower in stage_lower:
                     warnings.append(f"Stage '{stage}' might be '{valid_stage}'")
                     found_match = True
                     score -= 0.1
@@ -256,30 +318,30 @@ class DataValidator:
                 warnings.append(f"Unusual funding stage: {stage}")
                 score -= 0.2
         
-        return ValidationResult(
-            is_valid=len(errors) == 0,
-            errors=errors,
-            warnings=warnings,
-            score=max(0.0, score)
-        )
+        return max(0.0, score)
     
     def validate_sector(self, sector: Optional[str]) -> ValidationResult:
         """Validate company sector"""
         errors = []
         warnings = []
+        score = self._check_sector(sector, errors, warnings)
+        return _result(errors, warnings, score)
+    
+    def _check_sector(self, sector: Optional[str], errors: List[str], warnings: List[str]) -> float:
+        """Validate company sector, appending to errors/warnings; returns the score"""
         score = 1.0
         
         if not sector:
             warnings.append("Company sector not provided")
-            return ValidationResult(True, errors, warnings, 0.7)
+            return 0.7
         
-        # Check against valid sectors
-        if sector not in self.valid_sectors:
+        # Check against valid sectors, ignoring case and surrounding whitespace
+        sector_lower = sector.lower().strip()
+        if sector_lower not in self._valid_sectors_norm:
             # Check for partial matches
             found_match = False
-            for valid_sector in self.valid_sectors:
-                if (sector.lower() in valid_sector.lower() or 
-                    valid_sector.lower() in sector.lower()):
+            for valid_lower, valid_sector in self._valid_sectors_lower:
+                if sector_lower in valid_lower or valid_lower in sector_lower:
                     warnings.append(f"Sector '{sector}' might be '{valid_sector}'")
                     found_match = True
                     score -= 0.1
@@ -289,32 +351,34 @@ class DataValidator:
                 warnings.append(f"Sector not in standard climate tech categories: {sector}")
                 score -= 0.2
         
-        return ValidationResult(
-            is_valid=len(errors) == 0,
-            errors=errors,
-            warnings=warnings,
-            score=max(0.0, score)
-        )
+        return max(0.0, score)
     
-    def validate_date(self, date_str: Optional[str]) -> ValidationResult:
-        """Validate announcement date"""
+    def validate_date(self, date_str: Optional[str], now: Optional[datetime] = None) -> ValidationResult:
+        """Validate announcement date; pass `now` to share one reference time across a batch"""
         errors = []
         warnings = []
+        score = self._check_date(date_str, now, errors, warnings)
+        return _result(errors, warnings, score)
+    
+    def _check_date(self, date_str: Optional[str], now: Optional[datetime],
+                    errors: List[str], warnings: List[str]) -> float:
+        """Validate announcement date, appending to errors/warnings; returns the score"""
         score = 1.0
         
         if not date_str:
             warnings.append("Announcement date not provided")
-            return ValidationResult(True, errors, warnings, 0.6)
+            return 0.6
         
         # Try to parse date
         try:
-            date_obj = datetime.strptime(date_str, '%Y-%m-%d')
+            date_obj = _parse_date(date_str)
         except ValueError:
             errors.append(f"Invalid date format: {date_str} (expected YYYY-MM-DD)")
-            return ValidationResult(False, errors, warnings, 0.0)
+            return 0.0
         
         # Check if date is reasonable
-        now = datetime.now()
+        if now is None:
+            now = datetime.now()
         
         # Too far in past (before 2000)
         if date_obj.year < 2000:
@@ -337,78 +401,131 @@ class DataValidator:
             warnings.append("Weekend announcement date (unusual but possible)")
             score -= 0.05
         
-        return ValidationResult(
-            is_valid=len(errors) == 0,
-            errors=errors,
-            warnings=warnings,
-            score=max(0.0, score)
-        )
+        return max(0.0, score)
+    
+    def validate_dates_batch(self, date_strs: List[Optional[str]]) -> List[ValidationResult]:
+        """Validate many announcement dates; plain ISO dates are parsed and range-checked in a single vectorized pass"""
+        import pandas as pd  # Deferred: dominates import time and only batch validation needs it
+        
+        series = pd.Series(date_strs, dtype=object)
+        is_text = series.map(lambda value: isinstance(value, str) and value != '')
+        parsed = pd.to_datetime(series.where(is_text), format='%Y-%m-%d', errors='coerce')
+        
+        now = datetime.now()
+        unparsed = parsed.isna().to_numpy()
+        too_old = (parsed.dt.year < 2000).to_numpy()
+        too_new = (parsed > now + timedelta(days=self.max_future_days)).to_numpy()
+        very_recent = (parsed > now - timedelta(days=1)).to_numpy()
+        weekend = (parsed.dt.weekday >= 5).to_numpy()
+        
+        results = []
+        for i, date_str in enumerate(date_strs):
+            # Missing or non-ISO values go through the scalar validator for its exact messages
+            if unparsed[i]:
+                results.append(self.validate_date(date_str, now))
+                continue
+            
+            errors = []
+            warnings = []
+            score = 1.0
+            
+            if too_old[i]:
+                errors.append(f"Date too far in past: {date_str}")
+                score -= 0.4
+            
+            if too_new[i]:
+                errors.append(f"Date too far in future: {date_str}")
+                score -= 0.4
+            
+            if very_recent[i]:
+                warnings.append("Very recent date - please verify accuracy")
+                score -= 0.1
+            
+            if weekend[i]:
+                warnings.append("Weekend announcement date (unusual but possible)")
+                score -= 0.05
+            
+            results.append(_result(errors, warnings, max(0.0, score)))
+        
+        return results
     
     def validate_url(self, url: Optional[str]) -> ValidationResult:
         """Validate source URL"""
         errors = []
         warnings = []
+        score = self._check_url(url, errors, warnings)
+        return _result(errors, warnings, score)
+    
+    def _check_url(self, url: Optional[str], errors: List[str], warnings: List[str]) -> float:
+        """Validate source URL, appending to errors/warnings; returns the score"""
         score = 1.0
         
         if not url:
             warnings.append("Source URL not provided")
-            return ValidationResult(True, errors, warnings, 0.5)
+            return 0.5
         
         # Basic URL pattern validation
         if not self.url_pattern.match(url):
             errors.append("Invalid URL format")
-            return ValidationResult(False, errors, warnings, 0.0)
-        
-        # Check for trusted domains
-        trusted_domains = {
-            'techcrunch.com', 'venturebeat.com', 'crunchbase.com', 'reuters.com',
-            'bloomberg.com', 'forbes.com', 'wsj.com', 'ft.com', 'businesswire.com',
-            'prnewswire.com', 'sec.gov', 'globenewswire.com'
-        }
+            return 0.0
         
-        domain = url.split('/')[2].lower() if len(url.split('/')) > 2 else ''
+        # Lowercase once; url_pattern guarantees a scheme, so the host is the third '/'-separated part
+        url_lower = url.lower()
+        domain = url_lower.split('/', 3)[2]
         
         # Remove www prefix
-        if domain.startswith('www.'):
-            domain = domain[4:]
+        domain = domain.removeprefix('www.')
         
-        if domain in trusted_domains:
-            score += 0.1  # Bonus for trusted source
-        elif domain.endswith('.edu') or domain.endswith('.gov'):
-            score += 0.1  # Bonus for educational/government sources
+        if self._is_trusted_domain(domain):
+            score += 0.1  # Bonus for trusted, educational or government source
         else:
             # Check for common red flags
-            if any(flag in url.lower() for flag in ['blogspot', 'wordpress', 'medium']):
+            if any(flag in url_lower for flag in self.blog_platform_flags):
                 warnings.append("URL from blog platform - verify credibility")
                 score -= 0.1
         
         # Check URL accessibility (basic)
-        if 'localhost' in url or '127.0.0.1' in url:
+        if 'localhost' in url_lower or '127.0.0.1' in url_lower:
             errors.append("URL points to localhost")
             score -= 0.5
         
-        return ValidationResult(
-            is_valid=len(errors) == 0,
-            errors=errors,
-            warnings=warnings,
-            score=max(0.0, min(1.0, score))
-        )
+        return max(0.0, min(1.0, score))
+    
+    def _is_trusted_domain(self, domain: str) -> bool:
+        """Check the domain and each parent domain against the trusted domains and TLDs"""
+        if domain in self.trusted_domains:
+            return True
+        
+        # Walk label boundaries: api.techcrunch.com -> techcrunch.com -> com
+        parent = domain.partition('.')[2]
+        while parent:
+            if parent in self.trusted_domains or parent in self.trusted_tlds:
+                return True
+            parent = parent.partition('.')[2]
+        
+        return False
     
     def validate_investors(self, investors: List[Any]) -> ValidationResult:
         """Validate investor information"""
         errors = []
         warnings = []
+        score = self._check_investors(investors, errors, warnings)
+        return _result(errors, warnings, score)
+    
+    def _check_investors(self, investors: List[Any], errors: List[str], warnings: List[str]) -> float:
+        """Validate investor information, appending to errors/warnings; returns the score"""
         score = 1.0
         
         if not investors:
             warnings.append("No investor information provided")
-            return ValidationResult(True, errors, warnings, 0.3)
+            return 0.3
         
         if not isinstance(investors, list):
             errors.append("Investors should be a list")
-            return ValidationResult(False, errors, warnings, 0.0)
+            return 0.0
         
-        # Validate each investor
+        # Validate each investor, noting any lead investor on the way
+        has_lead = False
         for i, investor in enumerate(investors):
             if isinstance(investor, str):
                 # Simple string investor name
@@ -424,35 +541,27 @@ class DataValidator:
                     errors.append(f"Investor at position {i} missing name")
                     score -= 0.2
                 
+                if investor.get('is_lead_investor'):
+                    has_lead = True
+                
                 # Check for valid investor types
                 if 'type' in investor:
-                    valid_types = {
-                        'VC', 'Venture Capital', 'Private Equity', 'Corporate VC',
-                        'Angel', 'Government', 'Grant', 'Family Office',
-                        'Accelerator', 'Incubator', 'Strategic', 'Other'
-                    }
-                    if investor['type'] not in valid_types:
+                    if investor['type'] not in self.valid_investor_types:
                         warnings.append(f"Unusual investor type: {investor['type']}")
                         score -= 0.05
             else:
                 errors.append(f"Invalid investor format at position {i}")
                 score -= 0.3
         
-        # Check for lead investor
-        has_lead = False
-        if isinstance(investors[0], dict):
-            has_lead = any(inv.get('is_lead_investor') for inv in investors if isinstance(inv, dict))
+        # Check for lead investor (only structured investor lists can name one)
+        if not isinstance(investors[0], dict):
+            has_lead = False
         
         if not has_lead and len(investors) > 1:
             warnings.append("No lead investor specified")
             score -= 0.1
         
-        return ValidationResult(
-            is_valid=len(errors) == 0,
-            errors=errors,
-            warnings=warnings,
-            score=max(0.0, score)
-        )
+        return max(0.0, score)
     
     def validate_database_consistency(self) -> ValidationResult:
         """Validate overall database consistency"""
@@ -464,40 +573,71 @@ class DataValidator:
         try:
             with self.db.get_connection() as conn:
                 cursor = conn.cursor()
+                cursor.execute('PRAGMA query_only = 1')  # Read-only checks; guard against accidental writes
+                
+                # Gather every count in one statement, scanning each table once
+                future_date = (datetime.now() + timedelta(days=30)).strftime('%Y-%m-%d')
+                cursor.execute('''
+                    WITH
+                    event_stats AS (
+                        SELECT COUNT(*) AS total_events,
+                               COALESCE(SUM(CASE WHEN amount IS NULL OR amount = 0 THEN 1 ELSE 0 END), 0) AS missing_amounts,
+                               COALESCE(SUM(CASE WHEN announcement_date > ? THEN 1 ELSE 0 END), 0) AS future_events
+                        FROM funding_events
+                    ),
+                    company_stats AS (
+                        SELECT COUNT(*) AS total_companies,
+                               COALESCE(SUM(CASE WHEN sector IS NULL OR sector = '' THEN 1 ELSE 0 END), 0) AS missing_sectors
+                        FROM companies
+                    ),
+                    orphaned_events AS (
+                        SELECT COUNT(*) AS orphaned_events FROM funding_events fe 
+                        LEFT JOIN companies c ON fe.company_id = c.id 
+                        WHERE c.id IS NULL
+                    ),
+                    duplicate_companies AS (
+                        SELECT COUNT(*) AS duplicate_companies FROM (
+                            SELECT 1 FROM companies 
+                            GROUP BY LOWER(TRIM(name)) 
+                            HAVING COUNT(*) > 1
+                        )
+                    ),
+                    orphaned_relationships AS (
+                        SELECT COUNT(*) AS orphaned_relationships FROM funding_investors fi
+                        LEFT JOIN funding_events fe ON fi.funding_event_id = fe.id
+                        LEFT JOIN investors i ON fi.investor_id = i.id
+                        WHERE fe.id IS NULL OR i.id IS NULL
+                    )
+                    SELECT * FROM event_stats, company_stats, orphaned_events,
+                                  duplicate_companies, orphaned_relationships
+                ''', (future_date,))
+                stats = cursor.fetchone()
                 
                 # Check 1: Orphaned funding events (no company)
                 total_checks += 1
-                cursor.execute('''
-                    SELECT COUNT(*) FROM funding_events fe 
-                    LEFT JOIN companies c ON fe.company_id = c.id 
-                    WHERE c.id IS NULL
-                ''')
-                orphaned_events = cursor.fetchone()[0]
+                orphaned_events = stats['orphaned_events']
                 if orphaned_events > 0:
                     errors.append(f"Found {orphaned_events} funding events with missing companies")
                 else:
                     checks_passed += 1
                 
+                # Most events orphaned means the database is structurally broken and the
+                # remaining percentages are meaningless, so stop here
+                if orphaned_events > stats['total_events'] * 0.5:
+                    return ValidationResult(False, errors, warnings, 0.0)
+                
                 # Check 2: Duplicate company names
                 total_checks += 1
-                cursor.execute('''
-                    SELECT name, COUNT(*) as count 
-                    FROM companies 
-                    GROUP BY LOWER(TRIM(name)) 
-                    HAVING count > 1
-                ''')
-                duplicate_companies = cursor.fetchall()
+                duplicate_companies = stats['duplicate_companies']
                 if duplicate_companies:
-                    warnings.append(f"Found {len(duplicate_companies)} potential duplicate company names")
+                    warnings.append(f"Found {duplicate_companies} potential duplicate company names")
                 else:
                     checks_passed += 1
                 
                 # Check 3: Missing amounts
                 total_checks += 1
-                cursor.execute('SELECT COUNT(*) FROM funding_events WHERE amount IS NULL OR amount = 0')
-                missing_amounts = cursor.fetchone()[0]
-                cursor.execute('SELECT COUNT(*) FROM funding_events')
-                total_events = cursor.fetchone()[0]
+                missing_amounts = stats['missing_amounts']
+                total_events = stats['total_events']
                 
                 if total_events > 0:
                     missing_percentage = (missing_amounts / total_events) * 100
@@ -508,9 +648,7 @@ class DataValidator:
                 
                 # Check 4: Future dates
                 total_checks += 1
-                future_date = (datetime.now() + timedelta(days=30)).strftime('%Y-%m-%d')
-                cursor.execute('SELECT COUNT(*) FROM funding_events WHERE announcement_date > ?', (future_date,))
-                future_events = cursor.fetchone()[0]
+                future_events = stats['future_events']
                 if future_events > 0:
                     warnings.append(f"Found {future_events} events with future dates")
                 else:
@@ -518,10 +656,8 @@ class DataValidator:
                 
                 # Check 5: Missing sectors
                 total_checks += 1
-                cursor.execute('SELECT COUNT(*) FROM companies WHERE sector IS NULL OR sector = ""')
-                missing_sectors = cursor.fetchone()[0]
-                cursor.execute('SELECT COUNT(*) FROM companies')
-                total_companies = cursor.fetchone()[0]
+                missing_sectors = stats['missing_sectors']
+                total_companies = stats['total_companies']
                 
                 if total_companies > 0:
                     missing_sector_percentage = (missing_sectors / total_companies) * 100
@@ -532,13 +668,7 @@ class DataValidator:
                 
                 # Check 6: Orphaned investor relationships
                 total_checks += 1
-                cursor.execute('''
-                    SELECT COUNT(*) FROM funding_investors fi
-                    LEFT JOIN funding_events fe ON fi.funding_event_id = fe.id
-                    LEFT JOIN investors i ON fi.investor_id = i.id
-                    WHERE fe.id IS NULL OR i.id IS NULL
-                ''')
-                orphaned_relationships = cursor.fetchone()[0]
+                orphaned_relationships = stats['orphaned_relationships']
                 if orphaned_relationships > 0:
                     errors.append(f"Found {orphaned_relationships} orphaned investor relationships")
                 else:
@@ -566,57 +696,48 @@ class DataValidator:
             with self.db.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                # Company data completeness
-                cursor.execute('SELECT COUNT(*) FROM companies')
-                total_companies = cursor.fetchone()[0]
+                # Company data completeness (one scan with conditional aggregation)
+                cursor.execute('''
+                    SELECT COUNT(*) AS total_companies,
+                           SUM(CASE WHEN sector IS NOT NULL AND sector != '' THEN 1 ELSE 0 END) AS with_sector,
+                           SUM(CASE WHEN location IS NOT NULL AND location != '' THEN 1 ELSE 0 END) AS with_location,
+                           SUM(CASE WHEN description IS NOT NULL AND description != '' THEN 1 ELSE 0 END) AS with_description
+                    FROM companies
+                ''')
+                companies = cursor.fetchone()
+                total_companies = companies['total_companies']
                 
                 if total_companies > 0:
-                    cursor.execute('SELECT COUNT(*) FROM companies WHERE sector IS NOT NULL AND sector != ""')
-                    companies_with_sector = cursor.fetchone()[0]
-                    completeness_scores['company_sectors'] = companies_with_sector / total_companies
-                    
-                    cursor.execute('SELECT COUNT(*) FROM companies WHERE location IS NOT NULL AND location != ""')
-                    companies_with_location = cursor.fetchone()[0]
-                    completeness_scores['company_locations'] = companies_with_location / total_companies
-                    
-                    cursor.execute('SELECT COUNT(*) FROM companies WHERE description IS NOT NULL AND description != ""')
-                    companies_with_description = cursor.fetchone()[0]
-                    completeness_scores['company_descriptions'] = companies_with_description / total_companies
+                    completeness_scores['company_sectors'] = companies['with_sector'] / total_companies
+                    completeness_scores['company_locations'] = companies['with_location'] / total_companies
+                    completeness_scores['company_descriptions'] = companies['with_description'] / total_companies
                 
-                # Funding event completeness
-                cursor.execute('SELECT COUNT(*) FROM funding_events')
-                total_events = cursor.fetchone()[0]
-                
-                if total_events > 0:
-                    cursor.execute('SELECT COUNT(*) FROM funding_events WHERE amount IS NOT NULL AND amount > 0')
-                    events_with_amount = cursor.fetchone()[0]
-                    completeness_scores['funding_amounts'] = events_with_amount / total_events
-                    
-                    cursor.execute('SELECT COUNT(*) FROM funding_events WHERE funding_stage IS NOT NULL AND funding_stage != ""')
-                    events_with_stage = cursor.fetchone()[0]
-                    completeness_scores['funding_stages'] = events_with_stage / total_events
-                    
-                    cursor.execute('SELECT COUNT(*) FROM funding_events WHERE announcement_date IS NOT NULL AND announcement_date != ""')
-                    events_with_date = cursor.fetchone()[0]
-                    completeness_scores['announcement_dates'] = events_with_date / total_events
-                    
-                    cursor.execute('SELECT COUNT(*) FROM funding_events WHERE summary IS NOT NULL AND summary != ""')
-                    events_with_summary = cursor.fetchone()[0]
-                    completeness_scores['event_summaries'] = events_with_summary / total_events
-                
-                # Investor data completeness
-                cursor.execute('SELECT COUNT(DISTINCT fi.funding_event_id) FROM funding_investors fi')
-                events_with_investors = cursor.fetchone()[0]
+                # Funding event and investor data completeness
+                cursor.execute('''
+                    SELECT COUNT(*) AS total_events,
+                           SUM(CASE WHEN amount IS NOT NULL AND amount > 0 THEN 1 ELSE 0 END) AS with_amount,
+                           SUM(CASE WHEN funding_stage IS NOT NULL AND funding_stage != '' THEN 1 ELSE 0 END) AS with_stage,
+                           SUM(CASE WHEN announcement_date IS NOT NULL AND announcement_date != '' THEN 1 ELSE 0 END) AS with_date,
+                           SUM(CASE WHEN summary IS NOT NULL AND summary != '' THEN 1 ELSE 0 END) AS with_summary,
+                           (SELECT COUNT(DISTINCT funding_event_id) FROM funding_investors) AS with_investors
+                    FROM funding_events
+                ''')
+                events = cursor.fetchone()
+                total_events = events['total_events']
                 
                 if total_events > 0:
-                    completeness_scores['investor_data'] = events_with_investors / total_events
+                    completeness_scores['funding_amounts'] = events['with_amount'] / total_events
+                    completeness_scores['funding_stages'] = events['with_stage'] / total_events
+                    completeness_scores['announcement_dates'] = events['with_date'] / total_events
+                    completeness_scores['event_summaries'] = events['with_summary'] / total_events
+                    completeness_scores['investor_data'] = events['with_investors'] / total_events
                 
         except Exception as e:
             print(f"Error calculating completeness scores: {e}")
         
         return completeness_scores
 
-def generate_validation_report(db: DatabaseOperations) -> Dict[str, Any]:
+def generate_validation_report(db: DatabaseOperations, sample_size: int = 10) -> Dict[str, Any]:
     """Generate comprehensive validation report"""
     validator = DataValidator(db)
     
@@ -644,23 +765,33 @@ def generate_validation_report(db: DatabaseOperations) -> Dict[str, Any]:
         
         # Sample event validation
         try:
-            recent_events = db.get_recent_funding_events(limit=10)
+            recent_events = db.get_recent_funding_events(limit=sample_size)
+            results = validator.validate_funding_events_batch(recent_events)
             sample_results = []
             
-            for event in recent_events:
-                result = validator.validate_funding_event(event)
+            # Aggregate while building the details instead of re-scanning them afterwards
+            total_score = 0.0
+            events_with_errors = 0
+            events_with_warnings = 0
+            
+            for event, result in zip(recent_events, results):
                 sample_results.append({
                     'company': event.get('company_name', 'Unknown'),
                     'score': result.score,
                     'errors': len(result.errors),
                     'warnings': len(result.warnings)
                 })
+                total_score += result.score
+                if result.errors:
+                    events_with_errors += 1
+                if result.warnings:
+                    events_with_warnings += 1
             
             report['sample_validation'] = {
                 'sample_size': len(sample_results),
-                'average_score': sum(r['score'] for r in sample_results) / len(sample_results) if sample_results else 0.0,
-                'events_with_errors': sum(1 for r in sample_results if r['errors'] > 0),
-                'events_with_warnings': sum(1 for r in sample_results if r['warnings'] > 0),
+                'average_score': total_score / len(sample_results) if sample_results else 0.0,
+                'events_with_errors': events_with_errors,
+                'events_with_warnings': events_with_warnings,
                 'details': sample_results
             }
         except Exception as e:
@@ -2,12 +2,65 @@
 Entity Extraction Module using NLP
 Extracts company names, funding amounts, investors from text
 """
-import re
+from collections import OrderedDict
 from typing import Dict, List, Tuple, Optional
 import sys
+import threading
 from pathlib import Path
+import xxhash
 sys.path.append(str(Path(__file__).parent.parent))
 
+from config import NLP_CONFIG
+
+# The third-party regex engine (installed with tiktoken) is API-compatible with re and
+# runs these patterns several times faster; fall back to the standard library without it
+try:
+    import regex as re
+except ImportError:
+    import re
+
+# Optional NER for batch extraction; the regex heuristics work without it
+try:
+    import spacy
+except ImportError:
+    spacy = None
+
+# Investor phrase patterns, compiled once at import
+_INVESTOR_TAIL = r'([^,\.\n]+?)(?:\s+(?:and|with)|[,\.]|\n|$)'
+_LEAD_RE = re.compile(r'led\s+by\s+' + _INVESTOR_TAIL, re.IGNORECASE)
+_PARTICIPATION_RES = [
+    re.compile(r'(?:with\s+)?participation\s+from\s+' + _INVESTOR_TAIL, re.IGNORECASE),
+    re.compile(r'(?:other\s+)?investors?\s+(?:include|including)\s+' + _INVESTOR_TAIL, re.IGNORECASE),
+    re.compile(r'joined\s+by\s+' + _INVESTOR_TAIL, re.IGNORECASE),
+]
+# Lowercase keyword each investor pattern needs (matched against casefolded text)
+_LEAD_PREFILTER = ('led',)
+_PARTICIPATION_PREFILTERS = [('participation',), ('investor',), ('joined',)]
+
+def _may_match(text: str, literals: Optional[Tuple[str, ...]]) -> bool:
+    """Substring prefilter: False means the pattern cannot match, so its regex scan can be skipped"""
+    return literals is None or any(literal in text for literal in literals)
+
+# Capitalized words the company patterns pick up that are not company names
+_COMPANY_FALSE_POSITIVES = frozenset({'The', 'This', 'That'})
+
+# Amount normalization: unit word -> multiplier, currency word -> ISO code
+_UNIT_MULTIPLIERS = {
+    'million': 1_000_000, 'm': 1_000_000, 'mn': 1_000_000,
+    'billion': 1_000_000_000, 'b': 1_000_000_000, 'bn': 1_000_000_000,
+}
+_CURRENCY_CODES = {
+    'USD': 'USD', 'DOLLAR': 'USD', 'DOLLARS': 'USD',
+    'EUR': 'EUR', 'EURO': 'EUR', 'EUROS': 'EUR',
+    'GBP': 'GBP', 'POUND': 'GBP', 'POUNDS': 'GBP',
+}
+
+# Investor name cleanup: leading "including"/"such as"/"like" and a trailing parenthetical note,
+# removed in one pass; names with neither (the usual case) skip the regex entirely
+_INVESTOR_SPLIT_RE = re.compile(r'\s+and\s+|,\s*')
+_INVESTOR_CLEANUP_RE = re.compile(r'^(?:including|such as|like)\s+|\s*\([^)]*\)\s*$', re.IGNORECASE)
+_INVESTOR_PREFIXES = ('including', 'such as', 'like')
+
 class EntityExtractor:
     def __init__(self):
         # Funding stage patterns
@@ -30,11 +83,21 @@ class EntityExtractor:
         
         # Compile regex patterns
         self._compile_patterns()
+        
+        # LRU cache of extraction results keyed by a 64-bit hash of the article text,
+        # so syndicated/re-posted articles and re-runs skip the regex passes
+        self._cache: "OrderedDict[int, Dict[str, any]]" = OrderedDict()
+        self.cache_size = NLP_CONFIG.get('entity_cache_size', 10_000)
+        # The extractor is shared by every session through the cached pipeline
+        self._cache_lock = threading.Lock()
+        
+        # spaCy pipeline, loaded on first batch extraction (False: unavailable)
+        self._nlp = None
     
     def _compile_patterns(self):
         """Compile regex patterns for efficiency"""
         # Funding amount patterns
-        self.amount_patterns = [
+        amount_patterns = [
             # $10M, $10 million, $10.5 million
             r'\$\s*(\d+(?:\.\d+)?)\s*(million|billion|M|B|mn|bn)',
             # 10 million USD, 10M EUR
@@ -46,9 +109,12 @@ class EntityExtractor:
             # funding of $10m
             r'funding\s+of\s+\$\s*(\d+(?:\.\d+)?)\s*(million|billion|M|B|mn|bn)?',
         ]
+        self.amount_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in amount_patterns]
+        # Literals each amount pattern needs (None: always scan)
+        self._amount_prefilters = [('$',), None, ('$',), ('$',), ('$',)]
         
         # Company name patterns (simplified - will be enhanced with NLP)
-        self.company_patterns = [
+        company_patterns = [
             # "Company Inc.", "Company Ltd.", etc.
             r'([A-Z][A-Za-z]+(?:\s+[A-Z][A-Za-z]+)*)\s+(?:Inc\.|Ltd\.|Corp\.|Corporation|LLC|GmbH|AG)',
             # Quoted company names
@@ -56,9 +122,23 @@ class EntityExtractor:
             # Company raised/announces/secures
             r'([A-Z][A-Za-z]+(?:\s+[A-Z][A-Za-z]+)*)\s+(?:raised|announces|secures|closes)',
         ]
+        # Case-sensitive: capitalization is what marks a name here
+        self.company_patterns = [re.compile(pattern) for pattern in company_patterns]
+        self._company_prefilters = [
+            ('Inc.', 'Ltd.', 'Corp.', 'Corporation', 'LLC', 'GmbH', 'AG'),
+            ('"', "'"),
+            ('raised', 'announces', 'secures', 'closes'),
+        ]
+        
+        # Funding stages: one word-bounded alternation, searched in casefolded text; the first stage
+        # mentioned wins (longest first so 'pre-seed' wins over the 'seed' inside it)
+        self.stage_pattern = re.compile(
+            r'\b(?:' + '|'.join(re.escape(stage) for stage in sorted(self.funding_stages, key=len, reverse=True)) + r')\b'
+        )
+        self._stage_titles = {stage: stage.title() for stage in self.funding_stages}
         
         # Investor patterns
-        self.investor_patterns = [
+        investor_patterns = [
             # led by XYZ Ventures
             r'led\s+by\s+([A-Z][A-Za-z]+(?:\s+[A-Z][A-Za-z]+)*(?:\s+(?:Ventures|Capital|Partners|Fund|VC))?)',
             # with participation from
@@ -68,36 +148,31 @@ class EntityExtractor:
             # backed by
             r'backed\s+by\s+([A-Z][A-Za-z]+(?:\s+[A-Z][A-Za-z]+)*)',
         ]
+        self.investor_patterns = [re.compile(pattern) for pattern in investor_patterns]
     
     def extract_funding_amount(self, text: str) -> Dict[str, any]:
         """Extract funding amount from text"""
-        text_lower = text.lower()
-        
-        for pattern in self.amount_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        for pattern, literals in zip(self.amount_patterns, self._amount_prefilters):
+            if not _may_match(text, literals):
+                continue
+            matches = pattern.finditer(text)
             for match in matches:
                 groups = match.groups()
                 
-                # Extract number
-                amount_str = groups[0].replace(',', '')
+                # Extract number (only the $10,000,000 form carries separators)
+                amount_str = groups[0]
+                if ',' in amount_str:
+                    amount_str = amount_str.replace(',', '')
                 amount = float(amount_str)
                 
-                # Extract unit (million/billion)
-                unit = groups[1] if len(groups) > 1 and groups[1] else ''
-                unit_lower = unit.lower()
-                
-                # Convert to actual amount
-                if unit_lower in ['million', 'm', 'mn']:
-                    amount *= 1_000_000
-                elif unit_lower in ['billion', 'b', 'bn']:
-                    amount *= 1_000_000_000
+                # Convert million/billion units to the actual amount
+                if len(groups) > 1 and groups[1]:
+                    amount *= _UNIT_MULTIPLIERS.get(groups[1].lower(), 1)
                 
                 # Extract currency
                 currency = 'USD'  # Default
                 if len(groups) > 2 and groups[2]:
-                    currency_str = groups[2].upper()
-                    if currency_str in ['USD', 'EUR', 'GBP']:
-                        currency = currency_str
+                    currency = _CURRENCY_CODES.get(groups[2].upper(), currency)
                 
                 return {
                     'amount': amount,
@@ -108,16 +183,14 @@ class EntityExtractor:
         
         return None
     
-    def extract_funding_stage(self, text: str) -> Optional[str]:
-        """Extract funding stage from text"""
-        text_lower = text.lower()
+    def extract_funding_stage(self, text: str, text_lower: Optional[str] = None) -> Optional[str]:
+        """Extract funding stage from text (text_lower: text.casefold(), if already computed)"""
+        if text_lower is None:
+            text_lower = text.casefold()
         
-        for stage in self.funding_stages:
-            if stage in text_lower:
-                # Check for context around the stage mention
-                pattern = rf'\b{stage}\b'
-                if re.search(pattern, text_lower):
-                    return stage.title()
+        match = self.stage_pattern.search(text_lower)
+        if match:
+            return self._stage_titles[match.group(0)]
         
         # Check for special patterns
         if 'seed' in text_lower and 'pre' not in text_lower:
@@ -129,31 +202,27 @@ class EntityExtractor:
         """Extract potential company names from text"""
         companies = []
         
-        for pattern in self.company_patterns:
-            matches = re.finditer(pattern, text)
+        for pattern, literals in zip(self.company_patterns, self._company_prefilters):
+            if not _may_match(text, literals):
+                continue
+            matches = pattern.finditer(text)
             for match in matches:
                 company = match.group(1)
                 # Filter out common false positives
-                if company and len(company) > 2 and company not in ['The', 'This', 'That']:
+                if company and len(company) > 2 and company not in _COMPANY_FALSE_POSITIVES:
                     companies.append(company)
         
         # Remove duplicates while preserving order
-        seen = set()
-        unique_companies = []
-        for company in companies:
-            if company not in seen:
-                seen.add(company)
-                unique_companies.append(company)
-        
-        return unique_companies
+        return list(dict.fromkeys(companies))
     
-    def extract_investors(self, text: str) -> List[Dict[str, str]]:
-        """Extract investor names and their roles"""
+    def extract_investors(self, text: str, text_lower: Optional[str] = None) -> List[Dict[str, str]]:
+        """Extract investor names and their roles (text_lower: text.casefold(), if already computed)"""
         investors = []
+        if text_lower is None:
+            text_lower = text.casefold()
         
         # Extract lead investors
-        lead_pattern = r'led\s+by\s+([^,\.\n]+?)(?:\s+(?:and|with)|[,\.]|\n|$)'
-        lead_matches = re.finditer(lead_pattern, text, re.IGNORECASE)
+        lead_matches = _LEAD_RE.finditer(text) if _may_match(text_lower, _LEAD_PREFILTER) else ()
         
         for match in lead_matches:
             investor_text = match.group(1).strip()
@@ -167,14 +236,10 @@ class EntityExtractor:
                 })
         
         # Extract participating investors
-        participation_patterns = [
-            r'(?:with\s+)?participation\s+from\s+([^,\.\n]+?)(?:\s+(?:and|with)|[,\.]|\n|$)',
-            r'(?:other\s+)?investors?\s+(?:include|including)\s+([^,\.\n]+?)(?:\s+(?:and|with)|[,\.]|\n|$)',
-            r'joined\s+by\s+([^,\.\n]+?)(?:\s+(?:and|with)|[,\.]|\n|$)',
-        ]
-        
-        for pattern in participation_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        for pattern, literals in zip(_PARTICIPATION_RES, _PARTICIPATION_PREFILTERS):
+            if not _may_match(text_lower, literals):
+                continue
+            matches = pattern.finditer(text)
             for match in matches:
                 investor_text = match.group(1).strip()
                 investor_names = self._clean_investor_names(investor_text)
@@ -192,14 +257,14 @@ class EntityExtractor:
     def _clean_investor_names(self, text: str) -> List[str]:
         """Clean and split investor names"""
         # Split by 'and', commas
-        names = re.split(r'\s+and\s+|,\s*', text)
+        names = _INVESTOR_SPLIT_RE.split(text)
         
         cleaned_names = []
         for name in names:
             name = name.strip()
-            # Remove common prefixes/suffixes
-            name = re.sub(r'^(?:including|such as|like)\s+', '', name, flags=re.IGNORECASE)
-            name = re.sub(r'\s*\([^)]*\)\s*$', '', name)  # Remove parenthetical notes
+            # Remove common prefixes and parenthetical notes
+            if '(' in name or name[:9].lower().startswith(_INVESTOR_PREFIXES):
+                name = _INVESTOR_CLEANUP_RE.sub('', name)
             
             # Only keep if it looks like a proper name
             if name and len(name) > 2 and name[0].isupper():
@@ -209,13 +274,65 @@ class EntityExtractor:
     
     def extract_all_entities(self, text: str) -> Dict[str, any]:
         """Extract all entities from text"""
+        key = xxhash.xxh3_64_intdigest(text)
+        with self._cache_lock:
+            entities = self._cache.get(key)
+            if entities is not None:
+                self._cache.move_to_end(key)
+        if entities is None:
+            text_lower = text.casefold()  # Shared by the stage search and investor prefilters
+            entities = {
+                'companies': self.extract_company_names(text),
+                'funding_amount': self.extract_funding_amount(text),
+                'funding_stage': self.extract_funding_stage(text, text_lower),
+                'investors': self.extract_investors(text, text_lower)
+            }
+            with self._cache_lock:
+                self._cache[key] = entities
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        
+        # Callers fill in/replace fields on the result, so hand out copies
         return {
-            'companies': self.extract_company_names(text),
-            'funding_amount': self.extract_funding_amount(text),
-            'funding_stage': self.extract_funding_stage(text),
-            'investors': self.extract_investors(text)
+            'companies': list(entities['companies']),
+            'funding_amount': dict(entities['funding_amount']) if entities['funding_amount'] else None,
+            'funding_stage': entities['funding_stage'],
+            'investors': [dict(investor) for investor in entities['investors']]
         }
 
+    def _get_nlp(self):
+        """Load the spaCy NER pipeline once; None if spaCy or its model is not installed"""
+        if self._nlp is None:
+            self._nlp = False
+            if spacy is not None:
+                try:
+                    self._nlp = spacy.load(
+                        NLP_CONFIG.get('spacy_model', 'en_core_web_sm'),
+                        disable=['parser', 'lemmatizer', 'tagger']
+                    )
+                except OSError as e:
+                    print(f"spaCy model not available, using regex extraction only: {e}")
+        return self._nlp or None
+    
+    def extract_all_entities_batch(self, texts: List[str]) -> List[Dict[str, any]]:
+        """Extract all entities from many texts, adding spaCy ORG entities to the companies when available"""
+        results = [self.extract_all_entities(text) for text in texts]
+        
+        nlp = self._get_nlp()
+        if nlp is None:
+            return results
+        
+        docs = nlp.pipe(texts, batch_size=NLP_CONFIG.get('spacy_batch_size', 64))
+        for entities, doc in zip(results, docs):
+            # Regex matches stay first; NER fills in names the patterns missed
+            orgs = [
+                ent.text for ent in doc.ents
+                if ent.label_ == 'ORG' and len(ent.text) > 2 and ent.text not in _COMPANY_FALSE_POSITIVES
+            ]
+            entities['companies'] = list(dict.fromkeys(entities['companies'] + orgs))
+        
+        return results
+
 def main():
     """Test the entity extractor"""
     extractor = EntityExtractor()
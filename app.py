@@ -3,21 +3,27 @@ Climate Tech Funding Tracker - Streamlit Web Application
 Main entry point for the web interface
 """
 import streamlit as st
+import functools
+import html
+import re
 import sys
 from pathlib import Path
 import pandas as pd
-from datetime import datetime, timedelta
 
-# Add project root to path
-sys.path.append(str(Path(__file__).parent))
+# Add project root to path (the script is re-executed on every rerun)
+_PROJECT_ROOT = str(Path(__file__).parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.append(_PROJECT_ROOT)
 
 from config import STREAMLIT_CONFIG, OPENAI_API_KEY
 from src.db_operations import DatabaseOperations
-from src.pipeline import FundingDataPipeline
 from ui.export import render_export_page
-from ui.source_manager import render_source_manager_page, get_enabled_sources
-from ui.styles import inject_apple_css, APPLE_COLORS, METRIC_ICONS, format_large_number
-from ui.components import MetricCard, ChartContainer, LayoutHelpers, generate_sample_trend_data, AppleCharts
+from ui.source_manager import render_source_manager_page, get_enabled_sources, SOURCES_CONFIG_FILE
+from ui.styles import inject_apple_css, METRIC_ICONS, format_large_number
+from ui.components import ChartContainer, LayoutHelpers, generate_sample_trend_data, AppleCharts
+
+# HTML tags left in scraped summaries
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
 
 # Page configuration
 st.set_page_config(
@@ -30,369 +36,424 @@ st.set_page_config(
 # Apply Apple-style CSS
 inject_apple_css()
 
-# Add global interactive enhancements
-st.markdown("""
-<style>
-/* Environmental green button styling */
-.stButton > button {
-    background: linear-gradient(135deg, #10B981, #059669) !important;
-    color: white !important;
-    border: none !important;
-    border-radius: 12px !important;
-    padding: 0.5rem 1.5rem !important;
-    font-weight: 600 !important;
-    transition: all 0.3s cubic-bezier(0.25, 0.46, 0.45, 0.94) !important;
-    box-shadow: 0 4px 12px rgba(16, 185, 129, 0.3) !important;
-}
-
-.stButton > button:hover {
-    transform: translateY(-2px) scale(1.02) !important;
-    box-shadow: 0 8px 25px rgba(16, 185, 129, 0.4) !important;
-    background: linear-gradient(135deg, #059669, #10B981) !important;
-}
-
-.stButton > button:active {
-    transform: translateY(0) scale(0.98) !important;
-    transition: all 0.1s ease !important;
-}
-
-/* Link button styling - Environmental theme */
-.stLinkButton > a {
-    background: #10B981 !important;
-    color: white !important;
-    border: none !important;
-    border-radius: 8px !important;
-    padding: 0.4rem 1rem !important;
-    font-weight: 500 !important;
-    text-decoration: none !important;
-    display: inline-flex !important;
-    align-items: center !important;
-    justify-content: center !important;
-    transition: all 0.2s ease !important;
-    font-size: 0.875rem !important;
-    min-width: 90px !important;
-    max-width: 120px !important;
-    text-align: center !important;
-    margin: 0 auto !important;
-}
-
-.stLinkButton > a:hover {
-    background: #059669 !important;
-    transform: translateY(-1px) !important;
-}
-
-/* Center the link button container */
-.stLinkButton {
-    text-align: center !important;
-    display: flex !important;
-    justify-content: center !important;
-}
-
-/* Enhanced input styling - Environmental theme */
-.stSelectbox > div > div, .stTextInput > div > div {
-    border-radius: 12px !important;
-    border: 2px solid rgba(16, 185, 129, 0.2) !important;
-    transition: all 0.3s ease !important;
-}
 
-.stSelectbox > div > div:focus-within, .stTextInput > div > div:focus-within {
-    border-color: #10B981 !important;
-    box-shadow: 0 0 0 3px rgba(16, 185, 129, 0.1) !important;
-}
+# Shared page header; the themes mirror the section accent colors
+_PAGE_HEADER_TMPL = """
+<div style="
+    background: linear-gradient(135deg, {start} 0%, {end} 100%);
+    border-radius: 16px;
+    padding: 1.5rem;
+    margin-bottom: 2rem;
+    border: 1px solid {border};
+">
+    <h2 style="
+        color: {title_color};
+        font-size: 1.75rem;
+        font-weight: 700;
+        margin: 0 0 0.5rem 0;
+    ">{title}</h2>
+    <p style="
+        color: {subtitle_color};
+        font-size: 1rem;
+        margin: 0;
+    ">{subtitle}</p>
+</div>
+"""
 
-/* Environmental themed page background */
-.stApp {
-    background: linear-gradient(180deg, #F0FDF4 0%, #ECFDF5 100%) !important;
+_HEADER_THEMES = {
+    'green': {'start': 'rgba(16, 185, 129, 0.08)', 'end': 'rgba(5, 150, 105, 0.08)',
+              'border': 'rgba(16, 185, 129, 0.2)', 'title_color': '#059669', 'subtitle_color': '#6B7280'},
+    'system': {'start': 'rgba(52, 199, 89, 0.1)', 'end': 'rgba(48, 209, 88, 0.1)',
+               'border': 'rgba(52, 199, 89, 0.2)', 'title_color': '#34C759', 'subtitle_color': '#8E8E93'},
+    'orange': {'start': 'rgba(255, 159, 10, 0.1)', 'end': 'rgba(255, 149, 0, 0.1)',
+               'border': 'rgba(255, 159, 10, 0.2)', 'title_color': '#FF9F0A', 'subtitle_color': '#8E8E93'},
 }
 
-.main {
-    background: transparent !important;
-}
+@functools.lru_cache(maxsize=None)
+def _page_header_html(title: str, subtitle: str, theme: str) -> str:
+    """Build the HTML for a page header"""
+    return _PAGE_HEADER_TMPL.format(title=title, subtitle=subtitle, **_HEADER_THEMES[theme])
 
-/* Page loading animation */
-@keyframes fadeInUp {
-    from { opacity: 0; transform: translateY(20px); }
-    to { opacity: 1; transform: translateY(0); }
-}
+def render_page_header(title: str, subtitle: str, theme: str = 'green'):
+    """Render a themed page header"""
+    st.markdown(_page_header_html(title, subtitle, theme), unsafe_allow_html=True)
 
-.main .block-container { animation: fadeInUp 0.6s ease-out; }
-html { scroll-behavior: smooth; }
-</style>
-""", unsafe_allow_html=True)
+# Amount strings like "$10M", "2.5 billion" or "$1,200,000"; units scale to dollars
+_AMOUNT_RE = re.compile(r'^\$?\s*([\d.,]+)\s*(billion|million|b|m)?$', re.IGNORECASE)
+_AMOUNT_SCALE = {None: 1, 'm': 1e6, 'b': 1e9, 'million': 1e6, 'billion': 1e9}
 
 # Helper function for consistent amount formatting
+@functools.lru_cache(maxsize=1024)
 def format_amount(amount_text):
     """Format funding amounts consistently"""
     if not amount_text or amount_text == 'Undisclosed':
         return amount_text
     
-    # Clean the text
-    text = str(amount_text).replace('$', '').replace(',', '').strip()
+    match = _AMOUNT_RE.match(str(amount_text).strip())
+    if not match:
+        return amount_text
     
-    # Parse different formats
-    if 'billion' in text.lower():
-        try:
-            num = float(text.lower().replace('billion', '').strip())
-            return f"${num:.1f}B"
-        except:
-            pass
-    elif 'million' in text.lower():
-        try:
-            num = float(text.lower().replace('million', '').strip())
-            if num >= 1000:
-                return f"${num/1000:.1f}B"
-            else:
-                return f"${int(num)}M" if num == int(num) else f"${num:.1f}M"
-        except:
-            pass
-    elif text.upper().endswith('M'):
-        try:
-            num = float(text[:-1].strip())
-            return f"${int(num)}M" if num == int(num) else f"${num:.1f}M"
-        except:
-            pass
-    elif text.upper().endswith('B'):
-        try:
-            num = float(text[:-1].strip())
-            return f"${num:.1f}B"
-        except:
-            pass
-    else:
-        try:
-            num = float(text)
-            if num >= 1000000000:
-                return f"${num/1000000000:.1f}B"
-            elif num >= 1000000:
-                return f"${int(num/1000000)}M" if (num/1000000) == int(num/1000000) else f"${num/1000000:.1f}M"
-            else:
-                return amount_text
-        except:
-            pass
+    unit = match.group(2)
+    scale = _AMOUNT_SCALE.get(unit.lower() if unit else None)
+    if scale is None:
+        # Unicode look-alikes (e.g. a dotless i) match the pattern but not the table
+        return amount_text
+
+    try:
+        value = float(match.group(1).replace(',', '')) * scale
+    except ValueError:
+        return amount_text
     
+    # Choose the suffix by magnitude; bare numbers under a million are shown as written
+    if value >= 1000000000:
+        return f"${value/1000000000:.1f}B"
+    if unit or value >= 1000000:
+        num = value / 1000000
+        return f"${int(num)}M" if num == int(num) else f"${num:.1f}M"
     return amount_text
 
-# Initialize session state
-if 'db' not in st.session_state:
-    st.session_state.db = DatabaseOperations()
+_EVENT_ROW_TMPL = (
+    '<div class="event-row">'
+    '<div class="event-main"><div class="event-title">{company}</div>{summary}'
+    '<div class="event-tags">{tags}</div></div>'
+    '<div class="event-funding"><div class="event-amount">💰 {amount}</div><div>👥 {investors}</div></div>'
+    '<div class="event-action">{action}</div>'
+    '</div>'
+)
 
-if 'pipeline' not in st.session_state:
-    st.session_state.pipeline = FundingDataPipeline()
+def _html_text(value) -> str:
+    """Escape text for the event rows ($ too, so markdown never reads it as math)"""
+    # Newlines are collapsed as well: a blank line would end the markdown HTML block early
+    return html.escape(' '.join(str(value).split())).replace('$', '&#36;')
+
+def _with_display_fields(events: list) -> list:
+    """Add amount/summary/investor display strings once, so render loops only read them"""
+    for event in events:
+        event['amount_display'] = format_amount(event.get('amount_text', 'Undisclosed'))
+        
+        # Clean summary
+        summary = ""
+        if event.get('summary'):
+            # Tags stripped and whitespace collapsed to a single line
+            summary = ' '.join(_HTML_TAG_RE.sub('', event['summary'][:100]).split())
+            if len(event['summary']) > 100:
+                summary += "..."
+        event['summary_display'] = summary
+        
+        # Investors
+        investors = "Investors TBA"
+        if event.get('investors'):
+            if len(event['investors']) == 1:
+                investors = event['investors'][0]['name']
+            else:
+                investors = f"{event['investors'][0]['name']} +{len(event['investors'])-1} more"
+        event['investors_display'] = investors
+    return events
+
+def render_event_rows(events: list):
+    """Render funding events (see _with_display_fields) as one HTML block instead of a container per row"""
+    rows = []
+    for event in events:
+        sector = event.get('company_sector', 'Unknown')
+        stage = event.get('funding_stage', 'Unknown')
+        location = event.get('company_location', '')
+        summary = event['summary_display']
+        
+        # Tags
+        tag_text = f"🏢 {sector}"
+        if stage != 'Unknown':
+            tag_text += f" • 📈 {stage}"
+        if location:
+            tag_text += f" • 📍 {location}"
+        
+        if event.get('source_url'):
+            action = (f'<a class="event-link" href="{html.escape(event["source_url"])}" '
+                      'target="_blank" rel="noopener">Read More</a>')
+        else:
+            action = '<span class="event-link disabled">Details</span>'
+        
+        rows.append(_EVENT_ROW_TMPL.format(
+            company=_html_text(event['company_name']),
+            summary=f'<div class="event-summary">{_html_text(summary)}</div>' if summary else '',
+            tags=_html_text(tag_text),
+            amount=_html_text(event['amount_display']),
+            investors=_html_text(event['investors_display']),
+            action=action,
+        ))
+    
+    st.markdown(f'<div class="event-list">{"".join(rows)}</div>', unsafe_allow_html=True)
+
+# Database and pipeline are shared by all sessions in the process
+@st.cache_resource
+def get_db() -> DatabaseOperations:
+    """Process-wide database operations handle"""
+    return DatabaseOperations()
+
+@st.cache_resource
+def get_pipeline():
+    """Process-wide pipeline (scrapers, extractor and AI classifier are built once)"""
+    # Imported here so pages that never collect data skip loading openai and the scrapers
+    from src.pipeline import FundingDataPipeline
+    return FundingDataPipeline()
+
+# Search results table: event field -> column header (display strings from _with_display_fields)
+_SEARCH_RESULT_COLUMNS = {
+    'company_name': 'Company',
+    'amount_display': 'Amount',
+    'funding_stage': 'Stage',
+    'company_sector': 'Sector',
+    'company_location': 'Location',
+    'announcement_date': 'Date',
+    'summary_display': 'Summary',
+    'source_url': 'Link'
+}
 
+# Static page chrome rendered by main() on every rerun
+_HERO_HTML = """
+<div style="
+    background: linear-gradient(135deg, #10B981 0%, #059669 50%, #047857 100%);
+    padding: 2.5rem 0;
+    margin: 0 0 2rem 0;
+    text-align: center;
+    border-radius: 24px;
+    box-shadow: 0 8px 32px rgba(16, 185, 129, 0.2);
+">
+    <h1 style="
+        color: white;
+        font-family: -apple-system, BlinkMacSystemFont, 'SF Pro Display', sans-serif;
+        font-size: 2.8rem;
+        font-weight: 700;
+        margin: 0;
+        letter-spacing: -0.03em;
+        text-shadow: 0 2px 12px rgba(0, 0, 0, 0.15);
+    ">
+        🌍 APR Climate Tech Funding
+    </h1>
+    <p style="
+        color: rgba(255, 255, 255, 0.95);
+        font-family: -apple-system, BlinkMacSystemFont, 'SF Pro Text', sans-serif;
+        font-size: 1.15rem;
+        margin: 0.75rem 0 0 0;
+        font-weight: 400;
+        letter-spacing: -0.01em;
+    ">Investing in a sustainable future through climate innovation</p>
+</div>
+"""
+
+_NAV_HEADER_HTML = """
+<div style="
+    text-align: center;
+    padding: 1rem 0;
+    margin-bottom: 2rem;
+    border-bottom: 1px solid rgba(0, 0, 0, 0.1);
+">
+    <div style="
+        font-size: 1.5rem;
+        font-weight: 700;
+        color: #1C1C1E;
+        margin-bottom: 0.5rem;
+    ">Navigation</div>
+    <div style="
+        font-size: 0.875rem;
+        color: #8E8E93;
+    ">Choose your view</div>
+</div>
+"""
+
+# Analytics "Top Active Investors" panel; the opening tag is closed after the cards
+_TOP_INVESTORS_PANEL_HTML = (
+    '<div style="background: white; border-radius: 12px; padding: 1.5rem; '
+    'box-shadow: 0 4px 20px rgba(0, 0, 0, 0.08); border: 1px solid rgba(0, 0, 0, 0.05); margin-bottom: 20px;">'
+    '<h3 style="color: #1C1C1E; font-size: 1.125rem; font-weight: 600; margin-bottom: 1rem; '
+    'display: flex; align-items: center;">🏆 Top Active Investors</h3>'
+)
+
+_INVESTOR_CARD_TMPL = (
+    '<div style="display: flex; align-items: center; justify-content: space-between; padding: 0.75rem; '
+    'margin: 0.5rem 0; background: rgba(0, 122, 255, 0.05); border-radius: 8px; border-left: 3px solid #007AFF;">'
+    '<div style="flex: 1;">'
+    '<div style="font-weight: 600; color: #1C1C1E; font-size: 0.95rem; margin-bottom: 0.25rem;">{name}</div>'
+    '<div style="font-size: 0.8rem; color: #8E8E93;">{count} investments • {lead_pct:.0f}% lead</div>'
+    '</div>'
+    '<div style="background: #007AFF; color: white; border-radius: 50%; width: 24px; height: 24px; display: flex; '
+    'align-items: center; justify-content: center; font-size: 0.8rem; font-weight: 600;">#{rank}</div>'
+    '</div>'
+)
+
+# Sidebar status panel pieces. They are joined into a single markdown call, so each
+# is a flush-left one-liner (indented or blank lines would break the HTML block)
+_STATUS_HEADER_HTML = (
+    '<div style="background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%); border-radius: 12px; '
+    'padding: 1.5rem; margin: 2rem 0; border: 1px solid rgba(0, 0, 0, 0.05);">'
+    '<div style="font-size: 1.1rem; font-weight: 600; color: #1C1C1E; margin-bottom: 1rem; '
+    'text-align: center;">⚡ System Status</div></div>'
+)
+
+_STATUS_ITEM_TMPL = (
+    '<div style="background: {bg}; border-left: 4px solid {accent}; padding: 0.75rem 1rem; '
+    'margin: 0.5rem 0; border-radius: 0 8px 8px 0;">'
+    '<div style="font-weight: 600; color: {title_color};">{title}</div>'
+    '<div style="font-size: 0.875rem; color: #1C1C1E; margin-top: 0.25rem;">{detail}</div></div>'
+)
+
+_QUICK_ACTIONS_HTML = (
+    '<div style="text-align: center; margin-top: 2rem;">'
+    '<div style="font-size: 1.1rem; font-weight: 600; color: #1C1C1E; margin-bottom: 1rem;">'
+    '🚀 Quick Actions</div></div>'
+)
+
+# Pages in navigation order; the current one is mirrored to ?page= so views can be linked
+_NAV_PAGES = (
+    "Dashboard",
+    "Search & Filter",
+    "Analytics",
+    "Data Collection",
+    "Data Export",
+    "Data Sources"
+)
+
+# Initialize session state
 if 'current_page' not in st.session_state:
-    st.session_state.current_page = "Dashboard"
+    requested_page = st.query_params.get('page')
+    st.session_state.current_page = requested_page if requested_page in _NAV_PAGES else "Dashboard"
+
+# Sidebar status is rendered on every rerun, so keep its queries cached
+@st.cache_data(ttl=10, show_spinner=False)
+def _events_fingerprint() -> tuple:
+    """(event count, highest event id); the page caches below are keyed on it"""
+    return get_db().get_funding_events_fingerprint()
+
+@st.cache_data(ttl=300)
+def _cached_enabled_sources(config_mtime: float) -> dict:
+    """Enabled data sources; keyed on the config file's mtime so edits show up immediately"""
+    return get_enabled_sources()
+
+def _sources_config_mtime() -> float:
+    try:
+        return SOURCES_CONFIG_FILE.stat().st_mtime
+    except OSError:
+        return 0.0
+
+# Recent-events query shared by the dashboard list and the search page examples
+_RECENT_EVENT_LIMIT = 8
+_RECENT_EVENT_FIELDS = ('company_name', 'company_sector', 'company_location', 'announcement_date',
+                        'amount_text', 'funding_stage', 'summary', 'source_url', 'investors')
+
+# Page queries: every navigation click reruns the script, so reuse results until the
+# events fingerprint changes
+@st.cache_data(max_entries=32, show_spinner=False)
+def _fetch_recent(limit: int, fields: tuple = None, fingerprint: tuple = None) -> list:
+    """Recent funding events (see DatabaseOperations.get_recent_funding_events)"""
+    return _with_display_fields(
+        get_db().get_recent_funding_events(limit=limit, fields=list(fields) if fields else None)
+    )
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _dashboard_summary(fingerprint: tuple = None) -> dict:
+    """Event count, total funding and most common stage/sector for the dashboard metrics"""
+    return get_db().get_dashboard_summary()
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _funding_by_sector(fingerprint: tuple = None) -> list:
+    """Funding totals per sector for the analytics page"""
+    return get_db().get_funding_by_sector()
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _top_investors(limit: int, fingerprint: tuple = None) -> list:
+    """Most active investors for the analytics page"""
+    return get_db().get_top_investors(limit=limit)
+
+# Plotly figure construction is slow (~8ms for the donut); st.plotly_chart only reads the
+# figure, so the same object can be shared instead of being re-pickled by cache_data
+@st.cache_resource(max_entries=8)
+def _sector_donut(chart_items: tuple):
+    """Funding-by-sector donut for (sector label, total amount) pairs"""
+    return AppleCharts.create_donut_chart(
+        data=[{'sector': sector, 'amount': amount} for sector, amount in chart_items],
+        values_key='amount',
+        names_key='sector',
+        show_center_total=True
+    )
+
+@st.cache_data(ttl=15, show_spinner=False)
+def _sidebar_status_html(config_mtime: float) -> str:
+    """Sidebar status panel HTML; near-static, so nav clicks reuse it for a few seconds"""
+    status_parts = [_STATUS_HEADER_HTML]
+    
+    # Database status with modern styling
+    try:
+        total_events = _events_fingerprint()[0]
+        status_parts.append(_STATUS_ITEM_TMPL.format(
+            bg='rgba(16, 185, 129, 0.1)', accent='#10B981', title_color='#059669',
+            title='🌱 Database Connected', detail=f'Events: {total_events:,}'
+        ))
+    except Exception as e:
+        status_parts.append(_STATUS_ITEM_TMPL.format(
+            bg='rgba(255, 59, 48, 0.1)', accent='#FF3B30', title_color='#FF3B30',
+            title='❌ Database Error', detail=f'{html.escape(str(e)[:50])}...'
+        ))
+    
+    # AI features status
+    if OPENAI_API_KEY:
+        status_parts.append(_STATUS_ITEM_TMPL.format(
+            bg='rgba(0, 122, 255, 0.1)', accent='#007AFF', title_color='#007AFF',
+            title='🤖 AI Features Enabled', detail='Smart analysis active'
+        ))
+    else:
+        status_parts.append(_STATUS_ITEM_TMPL.format(
+            bg='rgba(255, 159, 10, 0.1)', accent='#FF9F0A', title_color='#FF9F0A',
+            title='🤖 AI Features Disabled', detail='API key required'
+        ))
+    
+    # Data sources status
+    try:
+        enabled_sources = _cached_enabled_sources(config_mtime)
+        total_sources_count = len(enabled_sources)
+        if total_sources_count > 0:
+            status_parts.append(_STATUS_ITEM_TMPL.format(
+                bg='rgba(52, 199, 89, 0.1)', accent='#34C759', title_color='#34C759',
+                title='Active Sources', detail=f'{total_sources_count} sources enabled'
+            ))
+        else:
+            status_parts.append(_STATUS_ITEM_TMPL.format(
+                bg='rgba(255, 159, 10, 0.1)', accent='#FF9F0A', title_color='#FF9F0A',
+                title='No Active Sources', detail='Configure sources first'
+            ))
+    except Exception as e:
+        status_parts.append(_STATUS_ITEM_TMPL.format(
+            bg='rgba(255, 59, 48, 0.1)', accent='#FF3B30', title_color='#FF3B30',
+            title='❌ Sources Error', detail=f'{html.escape(str(e)[:50])}...'
+        ))
+    
+    # Quick actions heading (the buttons themselves stay widgets)
+    status_parts.append(_QUICK_ACTIONS_HTML)
+    return ''.join(status_parts)
 
 def main():
     """Main application"""
     # Environmental green style header
-    st.markdown("""
-    <div style="
-        background: linear-gradient(135deg, #10B981 0%, #059669 50%, #047857 100%);
-        padding: 2.5rem 0;
-        margin: 0 0 2rem 0;
-        text-align: center;
-        border-radius: 24px;
-        box-shadow: 0 8px 32px rgba(16, 185, 129, 0.2);
-    ">
-        <h1 style="
-            color: white;
-            font-family: -apple-system, BlinkMacSystemFont, 'SF Pro Display', sans-serif;
-            font-size: 2.8rem;
-            font-weight: 700;
-            margin: 0;
-            letter-spacing: -0.03em;
-            text-shadow: 0 2px 12px rgba(0, 0, 0, 0.15);
-        ">
-            🌍 APR Climate Tech Funding
-        </h1>
-        <p style="
-            color: rgba(255, 255, 255, 0.95);
-            font-family: -apple-system, BlinkMacSystemFont, 'SF Pro Text', sans-serif;
-            font-size: 1.15rem;
-            margin: 0.75rem 0 0 0;
-            font-weight: 400;
-            letter-spacing: -0.01em;
-        ">Investing in a sustainable future through climate innovation</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_HERO_HTML, unsafe_allow_html=True)
     
     # Sidebar with Apple-style navigation
     with st.sidebar:
-        st.markdown("""
-        <div style="
-            text-align: center;
-            padding: 1rem 0;
-            margin-bottom: 2rem;
-            border-bottom: 1px solid rgba(0, 0, 0, 0.1);
-        ">
-            <div style="
-                font-size: 1.5rem;
-                font-weight: 700;
-                color: #1C1C1E;
-                margin-bottom: 0.5rem;
-            ">Navigation</div>
-            <div style="
-                font-size: 0.875rem;
-                color: #8E8E93;
-            ">Choose your view</div>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Modern navigation without icons
-        nav_options = [
-            "Dashboard",
-            "Search & Filter", 
-            "Analytics",
-            "Data Collection",
-            "Data Export",
-            "Data Sources"
-        ]
+        st.markdown(_NAV_HEADER_HTML, unsafe_allow_html=True)
         
-        for title in nav_options:
+        # Modern navigation without icons. The click itself already reruns the
+        # script and the page is read below, so no extra st.rerun() is needed
+        for title in _NAV_PAGES:
             if st.button(
                 title,
                 key=f"nav_{title}",
                 use_container_width=True
             ):
                 st.session_state.current_page = title
-                st.rerun()
+                st.query_params['page'] = title
         
         # Get current page from session state
         page = st.session_state.current_page
         
-        st.markdown("""
-        <div style="
-            background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
-            border-radius: 12px;
-            padding: 1.5rem;
-            margin: 2rem 0;
-            border: 1px solid rgba(0, 0, 0, 0.05);
-        ">
-            <div style="
-                font-size: 1.1rem;
-                font-weight: 600;
-                color: #1C1C1E;
-                margin-bottom: 1rem;
-                text-align: center;
-            ">⚡ System Status</div>
-        """, unsafe_allow_html=True)
-        
-        # Database status with modern styling
-        try:
-            recent_count = len(st.session_state.db.get_recent_funding_events(limit=1))
-            total_events = st.session_state.db.get_recent_funding_events(limit=1000)
-            
-            st.markdown(f"""
-            <div style="
-                background: rgba(16, 185, 129, 0.1);
-                border-left: 4px solid #10B981;
-                padding: 0.75rem 1rem;
-                margin: 0.5rem 0;
-                border-radius: 0 8px 8px 0;
-            ">
-                <div style="font-weight: 600; color: #059669;">🌱 Database Connected</div>
-                <div style="font-size: 0.875rem; color: #1C1C1E; margin-top: 0.25rem;">Events: {len(total_events):,}</div>
-            </div>
-            """, unsafe_allow_html=True)
-        except Exception as e:
-            st.markdown(f"""
-            <div style="
-                background: rgba(255, 59, 48, 0.1);
-                border-left: 4px solid #FF3B30;
-                padding: 0.75rem 1rem;
-                margin: 0.5rem 0;
-                border-radius: 0 8px 8px 0;
-            ">
-                <div style="font-weight: 600; color: #FF3B30;">❌ Database Error</div>
-                <div style="font-size: 0.875rem; color: #1C1C1E; margin-top: 0.25rem;">{str(e)[:50]}...</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # AI features status
-        if OPENAI_API_KEY:
-            st.markdown("""
-                <div style="
-                    background: rgba(0, 122, 255, 0.1);
-                    border-left: 4px solid #007AFF;
-                    padding: 0.75rem 1rem;
-                    margin: 0.5rem 0;
-                    border-radius: 0 8px 8px 0;
-                ">
-                    <div style="font-weight: 600; color: #007AFF;">🤖 AI Features Enabled</div>
-                    <div style="font-size: 0.875rem; color: #1C1C1E; margin-top: 0.25rem;">Smart analysis active</div>
-                </div>
-                """, unsafe_allow_html=True)
-        else:
-            st.markdown("""
-                <div style="
-                    background: rgba(255, 159, 10, 0.1);
-                    border-left: 4px solid #FF9F0A;
-                    padding: 0.75rem 1rem;
-                    margin: 0.5rem 0;
-                    border-radius: 0 8px 8px 0;
-                ">
-                    <div style="font-weight: 600; color: #FF9F0A;">🤖 AI Features Disabled</div>
-                    <div style="font-size: 0.875rem; color: #1C1C1E; margin-top: 0.25rem;">API key required</div>
-                </div>
-                """, unsafe_allow_html=True)
-        
-        # Data sources status
-        try:
-            enabled_sources = get_enabled_sources()
-            total_sources_count = len(enabled_sources)
-            if total_sources_count > 0:
-                st.markdown(f"""
-                <div style="
-                    background: rgba(52, 199, 89, 0.1);
-                    border-left: 4px solid #34C759;
-                    padding: 0.75rem 1rem;
-                    margin: 0.5rem 0;
-                    border-radius: 0 8px 8px 0;
-                ">
-                    <div style="font-weight: 600; color: #34C759;">Active Sources</div>
-                    <div style="font-size: 0.875rem; color: #1C1C1E; margin-top: 0.25rem;">{total_sources_count} sources enabled</div>
-                </div>
-                """, unsafe_allow_html=True)
-            else:
-                st.markdown("""
-                <div style="
-                    background: rgba(255, 159, 10, 0.1);
-                    border-left: 4px solid #FF9F0A;
-                    padding: 0.75rem 1rem;
-                    margin: 0.5rem 0;
-                    border-radius: 0 8px 8px 0;
-                ">
-                    <div style="font-weight: 600; color: #FF9F0A;">No Active Sources</div>
-                    <div style="font-size: 0.875rem; color: #1C1C1E; margin-top: 0.25rem;">Configure sources first</div>
-                </div>
-                """, unsafe_allow_html=True)
-        except Exception as e:
-            st.markdown(f"""
-            <div style="
-                background: rgba(255, 59, 48, 0.1);
-                border-left: 4px solid #FF3B30;
-                padding: 0.75rem 1rem;
-                margin: 0.5rem 0;
-                border-radius: 0 8px 8px 0;
-            ">
-                <div style="font-weight: 600; color: #FF3B30;">❌ Sources Error</div>
-                <div style="font-size: 0.875rem; color: #1C1C1E; margin-top: 0.25rem;">{str(e)[:50]}...</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # Quick actions with Apple-style buttons
-        st.markdown("""
-        <div style="
-            text-align: center;
-            margin-top: 2rem;
-        ">
-            <div style="
-                font-size: 1.1rem;
-                font-weight: 600;
-                color: #1C1C1E;
-                margin-bottom: 1rem;
-            ">🚀 Quick Actions</div>
-        </div>
-        """, unsafe_allow_html=True)
+        # Status panel and the Quick Actions heading go out as one markdown element
+        st.markdown(_sidebar_status_html(_sources_config_mtime()), unsafe_allow_html=True)
         
         if st.button(
             "Refresh Data",
@@ -402,7 +463,8 @@ def main():
         ):
             try:
                 with st.spinner("🔄 Collecting latest funding news..."):
-                    results = st.session_state.pipeline.run_scraping_cycle(max_pages=1)
+                    results = get_pipeline().run_scraping_cycle(max_pages=1)
+                    st.cache_data.clear()
                     if results:
                         st.success(f"✅ Added {len(results)} new funding events!")
                         st.rerun()
@@ -428,47 +490,25 @@ def main():
 def show_dashboard():
     """Dashboard page showing recent funding events"""
     # Environmental themed dashboard header
-    st.markdown("""
-    <div style="
-        background: linear-gradient(135deg, rgba(16, 185, 129, 0.08) 0%, rgba(5, 150, 105, 0.08) 100%);
-        border-radius: 16px;
-        padding: 1.5rem;
-        margin-bottom: 2rem;
-        border: 1px solid rgba(16, 185, 129, 0.2);
-    ">
-        <h2 style="
-            color: #059669;
-            font-size: 1.75rem;
-            font-weight: 700;
-            margin: 0 0 0.5rem 0;
-        ">Funding Dashboard</h2>
-        <p style="
-            color: #6B7280;
-            font-size: 1rem;
-            margin: 0;
-        ">Real-time insights into climate tech funding activity</p>
-    </div>
-    """, unsafe_allow_html=True)
+    render_page_header('Funding Dashboard', 'Real-time insights into climate tech funding activity')
     
     # Get recent events
     try:
-        events = st.session_state.db.get_recent_funding_events(limit=1000)  # Get all events for metrics
+        summary = _dashboard_summary(_events_fingerprint())  # Metrics are aggregated in SQL
         
-        if not events:
+        if not summary['total_events']:
             st.info("No funding events found. Try refreshing the data using the sidebar.")
             return
         
         # Apple-style metrics using custom components
-        total_amount = sum(event['amount'] or 0 for event in events)
-        stages = [event['funding_stage'] for event in events if event['funding_stage']]
-        sectors = [event['company_sector'] for event in events if event['company_sector']]
-        most_common_stage = max(set(stages), key=stages.count) if stages else "N/A"
-        most_common_sector = max(set(sectors), key=sectors.count) if sectors else "N/A"
+        total_amount = summary['total_amount']
+        most_common_stage = summary['top_stage'] or "N/A"
+        most_common_sector = summary['top_sector'] or "N/A"
         
         metrics = [
             {
                 'title': 'Total Events',
-                'value': f"{len(events):,}",
+                'value': f"{summary['total_events']:,}",
                 'icon': METRIC_ICONS['events'],
                 'color_theme': 'blue'
             },
@@ -514,92 +554,20 @@ def show_dashboard():
         """, unsafe_allow_html=True)
         
         # Display events in clean Apple-style list
-        events_to_show = events[:8]  # Show only first 8 for display
+        events_to_show = _fetch_recent(  # Show only first 8 for display
+            _RECENT_EVENT_LIMIT, _RECENT_EVENT_FIELDS, fingerprint=_events_fingerprint()
+        )
         
-        for i, event in enumerate(events_to_show):
-            # Extract data
-            amount_display = format_amount(event.get('amount_text', 'Undisclosed'))
-            sector = event.get('company_sector', 'Unknown')
-            stage = event.get('funding_stage', 'Unknown')
-            location = event.get('company_location', '')
-            
-            # Clean summary
-            summary = ""
-            if event.get('summary'):
-                import re
-                summary = re.sub(r'<[^>]+>', '', event['summary'][:100])
-                if len(event['summary']) > 100:
-                    summary += "..."
-            
-            # Investors
-            investors = "Investors TBA"
-            if event.get('investors'):
-                if len(event['investors']) == 1:
-                    investors = event['investors'][0]['name']
-                else:
-                    investors = f"{event['investors'][0]['name']} +{len(event['investors'])-1} more"
-            
-            # Create container for the row
-            container = st.container()
-            with container:
-                col1, col2, col3 = st.columns([3, 2, 1])
-                
-                with col1:
-                    st.markdown(f"### {event['company_name']}")
-                    if summary:
-                        st.markdown(summary)
-                    
-                    # Tags
-                    tag_text = f"🏢 {sector}"
-                    if stage != 'Unknown':
-                        tag_text += f" • 📈 {stage}"
-                    if location:
-                        tag_text += f" • 📍 {location}"
-                    st.markdown(f"*{tag_text}*")
-                
-                with col2:
-                    st.markdown(f"### 💰 {amount_display}")
-                    st.markdown(f"👥 {investors}")
-                
-                with col3:
-                    if event.get('source_url'):
-                        st.link_button("Read More", event['source_url'])
-                    else:
-                        st.button("Details", disabled=True)
-                
-                # Add separator
-                if i < len(events_to_show) - 1:
-                    st.divider()
-                
+        render_event_rows(events_to_show)
+    
     except Exception as e:
         st.error(f"Error loading dashboard: {str(e)}")
 
+@st.fragment
 def show_search():
-    """Search and filter page"""
+    """Search and filter page (a fragment, so submitting reruns only this page)"""
     # Environmental themed search page header
-    st.markdown("""
-    <div style="
-        background: linear-gradient(135deg, rgba(16, 185, 129, 0.08) 0%, rgba(5, 150, 105, 0.08) 100%);
-        border-radius: 16px;
-        padding: 1.5rem;
-        margin-bottom: 2rem;
-        border: 1px solid rgba(16, 185, 129, 0.2);
-    ">
-        <h2 style="
-            color: #059669;
-            font-size: 1.75rem;
-            font-weight: 700;
-            margin: 0 0 0.5rem 0;
-            font-family: -apple-system, BlinkMacSystemFont, 'SF Pro Display', sans-serif;
-        ">Smart Search & Filters</h2>
-        <p style="
-            color: #6B7280;
-            font-size: 1rem;
-            margin: 0;
-            font-family: -apple-system, BlinkMacSystemFont, 'SF Pro Text', sans-serif;
-        ">Find specific companies, deals, and trends with precision</p>
-    </div>
-    """, unsafe_allow_html=True)
+    render_page_header('Smart Search & Filters', 'Find specific companies, deals, and trends with precision')
     
     # Search form
     with st.form("search_form"):
@@ -638,14 +606,17 @@ def show_search():
             min_amount_val = min_amount * 1_000_000 if min_amount > 0 else None
             max_amount_val = max_amount * 1_000_000 if max_amount < 1000 else None
             
-            # Search database
-            results = st.session_state.db.search_funding_events(
+            # Search database, fetching only the page that is displayed
+            filters = dict(
                 query=search_query,
                 sector=search_sector,
                 stage=search_stage,
                 min_amount=min_amount_val,
                 max_amount=max_amount_val
             )
+            results = _with_display_fields(get_db().search_funding_events(**filters, limit=20))
+            # A short page already holds every match, so only count when it is full
+            total_matches = len(results) if len(results) < 20 else get_db().count_funding_events(**filters)
             
             # Results header
             st.markdown(f"""
@@ -664,70 +635,25 @@ def show_search():
                     margin: 0;
                     font-family: -apple-system, BlinkMacSystemFont, 'SF Pro Display', sans-serif;
                 ">
-                    ✅ Found {len(results)} matching funding events
+                    ✅ Found {total_matches} matching funding events
                 </h3>
             </div>
             """, unsafe_allow_html=True)
             
             if results:
-                # Display results in the same style as Dashboard
-                for i, event in enumerate(results[:20]):  # Limit to 20 results
-                    # Extract and format data
-                    amount_display = format_amount(event.get('amount_text', 'Undisclosed'))
-                    sector = event.get('company_sector', 'Unknown')
-                    stage = event.get('funding_stage', 'Unknown')
-                    location = event.get('company_location', '')
-                    date = event.get('announcement_date', '')
-                    
-                    # Get summary
-                    summary = ""
-                    if event.get('summary'):
-                        import re
-                        summary = re.sub(r'<[^>]+>', '', event['summary'][:100])
-                        if len(event['summary']) > 100:
-                            summary += "..."
-                    
-                    # Get investors
-                    investors = "Investors TBA"
-                    if event.get('investors'):
-                        if len(event['investors']) == 1:
-                            investors = event['investors'][0]['name']
-                        else:
-                            investors = f"{event['investors'][0]['name']} +{len(event['investors'])-1} more"
-                    
-                    # Create container for the row
-                    container = st.container()
-                    with container:
-                        col1, col2, col3 = st.columns([3, 2, 1])
-                        
-                        with col1:
-                            st.markdown(f"### {event['company_name']}")
-                            if summary:
-                                st.markdown(summary)
-                            
-                            # Tags
-                            tag_text = f"🏢 {sector}"
-                            if stage != 'Unknown':
-                                tag_text += f" • 📈 {stage}"
-                            if location:
-                                tag_text += f" • 📍 {location}"
-                            if date:
-                                tag_text += f" • 📅 {date}"
-                            st.markdown(f"*{tag_text}*")
-                        
-                        with col2:
-                            st.markdown(f"### 💰 {amount_display}")
-                            st.markdown(f"👥 {investors}")
-                        
-                        with col3:
-                            if event.get('source_url'):
-                                st.link_button("Read More", event['source_url'])
-                            else:
-                                st.button("Details", disabled=True, key=f"details_{i}")
-                        
-                        # Add separator
-                        if i < len(results) - 1 and i < 19:
-                            st.divider()
+                # One Arrow-backed table instead of a block of per-row HTML
+                df = pd.DataFrame.from_records(results, columns=list(_SEARCH_RESULT_COLUMNS))
+                df = df.rename(columns=_SEARCH_RESULT_COLUMNS)
+                df[['Sector', 'Stage', 'Location', 'Date']] = df[['Sector', 'Stage', 'Location', 'Date']].fillna('Unknown')
+                st.dataframe(
+                    df,
+                    use_container_width=True,
+                    hide_index=True,
+                    column_config={
+                        'Summary': st.column_config.TextColumn(width='large'),
+                        'Link': st.column_config.LinkColumn(display_text='Read More')
+                    }
+                )
             else:
                 st.info("No results found. Try adjusting your search criteria.")
         
@@ -758,7 +684,10 @@ def show_search():
         
         try:
             # Show 5 recent events as examples
-            recent_events = st.session_state.db.get_recent_funding_events(limit=5)
+            # Same cache entry as the dashboard list, which is usually already loaded
+            recent_events = _fetch_recent(
+                _RECENT_EVENT_LIMIT, _RECENT_EVENT_FIELDS, fingerprint=_events_fingerprint()
+            )[:5]
             if recent_events:
                 st.markdown("#### Recent Funding Events")
                 for event in recent_events:
@@ -767,8 +696,7 @@ def show_search():
                         st.markdown(f"**{event['company_name']}** - {event.get('company_sector', 'Unknown sector')}")
                         st.caption(f"📍 {event.get('company_location', 'Unknown location')} • 📅 {event.get('announcement_date', 'Unknown date')}")
                     with col2:
-                        amount = format_amount(event.get('amount_text', 'Undisclosed'))
-                        st.markdown(f"**{amount}**")
+                        st.markdown(f"**{event['amount_display']}**")
                         st.caption(event.get('funding_stage', 'Unknown stage'))
                     st.divider()
         except Exception as e:
@@ -777,32 +705,13 @@ def show_search():
 def show_analytics():
     """Analytics page with charts and insights"""
     # Modern analytics header
-    st.markdown("""
-    <div style="
-        background: linear-gradient(135deg, rgba(52, 199, 89, 0.1) 0%, rgba(48, 209, 88, 0.1) 100%);
-        border-radius: 16px;
-        padding: 1.5rem;
-        margin-bottom: 2rem;
-        border: 1px solid rgba(52, 199, 89, 0.2);
-    ">
-        <h2 style="
-            color: #34C759;
-            font-size: 1.75rem;
-            font-weight: 700;
-            margin: 0 0 0.5rem 0;
-        ">Analytics & Market Insights</h2>
-        <p style="
-            color: #8E8E93;
-            font-size: 1rem;
-            margin: 0;
-        ">Deep dive into funding trends and market intelligence</p>
-    </div>
-    """, unsafe_allow_html=True)
+    render_page_header('Analytics & Market Insights', 'Deep dive into funding trends and market intelligence', theme='system')
     
     try:
-        # Get analytics data
-        sector_data = st.session_state.db.get_funding_by_sector()
-        top_investors = st.session_state.db.get_top_investors(limit=10)
+        # Get analytics data (cached until the events fingerprint changes)
+        fingerprint = _events_fingerprint()
+        sector_data = _funding_by_sector(fingerprint)
+        top_investors = _top_investors(10, fingerprint)
         
         if not sector_data:
             st.info("No data available for analytics. Try collecting some data first.")
@@ -814,20 +723,15 @@ def show_analytics():
         with col1:
             if sector_data:
                 # Prepare data for donut chart
-                chart_data = [{
-                    'sector': item['sector'][:15] + '...' if len(item['sector']) > 15 else item['sector'],
-                    'amount': item['total_amount']
-                } for item in sector_data[:8]]  # Top 8 sectors
+                chart_items = tuple(
+                    (item['sector'][:15] + '...' if len(item['sector']) > 15 else item['sector'], item['total_amount'])
+                    for item in sector_data[:8]  # Top 8 sectors
+                )
                 
                 ChartContainer.render(
                     title="🏢 Funding by Sector",
                     chart_func=lambda: st.plotly_chart(
-                        AppleCharts.create_donut_chart(
-                            data=chart_data,
-                            values_key='amount',
-                            names_key='sector',
-                            show_center_total=True
-                        ),
+                        _sector_donut(chart_items),
                         use_container_width=True,
                         config={'displayModeBar': False}
                     ),
@@ -836,73 +740,17 @@ def show_analytics():
         
         with col2:
             if top_investors:
-                # Modern investor display
-                st.markdown("""
-                <div style="
-                    background: white;
-                    border-radius: 12px;
-                    padding: 1.5rem;
-                    box-shadow: 0 4px 20px rgba(0, 0, 0, 0.08);
-                    border: 1px solid rgba(0, 0, 0, 0.05);
-                    margin-bottom: 20px;
-                ">
-                    <h3 style="
-                        color: #1C1C1E;
-                        font-size: 1.125rem;
-                        font-weight: 600;
-                        margin-bottom: 1rem;
-                        display: flex;
-                        align-items: center;
-                    ">
-                        🏆 Top Active Investors
-                    </h3>
-                """, unsafe_allow_html=True)
-                
-                for i, investor in enumerate(top_investors[:6], 1):
-                    # Create a modern investor card
-                    lead_pct = (investor['lead_count'] / investor['investment_count'] * 100) if investor['investment_count'] > 0 else 0
-                    
-                    st.markdown(f"""
-                    <div style="
-                        display: flex;
-                        align-items: center;
-                        justify-content: space-between;
-                        padding: 0.75rem;
-                        margin: 0.5rem 0;
-                        background: rgba(0, 122, 255, 0.05);
-                        border-radius: 8px;
-                        border-left: 3px solid #007AFF;
-                    ">
-                        <div style="flex: 1;">
-                            <div style="
-                                font-weight: 600;
-                                color: #1C1C1E;
-                                font-size: 0.95rem;
-                                margin-bottom: 0.25rem;
-                            ">{investor['name'][:25]}{'...' if len(investor['name']) > 25 else ''}</div>
-                            <div style="
-                                font-size: 0.8rem;
-                                color: #8E8E93;
-                            ">
-                                {investor['investment_count']} investments • {lead_pct:.0f}% lead
-                            </div>
-                        </div>
-                        <div style="
-                            background: #007AFF;
-                            color: white;
-                            border-radius: 50%;
-                            width: 24px;
-                            height: 24px;
-                            display: flex;
-                            align-items: center;
-                            justify-content: center;
-                            font-size: 0.8rem;
-                            font-weight: 600;
-                        ">#{i}</div>
-                    </div>
-                    """, unsafe_allow_html=True)
-                
-                st.markdown("</div>", unsafe_allow_html=True)
+                # Modern investor display: the panel and its cards go out as one markdown block
+                cards_html = "".join(
+                    _INVESTOR_CARD_TMPL.format(
+                        rank=i,
+                        name=html.escape(investor['name'][:25] + ('...' if len(investor['name']) > 25 else '')),
+                        count=investor['investment_count'],
+                        lead_pct=(investor['lead_count'] / investor['investment_count'] * 100) if investor['investment_count'] > 0 else 0
+                    )
+                    for i, investor in enumerate(top_investors[:6], 1)
+                )
+                st.markdown(_TOP_INVESTORS_PANEL_HTML + cards_html + "</div>", unsafe_allow_html=True)
         
         # Enhanced summary statistics
         st.markdown("""
@@ -958,27 +806,7 @@ def show_analytics():
 def show_data_collection():
     """Data collection and management page"""
     # Modern data collection header
-    st.markdown("""
-    <div style="
-        background: linear-gradient(135deg, rgba(255, 159, 10, 0.1) 0%, rgba(255, 149, 0, 0.1) 100%);
-        border-radius: 16px;
-        padding: 1.5rem;
-        margin-bottom: 2rem;
-        border: 1px solid rgba(255, 159, 10, 0.2);
-    ">
-        <h2 style="
-            color: #FF9F0A;
-            font-size: 1.75rem;
-            font-weight: 700;
-            margin: 0 0 0.5rem 0;
-        ">Data Collection Center</h2>
-        <p style="
-            color: #8E8E93;
-            font-size: 1rem;
-            margin: 0;
-        ">Manage data sources and collection pipeline</p>
-    </div>
-    """, unsafe_allow_html=True)
+    render_page_header('Data Collection Center', 'Manage data sources and collection pipeline', theme='orange')
     
     st.markdown("""
     This page allows you to manually trigger data collection and view the processing pipeline status.
@@ -995,18 +823,23 @@ def show_data_collection():
         if st.button("🚀 Run Full Pipeline", type="primary"):
             try:
                 with st.spinner("Running data collection pipeline..."):
-                    results = st.session_state.pipeline.run_scraping_cycle(max_pages=max_pages)
+                    results = get_pipeline().run_scraping_cycle(max_pages=max_pages)
+                    st.cache_data.clear()
                     
                 if results:
                     st.success(f"✅ Successfully processed {len(results)} funding events!")
                     
-                    # Show results
+                    # Show results as one markdown block; '$' is escaped so two
+                    # amounts in the same block are not read as a math span
                     st.subheader("Newly Added Events")
+                    lines = []
                     for result in results:
-                        st.write(f"• **{result['company']}**: {result['amount']} ({result.get('stage', 'Unknown stage')})")
-                        st.write(f"  Sector: {result['sector']}")
+                        amount = str(result['amount']).replace('$', '\\$')
+                        lines.append(f"• **{result['company']}**: {amount} ({result.get('stage', 'Unknown stage')})")
+                        lines.append(f"  Sector: {result['sector']}")
                         if result['investors']:
-                            st.write(f"  Investors: {', '.join(result['investors'])}")
+                            lines.append(f"  Investors: {', '.join(result['investors'])}")
+                    st.markdown('\n\n'.join(lines))
                 else:
                     st.info("ℹ️ No new funding events found")
             
@@ -1018,12 +851,13 @@ def show_data_collection():
         
         # Show unprocessed articles
         try:
-            unprocessed = st.session_state.db.get_unprocessed_articles(limit=5)
+            unprocessed = get_db().get_unprocessed_articles(limit=5)
             st.write(f"📋 Unprocessed articles: {len(unprocessed)}")
             
             if unprocessed and st.button("Process Unprocessed Articles"):
                 with st.spinner("Processing articles..."):
-                    results = st.session_state.pipeline.process_unprocessed_articles(limit=10)
+                    results = get_pipeline().process_unprocessed_articles(limit=10)
+                    st.cache_data.clear()
                     if results:
                         st.success(f"Processed {len(results)} articles")
                     else:
@@ -1032,13 +866,14 @@ def show_data_collection():
         except Exception as e:
             st.error(f"Error checking unprocessed articles: {str(e)}")
 
+@st.fragment
 def show_data_export():
-    """Data export page"""
-    render_export_page(st.session_state.db)
+    """Data export page (a fragment, so filter changes rerun only this page)"""
+    render_export_page(get_db())
 
 def show_data_sources():
     """Data source management page"""
-    render_source_manager_page(st.session_state.db)
+    render_source_manager_page(get_db())
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
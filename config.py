@@ -2,6 +2,7 @@
 Configuration file for Climate Tech Funding Tracker
 """
 import os
+import sys
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -14,6 +15,7 @@ BASE_DIR = Path(__file__).parent
 # Data directories
 DATA_DIR = BASE_DIR / "data"
 DATABASE_PATH = DATA_DIR / "funding_tracker.db"
+LLM_CACHE_PATH = DATA_DIR / "llm_cache.db"
 
 # Ensure data directory exists
 DATA_DIR.mkdir(exist_ok=True)
@@ -27,6 +29,7 @@ SCRAPING_CONFIG = {
     "request_timeout": 30,
     "retry_count": 3,
     "delay_between_requests": 1,  # seconds
+    "db_batch_size": int(os.getenv("TRACKER_BATCH_SIZE", 500)),  # processed articles per DB transaction
 }
 
 # Climate Tech Categories
@@ -63,6 +66,11 @@ FUNDING_STAGES = [
     "Other"
 ]
 
+# Canonical labels are interned so the many copies produced by classification
+# and cleaning share one object and compare by identity
+CLIMATE_TECH_CATEGORIES = [sys.intern(category) for category in CLIMATE_TECH_CATEGORIES]
+FUNDING_STAGES = [sys.intern(stage) for stage in FUNDING_STAGES]
+
 # Data Sources
 DATA_SOURCES = {
     "techcrunch": {
@@ -77,8 +85,23 @@ DATA_SOURCES = {
 # NLP Configuration
 NLP_CONFIG = {
     "max_tokens": 1000,
+    "max_input_tokens": 500,  # article text budget per request
+    "filter_max_input_tokens": 250,  # article text budget for the validation gate
     "temperature": 0.3,
-    "model": "gpt-4o-mini"
+    "seed": 42,  # fixed sampling seed for reproducible classification
+    "extract_model": "gpt-4o-mini",  # classification, extraction and summaries
+    "filter_model": "gpt-4o-mini",  # cheap yes/no gate run on every candidate article
+    "filter_max_tokens": 40,
+    "max_retries": 5,  # SDK retries with exponential backoff, honoring retry-after
+    "max_concurrency": 20,  # Max in-flight requests for async batch processing
+    "request_timeout": 30.0,
+    "max_connections": 100,  # shared keep-alive HTTP pool per classifier
+    "max_keepalive_connections": 50,
+    "cache_ttl": 7 * 86400,  # seconds to keep cached LLM responses
+    "cache_max_temperature": 0.3,  # only cache requests at or below this temperature
+    "entity_cache_size": 10_000,  # articles whose extracted entities are kept in memory
+    "spacy_model": "en_core_web_sm",  # optional NER for company names in batch extraction
+    "spacy_batch_size": 64
 }
 
 # Streamlit Configuration
@@ -89,53 +89,59 @@ def create_sample_data():
         {"name": "GV (Google Ventures)", "type": "Corporate VC", "focus": ["Technology", "AI"]},
     ]
     
-    # Create investors
-    investor_ids = {}
-    for investor in sample_investors:
-        investor_id = db.get_or_create_investor(
-            name=investor["name"],
-            investor_type=investor["type"],
-            focus_areas=investor["focus"]
-        )
-        investor_ids[investor["name"]] = investor_id
+    # Write everything in one transaction instead of one commit per row
+    with db.bulk_transaction():
+        # Create investors
+        investor_ids = {}
+        for investor in sample_investors:
+            investor_id = db.get_or_create_investor(
+                name=investor["name"],
+                investor_type=investor["type"],
+                focus_areas=investor["focus"]
+            )
+            investor_ids[investor["name"]] = investor_id
     
-    # Create companies and funding events
-    base_date = datetime.now() - timedelta(days=180)  # Start 6 months ago
+        # Create companies and funding events
+        base_date = datetime.now() - timedelta(days=180)  # Start 6 months ago
     
-    for i, company in enumerate(sample_companies):
-        # Create company
-        company_id = db.get_or_create_company(
-            name=company["name"],
-            description=company["description"],
-            sector=company["sector"],
-            location=company["location"]
-        )
+        for i, company in enumerate(sample_companies):
+            # Create company
+            company_id = db.get_or_create_company(
+                name=company["name"],
+                description=company["description"],
+                sector=company["sector"],
+                location=company["location"]
+            )
         
-        # Create funding event
-        announcement_date = (base_date + timedelta(days=random.randint(0, 180))).strftime('%Y-%m-%d')
+            # Create funding event
+            announcement_date = (base_date + timedelta(days=random.randint(0, 180))).strftime('%Y-%m-%d')
         
-        funding_id = db.create_funding_event(
-            company_id=company_id,
-            amount=company["funding"]["amount"],
-            amount_text=company["funding"]["text"],
-            funding_stage=company["funding"]["stage"],
-            announcement_date=announcement_date,
-            source_url=f"https://demo-news.com/funding/{company['name'].lower().replace(' ', '-')}",
-            source_name="Demo News",
-            title=f"{company['name']} Raises {company['funding']['text']} in {company['funding']['stage']} Funding",
-            summary=f"{company['name']} has raised {company['funding']['text']} to expand their {company['description'].lower()}"
-        )
+            funding_id = db.create_funding_event(
+                company_id=company_id,
+                amount=company["funding"]["amount"],
+                amount_text=company["funding"]["text"],
+                funding_stage=company["funding"]["stage"],
+                announcement_date=announcement_date,
+                source_url=f"https://demo-news.com/funding/{company['name'].lower().replace(' ', '-')}",
+                source_name="Demo News",
+                title=f"{company['name']} Raises {company['funding']['text']} in {company['funding']['stage']} Funding",
+                summary=f"{company['name']} has raised {company['funding']['text']} to expand their {company['description'].lower()}"
+            )
         
-        # Add random investors
-        selected_investors = random.sample(list(investor_ids.keys()), random.randint(2, 4))
+            # Add random investors
+            selected_investors = random.sample(list(investor_ids.keys()), random.randint(2, 4))
         
-        for j, investor_name in enumerate(selected_investors):
-            is_lead = (j == 0)  # First investor is lead
-            db.add_investor_to_funding(
-                funding_id,
-                investor_ids[investor_name],
-                is_lead_investor=is_lead
-            )
+            for j, investor_name in enumerate(selected_investors):
+                is_lead = (j == 0)  # First investor is lead
+                db.add_investor_to_funding(
+                    funding_id,
+                    investor_ids[investor_name],
+                    is_lead_investor=is_lead
+                )
+    
+    # Refresh planner statistics so the new rows are costed against the indexes
+    with db.get_connection() as conn:
+        conn.execute('ANALYZE')
     
     print(f"✅ Created {len(sample_companies)} demo companies")
     print(f"✅ Created {len(sample_investors)} demo investors") 
@@ -7,21 +7,70 @@ from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import json
 from contextlib import contextmanager
+import functools
+import threading
 import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from config import DATABASE_PATH
+from src.init_db import create_schema
+
+# Per-connection settings; with WAL (see _ensure_schema) synchronous=NORMAL only syncs at checkpoints
+_CONNECTION_PRAGMAS = (
+    'PRAGMA synchronous = NORMAL',
+    'PRAGMA temp_store = MEMORY',
+    'PRAGMA mmap_size = 268435456',
+)
+
+# Company columns available on funding event query results
+_COMPANY_FIELDS = {
+    'company_name': 'c.name as company_name',
+    'company_sector': 'c.sector as company_sector',
+    'company_location': 'c.location as company_location',
+}
+
+_LINK_INVESTOR_SQL = '''
+    INSERT OR IGNORE INTO funding_investors 
+    (funding_event_id, investor_id, is_lead_investor)
+    VALUES (?, ?, ?)
+'''
+
+@functools.cache
+def _ensure_schema(db_path) -> None:
+    """Create missing tables/indexes and enable WAL, once per database file per process"""
+    conn = sqlite3.connect(db_path)
+    try:
+        # WAL is persistent in the file and lets readers run during pipeline writes
+        conn.execute('PRAGMA journal_mode = WAL')
+        create_schema(conn.cursor())
+        conn.commit()
+    except sqlite3.Error as e:
+        # e.g. a database created before a column the indexes need; queries still work without them
+        print(f"Could not bring database schema up to date: {e}")
+    finally:
+        conn.close()
 
 class DatabaseOperations:
     def __init__(self):
         self.db_path = DATABASE_PATH
+        # Connection of an open bulk_transaction, per thread (the app shares one instance)
+        self._local = threading.local()
     
     @contextmanager
     def get_connection(self):
         """Context manager for database connections"""
+        shared = getattr(self._local, 'conn', None)
+        if shared is not None:
+            # Inside bulk_transaction: reuse its connection and leave the commit to it
+            yield shared
+            return
+        
+        _ensure_schema(self.db_path)
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row  # Enable column access by name
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
         try:
             yield conn
             conn.commit()
@@ -31,17 +80,36 @@ class DatabaseOperations:
         finally:
             conn.close()
     
+    @contextmanager
+    def bulk_transaction(self):
+        """Run every operation in the block on one connection and commit once at the end"""
+        if getattr(self._local, 'conn', None) is not None:
+            # Nested: the outer block owns the commit
+            yield self._local.conn
+            return
+        
+        with self.get_connection() as conn:
+            self._local.conn = conn
+            try:
+                yield conn
+            finally:
+                self._local.conn = None
+    
     # Company Operations
     def create_company(self, name: str, description: str = None, website: str = None,
                       sector: str = None, location: str = None) -> int:
         """Create a new company record"""
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT INTO companies (name, description, website, sector, location)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (name, description, website, sector, location))
-            return cursor.lastrowid
+            return self._insert_company(conn.cursor(), name, description, website, sector, location)
+    
+    @staticmethod
+    def _insert_company(cursor: sqlite3.Cursor, name: str, description: str = None,
+                        website: str = None, sector: str = None, location: str = None) -> int:
+        cursor.execute('''
+            INSERT INTO companies (name, description, website, sector, location)
+            VALUES (?, ?, ?, ?, ?)
+        ''', (name, description, website, sector, location))
+        return cursor.lastrowid
     
     def get_company_by_name(self, name: str) -> Optional[Dict]:
         """Get company by name"""
@@ -64,13 +132,19 @@ class DatabaseOperations:
                        location: str = None, focus_areas: List[str] = None) -> int:
         """Create a new investor record"""
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            focus_areas_json = json.dumps(focus_areas) if focus_areas else None
-            cursor.execute('''
-                INSERT INTO investors (name, type, description, website, location, focus_areas)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (name, investor_type, description, website, location, focus_areas_json))
-            return cursor.lastrowid
+            return self._insert_investor(conn.cursor(), name, investor_type, description,
+                                         website, location, focus_areas)
+    
+    @staticmethod
+    def _insert_investor(cursor: sqlite3.Cursor, name: str, investor_type: str = None,
+                         description: str = None, website: str = None,
+                         location: str = None, focus_areas: List[str] = None) -> int:
+        focus_areas_json = json.dumps(focus_areas) if focus_areas else None
+        cursor.execute('''
+            INSERT INTO investors (name, type, description, website, location, focus_areas)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', (name, investor_type, description, website, location, focus_areas_json))
+        return cursor.lastrowid
     
     def get_investor_by_name(self, name: str) -> Optional[Dict]:
         """Get investor by name"""
@@ -101,40 +175,102 @@ class DatabaseOperations:
                            confidence_score: float = 1.0) -> int:
         """Create a new funding event"""
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT INTO funding_events 
-                (company_id, amount, amount_text, currency, funding_stage,
-                 announcement_date, source_url, source_name, title, summary, confidence_score)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (company_id, amount, amount_text, currency, funding_stage,
-                 announcement_date, source_url, source_name, title, summary, confidence_score))
-            return cursor.lastrowid
+            return self._insert_funding_event(
+                conn.cursor(), company_id, amount, amount_text, currency, funding_stage,
+                announcement_date, source_url, source_name, title, summary, confidence_score
+            )
+    
+    @staticmethod
+    def _insert_funding_event(cursor: sqlite3.Cursor, company_id: int, amount: float = None,
+                              amount_text: str = None, currency: str = 'USD',
+                              funding_stage: str = None, announcement_date: str = None,
+                              source_url: str = None, source_name: str = None,
+                              title: str = None, summary: str = None,
+                              confidence_score: float = 1.0) -> int:
+        cursor.execute('''
+            INSERT INTO funding_events 
+            (company_id, amount, amount_text, currency, funding_stage,
+             announcement_date, source_url, source_name, title, summary, confidence_score)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (company_id, amount, amount_text, currency, funding_stage,
+             announcement_date, source_url, source_name, title, summary, confidence_score))
+        return cursor.lastrowid
     
     def add_investor_to_funding(self, funding_event_id: int, investor_id: int,
                                is_lead_investor: bool = False) -> None:
         """Add investor to funding event"""
+        with self.get_connection() as conn:
+            conn.execute(_LINK_INVESTOR_SQL, (funding_event_id, investor_id, is_lead_investor))
+    
+    def save_processed_articles(self, records: List[Dict]) -> List[Optional[int]]:
+        """Store a batch of pipeline results in one transaction and mark their articles processed
+        
+        Each record has 'article_id' and, for funding events, 'company' (create_company kwargs),
+        'event' (create_funding_event kwargs without company_id) and 'investors'
+        (name, is_lead_investor) pairs. Returns the new funding event IDs (None for
+        records without an event).
+        """
+        funding_ids = []
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute('''
-                INSERT OR IGNORE INTO funding_investors 
-                (funding_event_id, investor_id, is_lead_investor)
-                VALUES (?, ?, ?)
-            ''', (funding_event_id, investor_id, is_lead_investor))
+            for record in records:
+                funding_id = None
+                if record.get('event'):
+                    company = record['company']
+                    cursor.execute('SELECT id FROM companies WHERE name = ?', (company['name'],))
+                    row = cursor.fetchone()
+                    company_id = row[0] if row else self._insert_company(cursor, **company)
+                    
+                    funding_id = self._insert_funding_event(cursor, company_id, **record['event'])
+                    
+                    links = []
+                    for name, is_lead in record.get('investors', []):
+                        cursor.execute('SELECT id FROM investors WHERE name = ?', (name,))
+                        row = cursor.fetchone()
+                        investor_id = row[0] if row else self._insert_investor(cursor, name)
+                        links.append((funding_id, investor_id, is_lead))
+                    cursor.executemany(_LINK_INVESTOR_SQL, links)
+                funding_ids.append(funding_id)
+            
+            cursor.executemany('''
+                UPDATE raw_articles 
+                SET processed = 1, processed_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            ''', [(record['article_id'],) for record in records])
+        return funding_ids
     
     # Query Operations
-    def get_recent_funding_events(self, limit: Optional[int] = 20) -> List[Dict]:
-        """Get recent funding events with company and investor details"""
+    def get_recent_funding_events(self, limit: Optional[int] = 20,
+                                  fields: Optional[List[str]] = None) -> List[Dict]:
+        """Get recent funding events with company and investor details
+        
+        fields limits the result to the given keys (funding_events columns, company_name,
+        company_sector, company_location, investors); by default everything is returned.
+        """
         with self.get_connection() as conn:
             cursor = conn.cursor()
             
-            # Build query with optional LIMIT
-            sql = '''
-                SELECT 
+            if fields is None:
+                columns = '''
                     fe.*,
                     c.name as company_name,
                     c.sector as company_sector,
                     c.location as company_location
+                '''
+                with_investors = True
+            else:
+                with_investors = 'investors' in fields
+                selected = [field for field in fields if field != 'investors']
+                if with_investors and 'id' not in selected:
+                    selected.append('id')  # Needed to look up investors
+                for field in selected:
+                    if field not in _COMPANY_FIELDS and not field.isidentifier():
+                        raise ValueError(f"Invalid field name: {field}")
+                columns = ', '.join(_COMPANY_FIELDS.get(field, f'fe.{field}') for field in selected)
+            
+            # Build query with optional LIMIT
+            sql = f'''
+                SELECT {columns}
                 FROM funding_events fe
                 JOIN companies c ON fe.company_id = c.id
                 ORDER BY fe.announcement_date DESC, fe.created_at DESC
@@ -150,6 +286,9 @@ class DatabaseOperations:
             events = []
             for row in cursor.fetchall():
                 event = dict(row)
+                if not with_investors:
+                    events.append(event)
+                    continue
                 
                 # Get investors for this event
                 cursor.execute('''
@@ -171,14 +310,87 @@ class DatabaseOperations:
             
             return events
     
+    def get_funding_events_fingerprint(self) -> Tuple[int, int]:
+        """Cheap change marker for funding events: (row count, highest id)"""
+        with self.get_connection() as conn:
+            # Separate subqueries so SQLite can answer MAX(id) from the rowid b-tree
+            count, max_id = conn.execute(
+                'SELECT (SELECT COUNT(*) FROM funding_events), (SELECT MAX(id) FROM funding_events)'
+            ).fetchone()
+            return count, max_id or 0
+    
+    @staticmethod
+    def _search_filters(query: str = None, sector: str = None,
+                        stage: str = None, min_amount: float = None,
+                        max_amount: float = None, start_date: str = None,
+                        end_date: str = None) -> Tuple[str, List]:
+        """Build the WHERE clause and parameters shared by search and count"""
+        sql = ' WHERE 1=1'
+        params = []
+        
+        if query:
+            sql += ''' AND (
+                c.name LIKE ? OR 
+                fe.title LIKE ? OR 
+                fe.summary LIKE ?
+            )'''
+            query_param = f'%{query}%'
+            params.extend([query_param, query_param, query_param])
+        
+        if sector:
+            sql += ' AND c.sector = ?'
+            params.append(sector)
+        
+        if stage:
+            sql += ' AND fe.funding_stage = ?'
+            params.append(stage)
+        
+        if min_amount is not None:
+            sql += ' AND fe.amount >= ?'
+            params.append(min_amount)
+        
+        if max_amount is not None:
+            sql += ' AND fe.amount <= ?'
+            params.append(max_amount)
+        
+        if start_date:
+            sql += ' AND fe.announcement_date >= ?'
+            params.append(start_date)
+        
+        if end_date:
+            sql += ' AND fe.announcement_date <= ?'
+            params.append(end_date)
+        
+        return sql, params
+    
+    def count_funding_events(self, **filters) -> int:
+        """Get number of funding events, optionally matching search filters"""
+        with self.get_connection() as conn:
+            if not any(value is not None for value in filters.values()):
+                return conn.execute('SELECT COUNT(*) FROM funding_events').fetchone()[0]
+            
+            where, params = self._search_filters(**filters)
+            sql = '''
+                SELECT COUNT(*)
+                FROM funding_events fe
+                JOIN companies c ON fe.company_id = c.id
+            ''' + where
+            return conn.execute(sql, params).fetchone()[0]
+    
     def search_funding_events(self, query: str = None, sector: str = None,
                             stage: str = None, min_amount: float = None,
                             max_amount: float = None, start_date: str = None,
-                            end_date: str = None) -> List[Dict]:
-        """Search funding events with filters"""
+                            end_date: str = None, limit: int = None,
+                            offset: int = 0) -> List[Dict]:
+        """Search funding events with filters, optionally one page at a time"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
             
+            where, params = self._search_filters(
+                query=query, sector=sector, stage=stage,
+                min_amount=min_amount, max_amount=max_amount,
+                start_date=start_date, end_date=end_date
+            )
             sql = '''
                 SELECT DISTINCT
                     fe.*,
@@ -187,45 +399,15 @@ class DatabaseOperations:
                     c.location as company_location
                 FROM funding_events fe
                 JOIN companies c ON fe.company_id = c.id
-                WHERE 1=1
-            '''
-            params = []
-            
-            if query:
-                sql += ''' AND (
-                    c.name LIKE ? OR 
-                    fe.title LIKE ? OR 
-                    fe.summary LIKE ?
-                )'''
-                query_param = f'%{query}%'
-                params.extend([query_param, query_param, query_param])
-            
-            if sector:
-                sql += ' AND c.sector = ?'
-                params.append(sector)
-            
-            if stage:
-                sql += ' AND fe.funding_stage = ?'
-                params.append(stage)
-            
-            if min_amount is not None:
-                sql += ' AND fe.amount >= ?'
-                params.append(min_amount)
-            
-            if max_amount is not None:
-                sql += ' AND fe.amount <= ?'
-                params.append(max_amount)
-            
-            if start_date:
-                sql += ' AND fe.announcement_date >= ?'
-                params.append(start_date)
-            
-            if end_date:
-                sql += ' AND fe.announcement_date <= ?'
-                params.append(end_date)
+            ''' + where
             
             sql += ' ORDER BY fe.announcement_date DESC'
             
+            # Let SQLite stop after one page instead of materializing every match
+            if limit is not None:
+                sql += ' LIMIT ? OFFSET ?'
+                params.extend([limit, offset])
+            
             cursor.execute(sql, params)
             return [dict(row) for row in cursor.fetchall()]
     
@@ -248,6 +430,38 @@ class DatabaseOperations:
             ''')
             return [dict(row) for row in cursor.fetchall()]
     
+    def get_dashboard_summary(self) -> Dict:
+        """Get event count, total funding and most common stage/sector in one query"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT 
+                    c.sector,
+                    fe.funding_stage,
+                    COUNT(*) as event_count,
+                    SUM(fe.amount) as total_amount
+                FROM funding_events fe
+                JOIN companies c ON fe.company_id = c.id
+                GROUP BY c.sector, fe.funding_stage
+            ''')
+            
+            summary = {'total_events': 0, 'total_amount': 0.0, 'top_stage': None, 'top_sector': None}
+            stage_counts = {}
+            sector_counts = {}
+            for sector, stage, event_count, total_amount in cursor.fetchall():
+                summary['total_events'] += event_count
+                summary['total_amount'] += total_amount or 0
+                if stage:
+                    stage_counts[stage] = stage_counts.get(stage, 0) + event_count
+                if sector:
+                    sector_counts[sector] = sector_counts.get(sector, 0) + event_count
+            
+            if stage_counts:
+                summary['top_stage'] = max(stage_counts, key=stage_counts.get)
+            if sector_counts:
+                summary['top_sector'] = max(sector_counts, key=sector_counts.get)
+            return summary
+    
     def get_top_investors(self, limit: Optional[int] = 10) -> List[Dict]:
         """Get top investors by number of investments"""
         with self.get_connection() as conn:
@@ -306,6 +520,14 @@ class DatabaseOperations:
             ''', (limit,))
             return [dict(row) for row in cursor.fetchall()]
     
+    def get_raw_article(self, article_id: int) -> Optional[Dict]:
+        """Get raw article by ID"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT * FROM raw_articles WHERE id = ?', (article_id,))
+            row = cursor.fetchone()
+            return dict(row) if row else None
+    
     def mark_article_processed(self, article_id: int) -> None:
         """Mark article as processed"""
         with self.get_connection() as conn:
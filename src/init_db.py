@@ -13,6 +13,17 @@ def create_database():
     conn = sqlite3.connect(DATABASE_PATH)
     cursor = conn.cursor()
     
+    # Write-ahead logging so the app can read while the pipeline writes
+    cursor.execute('PRAGMA journal_mode = WAL')
+    
+    create_schema(cursor)
+    
+    conn.commit()
+    conn.close()
+    print(f"Database created successfully at: {DATABASE_PATH}")
+
+def create_schema(cursor: sqlite3.Cursor) -> None:
+    """Create any missing tables and indexes"""
     # Companies table
     cursor.execute('''
     CREATE TABLE IF NOT EXISTS companies (
@@ -23,6 +34,7 @@ def create_database():
         sector TEXT,
         location TEXT,
         founded_date TEXT,
+        canonical_name TEXT,  -- Standardized name used for deduplication
         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
         updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
     )
@@ -38,6 +50,7 @@ def create_database():
         website TEXT,
         location TEXT,
         focus_areas TEXT,  -- JSON array of focus areas
+        canonical_name TEXT,  -- Standardized name used for deduplication
         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
         updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
     )
@@ -110,10 +123,13 @@ def create_database():
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_funding_stage ON funding_events(funding_stage)')
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_company_sector ON companies(sector)')
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_raw_articles_processed ON raw_articles(processed)')
-    
-    conn.commit()
-    conn.close()
-    print(f"Database created successfully at: {DATABASE_PATH}")
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_fe_company ON funding_events(company_id)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_fi_investor ON funding_investors(investor_id)')
+    # Covering indexes so the analytics GROUP BY joins never touch the table rows
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_fe_company_amount ON funding_events(company_id, amount)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_fi_investor_lead ON funding_investors(investor_id, is_lead_investor, funding_event_id)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_companies_canonical_name ON companies(canonical_name)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_investors_canonical_name ON investors(canonical_name)')
 
 def insert_default_sectors():
     """Insert default climate tech sectors"""
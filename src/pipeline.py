@@ -16,7 +16,7 @@ from analysis.entity_extractor import EntityExtractor
 from analysis.ai_classifier import AIClassifier
 from src.db_operations import DatabaseOperations
 from ui.source_manager import get_enabled_sources, update_source_stats
-from config import OPENAI_API_KEY
+from config import OPENAI_API_KEY, SCRAPING_CONFIG
 
 # Set up logging
 logging.basicConfig(
@@ -29,6 +29,7 @@ class FundingDataPipeline:
     def __init__(self):
         self.db = DatabaseOperations()
         self.entity_extractor = EntityExtractor()
+        self.batch_size = SCRAPING_CONFIG.get('db_batch_size', 500)
         
         # Initialize scrapers
         self.techcrunch_scraper = TechCrunchScraper()
@@ -45,7 +46,7 @@ class FundingDataPipeline:
         else:
             logger.warning("OpenAI API key not found - AI features disabled")
     
-    def process_article(self, article_data: Dict) -> Optional[Dict]:
+    def process_article(self, article_data: Dict, pending: Optional[List[Dict]] = None) -> Optional[Dict]:
         """Process a single article through the pipeline"""
         try:
             logger.info(f"Processing article: {article_data.get('title', 'Unknown')}")
@@ -63,6 +64,23 @@ class FundingDataPipeline:
                 logger.info("Article already exists in database")
                 return None
             
+        except Exception as e:
+            logger.error(f"Error processing article: {e}")
+            return None
+        
+        return self.process_saved_article(article_id, article_data, pending=pending)
+    
+    def process_saved_article(self, article_id: int, article_data: Dict,
+                              analysis: Optional[Dict] = None,
+                              pending: Optional[List[Dict]] = None,
+                              entities: Optional[Dict] = None) -> Optional[Dict]:
+        """Process an article already stored in raw_articles, optionally with a precomputed AI analysis
+        
+        With a pending list, the DB writes are queued there and flushed in batches
+        (see flush_pending) instead of being committed per article. entities may hold
+        a precomputed extract_all_entities result for the article content.
+        """
+        try:
             # 2. Get full article content if not already available
             if not article_data.get('content'):
                 # Try to get content using TechCrunch scraper for detailed content
@@ -74,24 +92,34 @@ class FundingDataPipeline:
                     return None
             
             # 3. Validate if it's a funding event (using AI if available)
-            is_funding_event = True  # Default assumption
             if self.ai_classifier:
-                validation = self.ai_classifier.validate_funding_event(article_data['content'])
+                text_for_analysis = self._text_for_analysis(article_data)
+                
+                # Cheap gate first, so most non-funding articles never reach the full analysis
+                if analysis is None:
+                    validation = self.ai_classifier.validate_funding_event(text_for_analysis)
+                else:
+                    validation = analysis['validation']
+                
                 is_funding_event = validation.get('is_funding_event', False) and \
                                  validation.get('is_climate_tech', False)
                 
                 if not is_funding_event:
                     logger.info("Article is not a climate tech funding event")
-                    self.db.mark_article_processed(article_id)
+                    self._store({'article_id': article_id}, pending)
                     return None
+                
+                # Classify, extract and summarize with a single call
+                if analysis is None:
+                    analysis = self.ai_classifier.analyze_article(text_for_analysis)
             
             # 4. Extract entities
-            entities = self.entity_extractor.extract_all_entities(article_data['content'])
+            if entities is None:
+                entities = self.entity_extractor.extract_all_entities(article_data['content'])
             
-            # 5. Use AI to extract structured data if available
-            if self.ai_classifier:
-                ai_data = self.ai_classifier.extract_structured_data(article_data['content'])
-                # Merge AI data with regex-extracted data
+            # 5. Merge AI structured data with regex-extracted data
+            if analysis:
+                ai_data = analysis['structured_data']
                 if ai_data.get('company_name') and not entities['companies']:
                     entities['companies'] = [ai_data['company_name']]
                 if ai_data.get('company_description'):
@@ -100,75 +128,49 @@ class FundingDataPipeline:
             # 6. Validate extracted data
             if not entities['companies'] or not entities['funding_amount']:
                 logger.warning("Could not extract essential information (company or amount)")
-                self.db.mark_article_processed(article_id)
+                self._store({'article_id': article_id}, pending)
                 return None
             
             # 7. Get company sector classification
             company_name = entities['companies'][0]  # Use first company found
             sector = 'Other'  # Default
             
-            if self.ai_classifier:
-                # Use content first, fall back to title if content is insufficient
-                text_for_classification = article_data.get('content', '')
-                if not text_for_classification or len(text_for_classification) < 100:
-                    # Use title and any available excerpt if content is too short
-                    text_for_classification = f"{article_data.get('title', '')} {article_data.get('excerpt', '')}"
-                
-                classification = self.ai_classifier.classify_sector(
-                    text_for_classification, 
-                    company_name
-                )
-                sector = classification.get('sector', 'Other')
-                
+            if analysis:
+                sector = analysis['sector'].get('sector', 'Other')
                 logger.info(f"Classified {company_name} as {sector}")
             
-            # 8. Generate summary
+            # 8. Use AI summary if available
             summary = article_data.get('excerpt', '')
-            if self.ai_classifier:
-                summary_data = self.ai_classifier.generate_summary(
-                    article_data['content'],
-                    entities
-                )
-                summary = summary_data.get('summary', summary)
+            if analysis:
+                summary = analysis['summary'].get('summary', summary)
             
-            # 9. Save to database
-            # Create/get company
-            company_id = self.db.get_or_create_company(
-                name=company_name,
-                description=entities.get('company_description'),
-                sector=sector,
-                location=entities.get('location')
-            )
-            
-            # Create funding event
+            # 9. Save company, funding event and investors, and mark article as processed
             funding_amount = entities['funding_amount']
-            funding_id = self.db.create_funding_event(
-                company_id=company_id,
-                amount=funding_amount.get('amount'),
-                amount_text=funding_amount.get('amount_text'),
-                currency=funding_amount.get('currency', 'USD'),
-                funding_stage=entities.get('funding_stage'),
-                announcement_date=article_data.get('date'),
-                source_url=article_data['url'],
-                source_name=article_data.get('source'),
-                title=article_data.get('title'),
-                summary=summary,
-                confidence_score=funding_amount.get('confidence', 0.8)
-            )
-            
-            # Add investors
-            for investor_data in entities.get('investors', []):
-                investor_id = self.db.get_or_create_investor(
-                    name=investor_data['name']
-                )
-                self.db.add_investor_to_funding(
-                    funding_id,
-                    investor_id,
-                    is_lead_investor=(investor_data['role'] == 'lead')
-                )
-            
-            # 10. Mark article as processed
-            self.db.mark_article_processed(article_id)
+            self._store({
+                'article_id': article_id,
+                'company': {
+                    'name': company_name,
+                    'description': entities.get('company_description'),
+                    'sector': sector,
+                    'location': entities.get('location')
+                },
+                'event': {
+                    'amount': funding_amount.get('amount'),
+                    'amount_text': funding_amount.get('amount_text'),
+                    'currency': funding_amount.get('currency', 'USD'),
+                    'funding_stage': entities.get('funding_stage'),
+                    'announcement_date': article_data.get('date'),
+                    'source_url': article_data['url'],
+                    'source_name': article_data.get('source'),
+                    'title': article_data.get('title'),
+                    'summary': summary,
+                    'confidence_score': funding_amount.get('confidence', 0.8)
+                },
+                'investors': [
+                    (investor_data['name'], investor_data['role'] == 'lead')
+                    for investor_data in entities.get('investors', [])
+                ]
+            }, pending)
             
             logger.info(f"Successfully processed funding event: {company_name} - {funding_amount['amount_text']}")
             
@@ -184,6 +186,35 @@ class FundingDataPipeline:
             logger.error(f"Error processing article: {e}")
             return None
     
+    def _store(self, record: Dict, pending: Optional[List[Dict]]) -> None:
+        """Write a processed-article record now, or queue it and flush once the batch is full"""
+        if pending is None:
+            self.db.save_processed_articles([record])
+            return
+        
+        pending.append(record)
+        if len(pending) >= self.batch_size:
+            self.flush_pending(pending)
+    
+    def flush_pending(self, pending: List[Dict]) -> None:
+        """Write queued processed-article records in a single transaction"""
+        if not pending:
+            return
+        try:
+            self.db.save_processed_articles(pending)
+        except Exception as e:
+            # Articles stay unprocessed and are picked up again by process_unprocessed_articles
+            logger.error(f"Error saving {len(pending)} processed articles: {e}")
+        pending.clear()
+    
+    @staticmethod
+    def _text_for_analysis(article_data: Dict) -> str:
+        """Use content first, supplement with title/excerpt if content is insufficient"""
+        text = article_data.get('content') or ''
+        if len(text) < 100:
+            text = f"{article_data.get('title', '')} {article_data.get('excerpt', '')} {text}"
+        return text
+    
     def get_scraper_for_source(self, source_config: Dict):
         """Get the appropriate scraper for a data source"""
         scraper_type = source_config.get('scraper', 'generic')
@@ -320,12 +351,14 @@ class FundingDataPipeline:
         
         logger.info(f"Found {len(articles)} total articles from all sources")
         
-        # 3. Process each article
+        # 3. Process each article, committing results in batches
         results = []
+        pending = []
         for article in articles:
-            result = self.process_article(article)
+            result = self.process_article(article, pending)
             if result:
                 results.append(result)
+        self.flush_pending(pending)
         
         logger.info(f"Successfully processed {len(results)} funding events")
         return results
@@ -335,7 +368,15 @@ class FundingDataPipeline:
         unprocessed = self.db.get_unprocessed_articles(limit=limit)
         logger.info(f"Found {len(unprocessed)} unprocessed articles")
         
+        # Extract entities for all stored article bodies in one batch (uses spaCy NER when installed)
+        with_content = [article for article in unprocessed if article['content']]
+        extracted = self.entity_extractor.extract_all_entities_batch(
+            [article['content'] for article in with_content]
+        )
+        entities_by_id = {article['id']: entities for article, entities in zip(with_content, extracted)}
+        
         results = []
+        pending = []
         for article in unprocessed:
             # Convert database record to article format
             article_data = {
@@ -346,10 +387,66 @@ class FundingDataPipeline:
                 'source': article['source_name']
             }
             
-            result = self.process_article(article_data)
+            # Already in raw_articles, so skip process_article's insert
+            result = self.process_saved_article(article['id'], article_data, pending=pending,
+                                                entities=entities_by_id.get(article['id']))
+            if result:
+                results.append(result)
+        self.flush_pending(pending)
+        
+        return results
+
+    def submit_ai_batch(self, limit: int = 1000) -> Optional[str]:
+        """Submit unprocessed articles to the OpenAI Batch API (for bulk runs of 200+ articles)"""
+        if not self.ai_classifier:
+            logger.warning("AI Classifier not available - cannot submit batch")
+            return None
+        
+        unprocessed = self.db.get_unprocessed_articles(limit=limit)
+        articles = [
+            {'id': article['id'], 'text': self._text_for_analysis(article)}
+            for article in unprocessed if article.get('content')
+        ]
+        if not articles:
+            logger.info("No unprocessed articles with content to submit")
+            return None
+        
+        batch_id = self.ai_classifier.submit_batch(articles)
+        logger.info(f"Submitted {len(articles)} articles as batch {batch_id}")
+        return batch_id
+    
+    def ingest_ai_batch(self, batch_id: str) -> Optional[List[Dict]]:
+        """Store results of a finished batch; returns None while the batch is still running"""
+        if not self.ai_classifier:
+            logger.warning("AI Classifier not available - cannot ingest batch")
+            return None
+        
+        analyses = self.ai_classifier.fetch_batch_results(batch_id)
+        if analyses is None:
+            logger.info(f"Batch {batch_id} is not finished yet")
+            return None
+        
+        results = []
+        pending = []
+        for article_id, analysis in analyses.items():
+            article = self.db.get_raw_article(article_id)
+            if not article or article['processed']:
+                continue
+            
+            article_data = {
+                'url': article['url'],
+                'title': article['title'],
+                'content': article['content'],
+                'date': article['published_date'],
+                'source': article['source_name']
+            }
+            
+            result = self.process_saved_article(article_id, article_data, analysis, pending)
             if result:
                 results.append(result)
+        self.flush_pending(pending)
         
+        logger.info(f"Ingested {len(results)} funding events from batch {batch_id}")
         return results
 
 def main():
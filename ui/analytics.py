@@ -308,29 +308,25 @@ def render_time_series_analysis(events: List[Dict]):
     """Render time-based analysis"""
     st.subheader("📅 Time Series Analysis")
     
-    # Filter events with valid dates
-    dated_events = []
-    for event in events:
-        if event.get('announcement_date'):
-            try:
-                date = datetime.strptime(event['announcement_date'], '%Y-%m-%d')
-                dated_events.append({
-                    'date': date,
-                    'amount': event.get('amount', 0),
-                    'company': event['company_name'],
-                    'sector': event.get('company_sector', 'Unknown')
-                })
-            except ValueError:
-                continue
-    
-    if not dated_events:
+    # Build the frame with explicit dtypes: parsed dates, float amounts and a
+    # categorical sector (a handful of values repeated across every event)
+    raw = pd.DataFrame.from_records(
+        events, columns=['announcement_date', 'amount', 'company_name', 'company_sector']
+    )
+    df = pd.DataFrame({
+        'date': pd.to_datetime(raw['announcement_date'], format='%Y-%m-%d', errors='coerce'),
+        'amount': pd.to_numeric(raw['amount'], errors='coerce'),
+        'company': raw['company_name'],
+        'sector': raw['company_sector'].astype('category')
+    }).dropna(subset=['date'])
+    
+    if df.empty:
         st.info("No date information available for time series analysis")
         return
     
     # Monthly funding trends
     st.write("**📈 Monthly Funding Trends**")
     
-    df = pd.DataFrame(dated_events)
     df['month'] = df['date'].dt.to_period('M')
     
     # Group by month
@@ -370,7 +366,7 @@ def render_time_series_analysis(events: List[Dict]):
     st.write("**🏭 Sector Trends Over Time**")
     
     # Group by month and sector
-    sector_monthly = df.groupby(['month', 'sector']).agg({
+    sector_monthly = df.groupby(['month', 'sector'], observed=True).agg({
         'amount': 'sum',
         'company': 'count'
     }).reset_index()
@@ -378,7 +374,7 @@ def render_time_series_analysis(events: List[Dict]):
     sector_monthly['amount'] = sector_monthly['amount'] / 1_000_000
     
     # Get top 5 sectors for clarity
-    top_sectors = df.groupby('sector')['amount'].sum().nlargest(5).index.tolist()
+    top_sectors = df.groupby('sector', observed=True)['amount'].sum().nlargest(5).index.tolist()
     sector_monthly_filtered = sector_monthly[sector_monthly['sector'].isin(top_sectors)]
     
     if not sector_monthly_filtered.empty:
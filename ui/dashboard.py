@@ -4,6 +4,7 @@ Standalone dashboard component for the Streamlit app
 """
 import streamlit as st
 import pandas as pd
+from collections import Counter
 from datetime import datetime, timedelta
 import plotly.express as px
 import plotly.graph_objects as go
@@ -15,6 +16,16 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from src.db_operations import DatabaseOperations
 
+# Event fields -> column headers for the latest events table
+_RECENT_EVENT_COLUMNS = {
+    'company_name': 'Company',
+    'amount_text': 'Amount',
+    'funding_stage': 'Stage',
+    'company_sector': 'Sector',
+    'announcement_date': 'Date',
+    'company_location': 'Location'
+}
+
 def render_dashboard(db: DatabaseOperations):
     """Render the main dashboard page"""
     st.header("📊 Climate Tech Funding Dashboard")
@@ -96,86 +107,82 @@ def render_dashboard_metrics(events: List[Dict]):
         st.metric("Recent (30d)", f"{recent_count}")
 
 def render_recent_events(events: List[Dict]):
-    """Render recent funding events list"""
+    """Render recent funding events as one selectable table, with details for the chosen row"""
     st.subheader("🕐 Latest Funding Events")
     
-    for i, event in enumerate(events):
-        with st.container():
-            # Event header
-            col1, col2 = st.columns([3, 1])
-            
-            with col1:
-                st.markdown(f"**{event['company_name']}**")
-                if event.get('company_sector'):
-                    st.caption(f"🏭 {event['company_sector']}")
-            
-            with col2:
-                amount_text = event.get('amount_text', 'Undisclosed')
-                st.markdown(f"**{amount_text}**")
-                if event.get('funding_stage'):
-                    st.caption(f"📊 {event['funding_stage']}")
-            
-            # Event details
-            if event.get('summary'):
-                st.write(event['summary'][:150] + "..." if len(event['summary']) > 150 else event['summary'])
-            
-            # Investors
-            if event.get('investors'):
-                investor_names = []
-                for inv in event['investors']:
-                    name = inv['name']
-                    if inv.get('is_lead_investor'):
-                        name += " (Lead)"
-                    investor_names.append(name)
-                
-                st.caption(f"💰 Investors: {', '.join(investor_names)}")
-            
-            # Date and source
-            details = []
-            if event.get('announcement_date'):
-                details.append(f"📅 {event['announcement_date']}")
-            if event.get('company_location'):
-                details.append(f"📍 {event['company_location']}")
-            
-            if details:
-                st.caption(" | ".join(details))
-            
-            # Link to article
-            if event.get('source_url'):
-                st.markdown(f"[📰 Read Article]({event['source_url']})")
-            
-            if i < len(events) - 1:
-                st.divider()
+    df = pd.DataFrame.from_records(events, columns=list(_RECENT_EVENT_COLUMNS)).rename(columns=_RECENT_EVENT_COLUMNS)
+    table = st.dataframe(
+        df,
+        use_container_width=True,
+        hide_index=True,
+        on_select='rerun',
+        selection_mode='single-row',
+        key='recent_events_table'
+    )
+    
+    selected_rows = table.selection.rows
+    if selected_rows:
+        render_event_details(events[selected_rows[0]])
+    else:
+        st.caption("Select a row to see the summary, investors and source article.")
+
+def render_event_details(event: Dict):
+    """Render summary, investors and source for a single funding event"""
+    st.markdown(f"**{event['company_name']}** · {event.get('amount_text') or 'Undisclosed'}")
+    
+    # Event details
+    if event.get('summary'):
+        st.write(event['summary'][:150] + "..." if len(event['summary']) > 150 else event['summary'])
+    
+    # Investors
+    if event.get('investors'):
+        investor_names = []
+        for inv in event['investors']:
+            name = inv['name']
+            if inv.get('is_lead_investor'):
+                name += " (Lead)"
+            investor_names.append(name)
+        
+        st.caption(f"💰 Investors: {', '.join(investor_names)}")
+    
+    # Link to article
+    if event.get('source_url'):
+        st.markdown(f"[📰 Read Article]({event['source_url']})")
 
 def render_quick_stats(events: List[Dict]):
     """Render quick statistics sidebar"""
     st.subheader("📈 Quick Stats")
     
+    # Tally sectors, stages and big deals in a single pass over the events
+    sector_counts = Counter()
+    stage_counts = Counter()
+    big_deals = []
+    for e in events:
+        if e.get('company_sector'):
+            sector_counts[e['company_sector']] += 1
+        if e.get('funding_stage'):
+            stage_counts[e['funding_stage']] += 1
+        if (e.get('amount') or 0) > 50_000_000:
+            big_deals.append(e)
+    
     # Top sectors
-    sectors = [e.get('company_sector') for e in events if e.get('company_sector')]
-    if sectors:
-        sector_counts = pd.Series(sectors).value_counts().head(5)
-        
+    if sector_counts:
         st.write("**Top Sectors:**")
-        for sector, count in sector_counts.items():
+        for sector, count in sector_counts.most_common(5):
             st.write(f"• {sector}: {count}")
     
     st.divider()
     
     # Top funding stages
-    stages = [e.get('funding_stage') for e in events if e.get('funding_stage')]
-    if stages:
-        stage_counts = pd.Series(stages).value_counts().head(5)
-        
+    if stage_counts:
         st.write("**Popular Stages:**")
-        for stage, count in stage_counts.items():
+        for stage, count in stage_counts.most_common(5):
             st.write(f"• {stage}: {count}")
     
     st.divider()
     
     # Recent big deals
-    big_deals = [e for e in events if e.get('amount', 0) > 50_000_000]
-    big_deals.sort(key=lambda x: x.get('amount', 0), reverse=True)
+    big_deals.sort(key=lambda x: x['amount'], reverse=True)
     
     if big_deals:
         st.write("**💰 Big Deals (>$50M):**")
@@ -14,6 +14,30 @@ sys.path.append(str(Path(__file__).parent.parent))
 from src.db_operations import DatabaseOperations
 from config import CLIMATE_TECH_CATEGORIES, FUNDING_STAGES
 
+# Result fields -> column headers for the results table and CSV export
+_TABLE_COLUMNS = {
+    'company_name': 'Company',
+    'amount_text': 'Amount',
+    'funding_stage': 'Stage',
+    'company_sector': 'Sector',
+    'company_location': 'Location',
+    'announcement_date': 'Date'
+}
+
+_EXPORT_COLUMNS = {
+    'company_name': 'Company Name',
+    'amount_text': 'Amount',
+    'amount': 'Amount ($)',
+    'currency': 'Currency',
+    'funding_stage': 'Funding Stage',
+    'company_sector': 'Sector',
+    'company_location': 'Location',
+    'announcement_date': 'Announcement Date',
+    'summary': 'Summary',
+    'source_url': 'Source URL',
+    'source_name': 'Source'
+}
+
 def render_search_page(db: DatabaseOperations):
     """Render the search and filtering page"""
     st.header("🔍 Search & Filter Funding Events")
@@ -365,19 +389,10 @@ def display_detailed_results(results: List[Dict]):
 
 def display_table_results(results: List[Dict]):
     """Display results in table format"""
-    # Create DataFrame
-    table_data = []
-    for result in results:
-        table_data.append({
-            'Company': result['company_name'],
-            'Amount': result.get('amount_text', 'Undisclosed'),
-            'Stage': result.get('funding_stage', 'Unknown'),
-            'Sector': result.get('company_sector', 'Unknown'),
-            'Location': result.get('company_location', 'Unknown'),
-            'Date': result.get('announcement_date', 'Unknown')
-        })
-    
-    df = pd.DataFrame(table_data)
+    # Let pandas pull the columns straight out of the result dicts
+    df = pd.DataFrame.from_records(results, columns=list(_TABLE_COLUMNS)).rename(columns=_TABLE_COLUMNS)
+    df['Amount'] = df['Amount'].fillna('Undisclosed')
+    df[['Stage', 'Sector', 'Location', 'Date']] = df[['Stage', 'Sector', 'Location', 'Date']].fillna('Unknown')
     st.dataframe(df, use_container_width=True, hide_index=True)
 
 def display_card_results(results: List[Dict]):
@@ -417,24 +432,8 @@ def export_results_csv(results: List[Dict]):
         st.warning("No results to export")
         return
     
-    # Create export data
-    export_data = []
-    for result in results:
-        export_data.append({
-            'Company Name': result['company_name'],
-            'Amount': result.get('amount_text', ''),
-            'Amount ($)': result.get('amount', ''),
-            'Currency': result.get('currency', ''),
-            'Funding Stage': result.get('funding_stage', ''),
-            'Sector': result.get('company_sector', ''),
-            'Location': result.get('company_location', ''),
-            'Announcement Date': result.get('announcement_date', ''),
-            'Summary': result.get('summary', ''),
-            'Source URL': result.get('source_url', ''),
-            'Source': result.get('source_name', '')
-        })
-    
-    df = pd.DataFrame(export_data)
+    # Create export data (missing values are written as empty cells)
+    df = pd.DataFrame.from_records(results, columns=list(_EXPORT_COLUMNS)).rename(columns=_EXPORT_COLUMNS)
     csv = df.to_csv(index=False)
     
     st.download_button(
@@ -106,9 +106,6 @@ def validate_source_url(url: str, source_type: str) -> tuple[bool, str]:
 
 def render_source_manager_page(db: DatabaseOperations):
     """Render the data source management page"""
-    # Apply custom styling
-    inject_apple_css()
-    
     # Enhanced header with better styling
     st.markdown("""
         <div style="background: linear-gradient(135deg, rgba(245, 247, 250, 0.9) 0%, rgba(195, 207, 226, 0.9) 100%); 
@@ -733,6 +730,9 @@ def main():
         layout="wide"
     )
     
+    # Apply custom styling (the main app injects it for embedded use)
+    inject_apple_css()
+    
     # Initialize database
     db = DatabaseOperations()
     
@@ -56,9 +56,9 @@ CLIMATE_COLORS = {
     'climate_analytics': '#9370DB'
 }
 
-def inject_apple_css():
-    """Inject comprehensive Apple-style CSS into Streamlit"""
-    css = f"""
+# Built once at import; the interactive block is plain CSS so it is kept out
+# of the f-string to avoid escaping its braces
+_GLOBAL_CSS = f"""
     <style>
     /* Import Inter font for modern look */
     @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
@@ -541,9 +541,131 @@ def inject_apple_css():
         background: #D70015 !important;
     }}
     </style>
-    """
-    
-    st.markdown(css, unsafe_allow_html=True)
+    """ + """
+<style>
+/* Environmental green button styling */
+.stButton > button {
+    background: linear-gradient(135deg, #10B981, #059669) !important;
+    color: white !important;
+    border: none !important;
+    border-radius: 12px !important;
+    padding: 0.5rem 1.5rem !important;
+    font-weight: 600 !important;
+    transition: all 0.3s cubic-bezier(0.25, 0.46, 0.45, 0.94) !important;
+    box-shadow: 0 4px 12px rgba(16, 185, 129, 0.3) !important;
+}
+
+.stButton > button:hover {
+    transform: translateY(-2px) scale(1.02) !important;
+    box-shadow: 0 8px 25px rgba(16, 185, 129, 0.4) !important;
+    background: linear-gradient(135deg, #059669, #10B981) !important;
+}
+
+.stButton > button:active {
+    transform: translateY(0) scale(0.98) !important;
+    transition: all 0.1s ease !important;
+}
+
+/* Link button styling - Environmental theme */
+.stLinkButton > a {
+    background: #10B981 !important;
+    color: white !important;
+    border: none !important;
+    border-radius: 8px !important;
+    padding: 0.4rem 1rem !important;
+    font-weight: 500 !important;
+    text-decoration: none !important;
+    display: inline-flex !important;
+    align-items: center !important;
+    justify-content: center !important;
+    transition: all 0.2s ease !important;
+    font-size: 0.875rem !important;
+    min-width: 90px !important;
+    max-width: 120px !important;
+    text-align: center !important;
+    margin: 0 auto !important;
+}
+
+.stLinkButton > a:hover {
+    background: #059669 !important;
+    transform: translateY(-1px) !important;
+}
+
+/* Center the link button container */
+.stLinkButton {
+    text-align: center !important;
+    display: flex !important;
+    justify-content: center !important;
+}
+
+/* Enhanced input styling - Environmental theme */
+.stSelectbox > div > div, .stTextInput > div > div {
+    border-radius: 12px !important;
+    border: 2px solid rgba(16, 185, 129, 0.2) !important;
+    transition: all 0.3s ease !important;
+}
+
+.stSelectbox > div > div:focus-within, .stTextInput > div > div:focus-within {
+    border-color: #10B981 !important;
+    box-shadow: 0 0 0 3px rgba(16, 185, 129, 0.1) !important;
+}
+
+/* Environmental themed page background */
+.stApp {
+    background: linear-gradient(180deg, #F0FDF4 0%, #ECFDF5 100%) !important;
+}
+
+.main {
+    background: transparent !important;
+}
+
+/* Page loading animation */
+@keyframes fadeInUp {
+    from { opacity: 0; transform: translateY(20px); }
+    to { opacity: 1; transform: translateY(0); }
+}
+
+.main .block-container { animation: fadeInUp 0.6s ease-out; }
+html { scroll-behavior: smooth; }
+
+/* Funding event rows (dashboard and search lists) */
+.event-row {
+    display: flex;
+    gap: 1.5rem;
+    align-items: flex-start;
+    padding: 1rem 0;
+}
+
+.event-row + .event-row { border-top: 1px solid rgba(49, 51, 63, 0.2); }
+.event-main { flex: 3; min-width: 0; }
+.event-funding { flex: 2; }
+.event-action { flex: 1; text-align: right; }
+.event-title, .event-amount { font-size: 1.5rem; font-weight: 600; margin-bottom: 0.5rem; }
+.event-summary { margin-bottom: 0.5rem; }
+.event-tags { font-style: italic; color: #6B7280; }
+
+.event-link, .event-link:visited {
+    display: inline-block;
+    background: linear-gradient(135deg, #10B981, #059669);
+    color: white !important;
+    border-radius: 12px;
+    padding: 0.5rem 1.5rem;
+    font-weight: 600;
+    text-decoration: none !important;
+    box-shadow: 0 4px 12px rgba(16, 185, 129, 0.3);
+}
+
+.event-link.disabled {
+    background: rgba(49, 51, 63, 0.1);
+    color: rgba(49, 51, 63, 0.4) !important;
+    box-shadow: none;
+}
+</style>
+"""
+
+def inject_apple_css():
+    """Inject comprehensive Apple-style CSS into Streamlit"""
+    st.markdown(_GLOBAL_CSS, unsafe_allow_html=True)
 
 def get_sector_color(sector: str) -> str:
     """Get color for a specific climate tech sector"""